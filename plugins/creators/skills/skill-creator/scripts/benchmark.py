@@ -0,0 +1,605 @@
+#!/usr/bin/env python3
+# Recommended: use ./run.sh to execute this script for proper dependency management
+# /// script
+# dependencies = ["pyyaml"]
+# ///
+"""
+Benchmarks for the skill-creator scripts.
+
+Subcommands:
+    lsh         Approximate (MinHash/LSH) vs exact duplicate search: speed and
+                recall, in memory and end to end as one check_duplicates.py
+                call pays it (index load and SKILL.md scan, build, query)
+    all-pairs   All-pairs duplicate audit (prefix-filtering join) wall time
+    yaml        Frontmatter parsers (flat fast path, libyaml, pure Python,
+                simple fallback) on real SKILL.md / command files
+    fences      Code-block stripping and link extraction on pathological
+                Markdown (unterminated fences, long lines of backticks or
+                brackets): time per size, which must grow linearly
+    patterns    Hardcoded-version detection over a batch of Markdown files:
+                one string pattern per re call (legacy), precompiled per
+                detector, and the combined single-scan alternation
+    archive     Packaging wall time on a synthetic skill with an asset bundle:
+                zipfile deflating every member serially (legacy) vs the
+                .skill writer (stored media, threaded deflate)
+
+Usage:
+    python scripts/benchmark.py lsh [--skills 20000] [--queries 200]
+        [--cli-queries 5]
+    python scripts/benchmark.py all-pairs [--skills 20000] [--threshold 0.5]
+    python scripts/benchmark.py yaml [paths...] [--repeat 200]
+    python scripts/benchmark.py fences [--sizes 250000,500000,1000000] [--legacy]
+    python scripts/benchmark.py patterns [paths...] [--repeat 20]
+    python scripts/benchmark.py archive [--assets-mb 64] [--jobs 0]
+"""
+
+import sys
+import random
+import re
+import argparse
+import json
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+from enum import IntEnum
+
+from check_duplicates import (
+    DuplicateIndex,
+    LSHIndex,
+    SkillInfo,
+    cluster_pairs,
+    find_all_pairs,
+    default_search_paths,
+    discover_skills,
+)
+from markdown_sections import scan_sections
+from patterns import VERSION_DETECTORS, find_versions
+from skill_archive import build_manifest, collect_files, resolve_jobs, write_archive
+from skill_document import (
+    HAS_YAML,
+    parse_flat_frontmatter,
+    parse_yaml_simple,
+    read_frontmatter_text,
+)
+from skill_tree import local_link_targets
+
+try:
+    import yaml
+except ImportError:
+    pass
+
+
+class ExitCode(IntEnum):
+    SUCCESS = 0
+    GENERAL_ERROR = 1
+    INVALID_ARGUMENTS = 2
+
+
+def synthetic_catalog(count: int, seed: int = 7) -> list:
+    """Generate skills with Zipf-distributed vocabulary and duplicate families."""
+    rng = random.Random(seed)
+    vocab = [
+        "".join(
+            rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(3, 9))
+        )
+        for _ in range(8000)
+    ]
+    weights = [1 / (rank + 1) for rank in range(len(vocab))]
+
+    def words(n):
+        return rng.choices(vocab, weights=weights, k=n)
+
+    skills = []
+    while len(skills) < count:
+        name = "-".join(words(rng.randint(2, 3)))
+        description = words(rng.randint(15, 40))
+        skills.append((name, description))
+        # Plant a family of near-duplicates for ~10% of base skills
+        if rng.random() < 0.1:
+            for _ in range(rng.randint(1, 3)):
+                variant = list(description)
+                for i in rng.sample(range(len(variant)), k=len(variant) // 5):
+                    variant[i] = rng.choice(vocab)
+                skills.append((name, variant))
+
+    return [
+        SkillInfo(name=name, description=" ".join(desc), path=Path(f"/synthetic/{i}"))
+        for i, (name, desc) in enumerate(skills[:count])
+    ]
+
+
+def bench_lsh(args) -> dict:
+    """Compare exact and approximate duplicate search."""
+    skills = synthetic_catalog(args.skills, args.seed)
+    rng = random.Random(args.seed + 1)
+    queries = rng.sample(skills, min(args.queries, len(skills)))
+
+    start = time.perf_counter()
+    exact_index = DuplicateIndex(skills)
+    exact_build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    lsh_index = LSHIndex(skills)
+    lsh_build = time.perf_counter() - start
+
+    exact_time = lsh_time = 0.0
+    expected = found = 0
+    for query in queries:
+        start = time.perf_counter()
+        exact = exact_index.query(query, args.threshold)
+        exact.sort(key=lambda x: x.total_similarity, reverse=True)
+        exact_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        approx = lsh_index.query(query, args.threshold, top_k=args.top_k)
+        lsh_time += time.perf_counter() - start
+
+        truth = {str(r.skill.path) for r in exact[: args.top_k]}
+        expected += len(truth)
+        found += len(truth & {str(r.skill.path) for r in approx})
+
+    return {
+        "skills": len(skills),
+        "queries": len(queries),
+        "threshold": args.threshold,
+        "top_k": args.top_k,
+        "exact": {
+            "build_s": round(exact_build, 3),
+            "query_ms": round(exact_time / len(queries) * 1000, 3),
+        },
+        "approximate": {
+            "build_s": round(lsh_build, 3),
+            "query_ms": round(lsh_time / len(queries) * 1000, 3),
+        },
+        "recall": round(found / expected, 4) if expected else 1.0,
+        "cli": cli_latency(skills, queries[: args.cli_queries], args),
+    }
+
+
+def cli_latency(skills: list, queries: list, args) -> dict:
+    """
+    Time duplicate checks end to end, as each check_duplicates.py call runs
+    them: discover the catalog through a warm persistent index (load the
+    JSON, stat every SKILL.md), build the exact or LSH index, query it.
+    """
+    if not queries:
+        return {"queries": 0}
+    with tempfile.TemporaryDirectory() as tmp:
+        catalog = Path(tmp) / "skills"
+        for i, skill in enumerate(skills):
+            skill_dir = catalog / str(i)
+            skill_dir.mkdir(parents=True)
+            (skill_dir / "SKILL.md").write_text(
+                f"---\nname: {skill.name}\ndescription: {skill.description}\n---\n"
+            )
+        index_path = Path(tmp) / "skill-index.json"
+        discover_skills([catalog], index_path, signatures=True)
+
+        report = {"queries": len(queries)}
+        for mode, index_type in (("exact", DuplicateIndex), ("approximate", LSHIndex)):
+            load = build = query_time = 0.0
+            for query in queries:
+                start = time.perf_counter()
+                found = discover_skills(
+                    [catalog], index_path, signatures=index_type is LSHIndex
+                )
+                loaded = time.perf_counter()
+                index = index_type(found)
+                built = time.perf_counter()
+                if index_type is LSHIndex:
+                    index.query(query, args.threshold, top_k=args.top_k)
+                else:
+                    index.query(query, args.threshold)
+                load += loaded - start
+                build += built - loaded
+                query_time += time.perf_counter() - built
+
+            def ms(seconds):
+                return round(seconds / len(queries) * 1000, 3)
+
+            report[mode] = {
+                "load_ms": ms(load),
+                "build_ms": ms(build),
+                "query_ms": ms(query_time),
+                "total_ms": ms(load + build + query_time),
+            }
+    return report
+
+
+def bench_all_pairs(args) -> dict:
+    """Time the all-pairs duplicate audit."""
+    skills = synthetic_catalog(args.skills, args.seed)
+
+    start = time.perf_counter()
+    pairs = find_all_pairs(skills, args.threshold)
+    clusters = cluster_pairs(pairs)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "skills": len(skills),
+        "threshold": args.threshold,
+        "pairs": len(pairs),
+        "clusters": len(clusters),
+        "elapsed_s": round(elapsed, 3),
+        "naive_comparisons": len(skills) * (len(skills) - 1) // 2,
+    }
+
+
+def frontmatter_corpus(paths: list) -> list:
+    """Collect frontmatter texts of all Markdown files under paths."""
+    texts = []
+    for base in paths:
+        files = [base] if base.is_file() else sorted(base.rglob("*.md"))
+        for path in files:
+            try:
+                text = read_frontmatter_text(path)
+            except (OSError, UnicodeDecodeError):
+                continue
+            if text is not None:
+                texts.append(text)
+    return texts
+
+
+def bench_yaml(args) -> dict:
+    """Compare frontmatter parsers on real documents."""
+    texts = frontmatter_corpus(args.paths or default_search_paths())
+    if not texts:
+        return {"documents": 0}
+
+    parsers = {"flat": parse_flat_frontmatter, "simple": parse_yaml_simple}
+    if HAS_YAML:
+        parsers["safe"] = lambda text: yaml.load(text, Loader=yaml.SafeLoader)
+        if hasattr(yaml, "CSafeLoader"):
+            parsers["csafe"] = lambda text: yaml.load(text, Loader=yaml.CSafeLoader)
+
+    def reference(text):
+        try:
+            return parsers["safe"](text) if HAS_YAML else None
+        except yaml.YAMLError:
+            return None
+
+    expected = [reference(text) for text in texts]
+    report = {"documents": len(texts), "repeat": args.repeat, "parsers": {}}
+    for label, parse in parsers.items():
+        outputs = []
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            outputs = []
+            for text in texts:
+                try:
+                    outputs.append(parse(text))
+                except Exception:
+                    outputs.append(None)
+        elapsed = time.perf_counter() - start
+
+        handled = [out is not None for out in outputs]
+        report["parsers"][label] = {
+            "us_per_doc": round(elapsed / (args.repeat * len(texts)) * 1e6, 2),
+            "handled": sum(handled),
+            "matches_safe_load": (
+                sum(o == e for o, e, h in zip(outputs, expected, handled) if h)
+                if HAS_YAML
+                else None
+            ),
+        }
+
+    return report
+
+
+# Code-block and link patterns used before the streaming fence tracker
+# (quadratic on the inputs below)
+LEGACY_CODE_BLOCK = re.compile(r"```[^\n]*\n.*?```", re.DOTALL)
+LEGACY_LINK = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+
+
+def pathological_documents(size: int) -> dict:
+    """Generate Markdown documents of about size characters per case."""
+    return {
+        "unterminated_fence": "```\n" + "prose [a](b.md) line\n" * (size // 21),
+        "backtick_line": "```" * (size // 3),
+        "fence_per_line": "```x\n" * (size // 5),
+        "nested_fences": ("````\n```\n~~~\n```\n" * (size // 20)) + "````\n",
+        "open_brackets": "[" * size,
+        "link_openers": "[a](" * (size // 4),
+    }
+
+
+def legacy_scan(content: str) -> int:
+    return len(LEGACY_LINK.findall(LEGACY_CODE_BLOCK.sub("", content)))
+
+
+def current_scan(content: str) -> int:
+    scan_sections.__wrapped__(content)  # Uncached
+    return len(local_link_targets(content))
+
+
+def bench_fences(args) -> dict:
+    """Time fence stripping + link extraction on pathological inputs."""
+    implementations = {"current": current_scan}
+    if args.legacy:
+        implementations["legacy"] = legacy_scan
+
+    report = {"sizes": args.sizes, "cases": {}}
+    for size in args.sizes:
+        for case, content in pathological_documents(size).items():
+            for label, scan in implementations.items():
+                if label == "legacy" and size > args.legacy_max:
+                    continue
+                start = time.perf_counter()
+                scan(content)
+                elapsed = time.perf_counter() - start
+                timings = report["cases"].setdefault(case, {}).setdefault(label, {})
+                timings[str(size)] = round(elapsed * 1000, 2)
+
+    # Time growth per size doubling (~2 for linear, ~4 for quadratic)
+    for case in report["cases"].values():
+        for label, timings in list(case.items()):
+            values = list(timings.values())
+            growth = [round(b / a, 2) for a, b in zip(values, values[1:]) if a > 0]
+            case[label] = {"ms": timings, "growth": growth}
+    return report
+
+
+def markdown_corpus(paths: list) -> list:
+    """Read every Markdown file under paths."""
+    texts = []
+    for base in paths:
+        files = [base] if base.is_file() else sorted(base.rglob("*.md"))
+        for path in files:
+            try:
+                texts.append(path.read_text(encoding="utf-8"))
+            except (OSError, UnicodeDecodeError):
+                continue
+    return texts
+
+
+def legacy_versions(content: str) -> list:
+    """Version detection as before the registry: one re call per detector."""
+    return [
+        (match, label)
+        for _, label, pattern in VERSION_DETECTORS
+        for match in re.findall(pattern, content)
+    ]
+
+
+def bench_patterns(args) -> dict:
+    """Time hardcoded-version detection over a batch of documents."""
+    texts = markdown_corpus(args.paths or default_search_paths())
+    if not texts:
+        return {"documents": 0}
+
+    separate = [(re.compile(pattern), label) for _, label, pattern in VERSION_DETECTORS]
+    implementations = {
+        "legacy": legacy_versions,
+        "precompiled": lambda content: [
+            (match, label)
+            for regex, label in separate
+            for match in regex.findall(content)
+        ],
+        "combined": find_versions,
+    }
+
+    expected = [legacy_versions(text) for text in texts]
+    report = {
+        "documents": len(texts),
+        "characters": sum(len(text) for text in texts),
+        "repeat": args.repeat,
+        "implementations": {},
+    }
+    for label, scan in implementations.items():
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            outputs = [scan(text) for text in texts]
+        elapsed = time.perf_counter() - start
+        report["implementations"][label] = {
+            "ms_per_batch": round(elapsed / args.repeat * 1000, 2),
+            "matches_legacy": outputs == expected,
+        }
+
+    legacy_ms = report["implementations"]["legacy"]["ms_per_batch"]
+    for timing in report["implementations"].values():
+        if timing["ms_per_batch"] > 0:
+            timing["speedup"] = round(legacy_ms / timing["ms_per_batch"], 2)
+    return report
+
+
+def synthetic_skill(root: Path, assets_mb: int, seed: int = 7) -> Path:
+    """
+    Create a skill folder with a SKILL.md, a few references and an asset
+    bundle: half media (random bytes, incompressible), half text data.
+    """
+    rng = random.Random(seed)
+    skill = root / "bench-skill"
+    (skill / "references").mkdir(parents=True)
+    (skill / "assets" / "media").mkdir(parents=True)
+    (skill / "assets" / "data").mkdir(parents=True)
+    (skill / "SKILL.md").write_text("---\nname: bench-skill\n---\n# Bench\n")
+    words = ["skill", "asset", "bundle", "validate", "package", "context", "token"]
+    for index in range(5):
+        text = " ".join(rng.choice(words) for _ in range(20000))
+        (skill / "references" / f"ref{index}.md").write_text(text)
+
+    per_file = 4 << 20
+    files = max(1, (assets_mb << 20) // per_file // 2)
+    for index in range(files):
+        (skill / "assets" / "media" / f"clip{index}.mp4").write_bytes(
+            rng.randbytes(per_file)
+        )
+        rows = (
+            f'{{"id": {i}, "label": "{rng.choice(words)}", '
+            f'"score": {rng.random():.6f}}}'
+            for i in range(per_file // 60)
+        )
+        (skill / "assets" / "data" / f"rows{index}.jsonl").write_text("\n".join(rows))
+    return skill
+
+
+def legacy_archive(skill: Path, output: Path) -> None:
+    """Package as before: every member deflated serially by zipfile."""
+    with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as archive:
+        for file_path in skill.rglob("*"):
+            if file_path.is_file():
+                archive.write(file_path, file_path.relative_to(skill.parent))
+
+
+def bench_archive(args) -> dict:
+    """Time packaging a synthetic skill with each writer."""
+    jobs = resolve_jobs(args.jobs)
+    with tempfile.TemporaryDirectory() as temp:
+        skill = synthetic_skill(Path(temp), args.assets_mb)
+        files = collect_files(skill)
+        writers = {
+            "legacy": lambda output: legacy_archive(skill, output),
+            "serial": lambda output: write_archive(
+                output, files, build_manifest(skill.name, files), jobs=1
+            ),
+            f"threads_{jobs}": lambda output: write_archive(
+                output, files, build_manifest(skill.name, files, jobs=jobs), jobs=jobs
+            ),
+        }
+
+        report = {
+            "files": len(files),
+            "input_mb": round(sum(p.stat().st_size for _, p in files) / 2**20, 1),
+            "writers": {},
+        }
+        for label, write in writers.items():
+            output = Path(temp) / f"{label}.skill"
+            start = time.perf_counter()
+            write(output)
+            elapsed = time.perf_counter() - start
+            report["writers"][label] = {
+                "seconds": round(elapsed, 3),
+                "archive_mb": round(output.stat().st_size / 2**20, 1),
+            }
+
+    legacy = report["writers"]["legacy"]["seconds"]
+    for timing in report["writers"].values():
+        if timing["seconds"] > 0:
+            timing["speedup"] = round(legacy / timing["seconds"], 2)
+    return report
+
+
+def parse_sizes(value: str) -> list:
+    return sorted(int(size) for size in value.split(","))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark skill-creator scripts")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    lsh = subparsers.add_parser("lsh", help="Approximate vs exact duplicate search")
+    lsh.add_argument("--skills", type=int, default=20000, help="Catalog size")
+    lsh.add_argument("--queries", type=int, default=200, help="Number of queries")
+    lsh.add_argument(
+        "--threshold", type=float, default=0.5, help="Similarity threshold"
+    )
+    lsh.add_argument("--top-k", type=int, default=10, help="Results per query")
+    lsh.add_argument("--seed", type=int, default=7, help="Random seed")
+    lsh.add_argument(
+        "--cli-queries",
+        type=int,
+        default=5,
+        help="Queries timed end to end through an on-disk catalog",
+    )
+
+    all_pairs = subparsers.add_parser("all-pairs", help="All-pairs duplicate audit")
+    all_pairs.add_argument("--skills", type=int, default=20000, help="Catalog size")
+    all_pairs.add_argument(
+        "--threshold", type=float, default=0.5, help="Similarity threshold"
+    )
+    all_pairs.add_argument("--seed", type=int, default=7, help="Random seed")
+
+    yaml_bench = subparsers.add_parser("yaml", help="Frontmatter parser speed")
+    yaml_bench.add_argument(
+        "paths",
+        nargs="*",
+        type=Path,
+        help="Files or directories to scan (default: skill search paths)",
+    )
+    yaml_bench.add_argument(
+        "--repeat", type=int, default=200, help="Passes over the corpus"
+    )
+
+    fences = subparsers.add_parser("fences", help="Fence stripping scalability")
+    fences.add_argument(
+        "--sizes",
+        type=parse_sizes,
+        default=[250000, 500000, 1000000, 2000000],
+        help="Comma-separated document sizes in characters",
+    )
+    fences.add_argument(
+        "--legacy",
+        action="store_true",
+        help="Also time the old regex implementation (quadratic)",
+    )
+    fences.add_argument(
+        "--legacy-max",
+        type=int,
+        default=20000,
+        help="Largest size to run the legacy implementation on",
+    )
+
+    patterns_bench = subparsers.add_parser(
+        "patterns", help="Hardcoded-version detection over a batch of files"
+    )
+    patterns_bench.add_argument(
+        "paths",
+        nargs="*",
+        type=Path,
+        help="Files or directories to scan (default: skill search paths)",
+    )
+    patterns_bench.add_argument(
+        "--repeat", type=int, default=20, help="Passes over the corpus"
+    )
+
+    archive_bench = subparsers.add_parser(
+        "archive", help="Packaging wall time with a large asset bundle"
+    )
+    archive_bench.add_argument(
+        "--assets-mb", type=int, default=64, help="Size of the asset bundle (MB)"
+    )
+    archive_bench.add_argument(
+        "--jobs", "-j", type=int, default=0, help="Threads (default: one per CPU)"
+    )
+
+    args = parser.parse_args()
+
+    if args.command == "lsh":
+        if args.skills < 1 or args.queries < 1:
+            print("Error: --skills and --queries must be positive", file=sys.stderr)
+            sys.exit(ExitCode.INVALID_ARGUMENTS)
+        report = bench_lsh(args)
+    elif args.command == "all-pairs":
+        if args.skills < 1 or not 0.0 < args.threshold <= 1.0:
+            print("Error: need --skills > 0 and 0 < --threshold <= 1", file=sys.stderr)
+            sys.exit(ExitCode.INVALID_ARGUMENTS)
+        report = bench_all_pairs(args)
+    elif args.command == "yaml":
+        if args.repeat < 1:
+            print("Error: --repeat must be positive", file=sys.stderr)
+            sys.exit(ExitCode.INVALID_ARGUMENTS)
+        report = bench_yaml(args)
+    elif args.command == "fences":
+        if not args.sizes or args.sizes[0] < 1:
+            print("Error: --sizes must be positive", file=sys.stderr)
+            sys.exit(ExitCode.INVALID_ARGUMENTS)
+        report = bench_fences(args)
+    elif args.command == "patterns":
+        if args.repeat < 1:
+            print("Error: --repeat must be positive", file=sys.stderr)
+            sys.exit(ExitCode.INVALID_ARGUMENTS)
+        report = bench_patterns(args)
+    elif args.command == "archive":
+        if args.assets_mb < 1:
+            print("Error: --assets-mb must be positive", file=sys.stderr)
+            sys.exit(ExitCode.INVALID_ARGUMENTS)
+        report = bench_archive(args)
+
+    print(json.dumps(report, indent=2))
+    sys.exit(ExitCode.SUCCESS)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,24 +10,42 @@ Similarity calculation:
 - Name similarity: 30% weight
 - Description similarity: 70% weight
 - Threshold: 50% (warns if similarity >= 50%)
+
+Candidates are pruned with an inverted token index (only skills sharing a
+token are scored) and a Jaccard upper bound on token-set sizes.
+--all-pairs audits every existing skill against every other with a
+prefix-filtering similarity join and reports clusters of duplicates as JSON.
+
+With --approximate, candidates come from a MinHash/LSH table instead and the
+top-k are confirmed with exact Jaccard similarity. This is lossy: on a
+synthetic 20,000-skill catalog (benchmark.py lsh) its recall of the exact
+top-10 is 1.0 at threshold 0.5 but only ~0.63-0.67 at threshold 0.3. Only the
+query is sub-linear (~7 ms vs ~120 ms exact). Each call still loads the index
+and builds the LSH table from every skill, so one CLI call is not faster end
+to end (~2.5-2.8 s either way at 20,000 skills).
+
+Discovered skills are cached in a persistent index
+(~/.claude/skills/.state/skill-index.json) keyed by SKILL.md path, mtime and
+size, so only new or changed files are re-read and re-parsed.
 """
 
 import sys
-import re
 import argparse
 import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from enum import IntEnum
 
-# Try to import yaml, fallback to simple parser
-try:
-    import yaml
-
-    HAS_YAML = True
-except ImportError:
-    HAS_YAML = False
+from minhash_lsh import LSHTable, minhash_signature
+from patterns import WORD
+from skill_document import read_frontmatter
+from tracing import record_read, span
 
 
 class ExitCode(IntEnum):
@@ -37,6 +55,16 @@ class ExitCode(IntEnum):
     FILE_NOT_FOUND = 3
 
 
+INDEX_PATH = Path.home() / ".claude" / "skills" / ".state" / "skill-index.json"
+INDEX_VERSION = "1.0"
+
+# Minimum files per worker before parsing uses a process pool
+PARALLEL_MIN_FILES = 32
+
+NAME_WEIGHT = 0.3
+DESCRIPTION_WEIGHT = 0.7
+
+
 @dataclass
 class SkillInfo:
     """Information about a skill."""
@@ -44,6 +72,7 @@ class SkillInfo:
     name: str
     description: str
     path: Path
+    signature: Optional[List[int]] = field(default=None, repr=False, compare=False)
 
 
 @dataclass
@@ -65,44 +94,10 @@ class SimilarityResult:
         }
 
 
-def parse_yaml_simple(text: str) -> dict:
-    """Simple YAML parser fallback."""
-    result = {}
-    for line in text.split("\n"):
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-        if ":" in line and not line.startswith(" "):
-            key, value = line.split(":", 1)
-            result[key.strip()] = value.strip().strip("\"'")
-    return result
-
-
-def extract_frontmatter(content: str) -> Optional[dict]:
-    """Extract YAML frontmatter from content."""
-    if not content.startswith("---"):
-        return None
-
-    match = re.match(r"^---\n(.*?)\n---", content, re.DOTALL)
-    if not match:
-        return None
-
-    frontmatter_text = match.group(1)
-
-    try:
-        if HAS_YAML:
-            frontmatter = yaml.safe_load(frontmatter_text)
-        else:
-            frontmatter = parse_yaml_simple(frontmatter_text)
-        return frontmatter if isinstance(frontmatter, dict) else None
-    except Exception:
-        return None
-
-
 def tokenize(text: str) -> set:
     """Tokenize text into words for comparison."""
     # Convert to lowercase and extract words
-    words = re.findall(r"[a-z]+", text.lower())
+    words = WORD.findall(text.lower())
     # Also include hyphenated parts
     parts = text.lower().replace("-", " ").replace("_", " ").split()
     return set(words) | set(parts)
@@ -117,20 +112,36 @@ def jaccard_similarity(set1: set, set2: set) -> float:
     return intersection / union if union > 0 else 0.0
 
 
-def calculate_similarity(skill1: SkillInfo, skill2: SkillInfo) -> SimilarityResult:
-    """Calculate similarity between two skills."""
+def jaccard_upper_bound(size1: int, size2: int) -> float:
+    """Upper bound of Jaccard similarity from set sizes alone."""
+    if not size1 or not size2:
+        return 0.0
+    return min(size1, size2) / max(size1, size2)
+
+
+def token_similarity(
+    name_tokens1: set, desc_tokens1: set, name_tokens2: set, desc_tokens2: set
+) -> Tuple[float, float, float]:
+    """Return (name, description, weighted total) similarity of token sets."""
     # Name similarity (30% weight)
-    name_tokens1 = tokenize(skill1.name)
-    name_tokens2 = tokenize(skill2.name)
     name_sim = jaccard_similarity(name_tokens1, name_tokens2)
 
     # Description similarity (70% weight)
-    desc_tokens1 = tokenize(skill1.description)
-    desc_tokens2 = tokenize(skill2.description)
     desc_sim = jaccard_similarity(desc_tokens1, desc_tokens2)
 
     # Weighted total
-    total_sim = (name_sim * 0.3) + (desc_sim * 0.7)
+    total_sim = (name_sim * NAME_WEIGHT) + (desc_sim * DESCRIPTION_WEIGHT)
+    return name_sim, desc_sim, total_sim
+
+
+def calculate_similarity(skill1: SkillInfo, skill2: SkillInfo) -> SimilarityResult:
+    """Calculate similarity between two skills."""
+    name_sim, desc_sim, total_sim = token_similarity(
+        tokenize(skill1.name),
+        tokenize(skill1.description),
+        tokenize(skill2.name),
+        tokenize(skill2.description),
+    )
 
     return SimilarityResult(
         skill=skill2,
@@ -140,52 +151,487 @@ def calculate_similarity(skill1: SkillInfo, skill2: SkillInfo) -> SimilarityResu
     )
 
 
-def discover_skills(search_paths: List[Path]) -> List[SkillInfo]:
-    """Discover all skills in given paths."""
-    skills = []
+class DuplicateIndex:
+    """Inverted token index over existing skills for candidate pruning."""
+
+    def __init__(self, skills: List[SkillInfo]):
+        self.skills = skills
+        self.name_tokens = [tokenize(skill.name or "") for skill in skills]
+        self.desc_tokens = [tokenize(skill.description or "") for skill in skills]
+        self.postings: Dict[str, List[int]] = {}
+        for skill_id, (name_tokens, desc_tokens) in enumerate(
+            zip(self.name_tokens, self.desc_tokens)
+        ):
+            for token in name_tokens | desc_tokens:
+                self.postings.setdefault(token, []).append(skill_id)
+
+    def candidates(self, tokens: Set[str]) -> Set[int]:
+        """Return IDs of skills sharing at least one token."""
+        ids = set()
+        for token in tokens:
+            ids.update(self.postings.get(token, ()))
+        return ids
+
+    def query(
+        self,
+        skill: SkillInfo,
+        threshold: float,
+        exclude_path: Optional[Path] = None,
+    ) -> List[SimilarityResult]:
+        """Return skills at or above threshold, in index order."""
+        name_tokens = tokenize(skill.name or "")
+        desc_tokens = tokenize(skill.description or "")
+
+        # Skills sharing no token score 0, so they only matter at threshold 0
+        if threshold > 0:
+            skill_ids = sorted(self.candidates(name_tokens | desc_tokens))
+        else:
+            skill_ids = range(len(self.skills))
+
+        excluded = exclude_path.resolve() if exclude_path else None
+        results = []
+        for skill_id in skill_ids:
+            other_name = self.name_tokens[skill_id]
+            other_desc = self.desc_tokens[skill_id]
+
+            # Skip candidates that cannot reach the threshold
+            bound = NAME_WEIGHT * jaccard_upper_bound(
+                len(name_tokens), len(other_name)
+            ) + DESCRIPTION_WEIGHT * jaccard_upper_bound(
+                len(desc_tokens), len(other_desc)
+            )
+            if bound < threshold:
+                continue
 
-    for base_path in search_paths:
-        if not base_path.exists():
-            continue
+            name_sim, desc_sim, total_sim = token_similarity(
+                name_tokens, desc_tokens, other_name, other_desc
+            )
+            if total_sim < threshold:
+                continue
 
-        # Look for SKILL.md files
-        for skill_md in base_path.rglob("SKILL.md"):
-            try:
-                content = skill_md.read_text()
-                frontmatter = extract_frontmatter(content)
-                if frontmatter and "name" in frontmatter:
-                    skills.append(
-                        SkillInfo(
-                            name=frontmatter.get("name", ""),
-                            description=frontmatter.get("description", ""),
-                            path=skill_md.parent,
-                        )
-                    )
-            except Exception:
+            other = self.skills[skill_id]
+            # Skip if this is the same skill being created/updated
+            if excluded and other.path.resolve() == excluded:
                 continue
 
-    return skills
+            results.append(
+                SimilarityResult(
+                    skill=other,
+                    name_similarity=name_sim,
+                    description_similarity=desc_sim,
+                    total_similarity=total_sim,
+                )
+            )
+
+        return results
+
+
+class LSHIndex:
+    """MinHash/LSH index over existing skills for approximate search."""
+
+    # Candidates confirmed per query, as a multiple of top_k
+    CANDIDATE_FACTOR = 10
+
+    def __init__(self, skills: List[SkillInfo]):
+        self.skills = skills
+        self.table = LSHTable()
+        self._tokens: Dict[int, Tuple[set, set]] = {}
+        for skill_id, skill in enumerate(skills):
+            signature = skill.signature or minhash_signature(skill_tokens(skill))
+            self.table.add(skill_id, signature)
+
+    def tokens(self, skill_id: int) -> Tuple[set, set]:
+        """Return cached (name, description) tokens of an indexed skill."""
+        if skill_id not in self._tokens:
+            skill = self.skills[skill_id]
+            self._tokens[skill_id] = (
+                tokenize(skill.name or ""),
+                tokenize(skill.description or ""),
+            )
+        return self._tokens[skill_id]
+
+    def query(
+        self,
+        skill: SkillInfo,
+        threshold: float,
+        exclude_path: Optional[Path] = None,
+        top_k: int = 10,
+    ) -> List[SimilarityResult]:
+        """Return up to top_k LSH candidates confirmed at or above threshold."""
+        name_tokens = tokenize(skill.name or "")
+        desc_tokens = tokenize(skill.description or "")
+        hits = self.table.query(minhash_signature(name_tokens | desc_tokens))
+
+        # Confirm the candidates sharing the most bands first
+        ranked = sorted(hits, key=lambda skill_id: (-hits[skill_id], skill_id))
+        excluded = exclude_path.resolve() if exclude_path else None
+
+        results = []
+        for skill_id in ranked[: top_k * self.CANDIDATE_FACTOR]:
+            other_name, other_desc = self.tokens(skill_id)
+            name_sim, desc_sim, total_sim = token_similarity(
+                name_tokens, desc_tokens, other_name, other_desc
+            )
+            if total_sim < threshold:
+                continue
 
+            other = self.skills[skill_id]
+            if excluded and other.path.resolve() == excluded:
+                continue
 
-def check_duplicates(
-    skill_name: str,
-    skill_description: str,
-    threshold: float = 0.5,
-    exclude_path: Optional[Path] = None,
-) -> List[SimilarityResult]:
+            results.append(
+                SimilarityResult(
+                    skill=other,
+                    name_similarity=name_sim,
+                    description_similarity=desc_sim,
+                    total_similarity=total_sim,
+                )
+            )
+
+        results.sort(key=lambda x: x.total_similarity, reverse=True)
+        return results[:top_k]
+
+
+def prefix_join(token_sets: List[set], threshold: float) -> Iterator[Tuple[int, int]]:
     """
-    Check for duplicate or similar skills.
+    Yield pairs of sets whose Jaccard similarity may reach threshold.
+
+    Prefix-filtering similarity join (PPJoin): tokens are ordered rarest
+    first and sets are processed by increasing size. Two sets with Jaccard >=
+    threshold must share a token within their first
+    `size - ceil(threshold * size) + 1` tokens (the probe prefix). Because
+    indexed sets are never larger than the probing set, indexing only the
+    first `size - ceil(2 * threshold / (1 + threshold) * size) + 1` tokens is
+    enough. Candidates are further dropped by size (`threshold * size`) and by
+    the position of shared prefix tokens, which bounds the overlap the pair
+    can still reach.
+
+    Yields:
+        Candidate (smaller_id, larger_id) pairs (a superset of the true pairs)
+    """
+    frequency: Dict[str, int] = {}
+    for tokens in token_sets:
+        for token in tokens:
+            frequency[token] = frequency.get(token, 0) + 1
+
+    def rarest_first(token):
+        return frequency[token], token
+
+    sizes = [len(tokens) for tokens in token_sets]
+    order = sorted(
+        (i for i in range(len(token_sets)) if sizes[i]), key=sizes.__getitem__
+    )
+    # Slack keeps float rounding from shortening prefixes or dropping pairs
+    slack = 1e-9
+    ratio = threshold / (1 + threshold)
+    postings: Dict[str, List[Tuple[int, int, int]]] = {}
+    for i in order:
+        size = sizes[i]
+        min_size = threshold * size - slack
+        prefix = size - math.ceil(threshold * size - slack) + 1
+        index_prefix = size - math.ceil(2 * ratio * size - slack) + 1
+        # Minimum overlap for Jaccard >= threshold, by the other set's size
+        required = {}
+        overlap: Dict[int, int] = {}
+        for pos, token in enumerate(sorted(token_sets[i], key=rarest_first)[:prefix]):
+            posting = postings.setdefault(token, [])
+            remaining = size - pos
+            for j, other_pos, other_size in posting:
+                count = overlap.get(j, 0)
+                if count < 0 or other_size < min_size:
+                    continue
+                need = required.get(other_size)
+                if need is None:
+                    need = math.ceil(ratio * (size + other_size) - slack)
+                    required[other_size] = need
+                # Drop pairs that can no longer reach the required overlap
+                if count + min(remaining, other_size - other_pos) >= need:
+                    overlap[j] = count + 1
+                else:
+                    overlap[j] = -1
+            if pos < index_prefix:
+                posting.append((i, pos, size))
+
+        for j, count in overlap.items():
+            if count > 0:
+                yield (j, i) if j < i else (i, j)
+
+
+def find_all_pairs(
+    skills: List[SkillInfo], threshold: float = 0.5
+) -> List[Tuple[SkillInfo, SkillInfo, float, float, float]]:
+    """
+    Find every pair of skills at or above threshold without an N^2 loop.
+
+    The weighted total is an average of name and description similarity, so
+    a qualifying pair reaches threshold in at least one of them: candidates
+    come from a name join and a description join, both at threshold. The
+    description similarity must also be at least
+    (threshold - NAME_WEIGHT) / DESCRIPTION_WEIGHT, which is checked from set
+    sizes and the description overlap before the full similarity.
+
+    Returns:
+        (skill_a, skill_b, name_sim, desc_sim, total_sim) sorted by total
+    """
+    if threshold <= 0:
+        raise ValueError("threshold must be greater than 0 for all-pairs search")
+
+    name_tokens = [tokenize(skill.name or "") for skill in skills]
+    desc_tokens = [tokenize(skill.description or "") for skill in skills]
+    desc_threshold = (threshold - NAME_WEIGHT) / DESCRIPTION_WEIGHT
+
+    found = {}
+    for candidates in (
+        prefix_join(desc_tokens, threshold),
+        prefix_join(name_tokens, threshold),
+    ):
+        for i, j in candidates:
+            if (i, j) in found:
+                continue
+            # Cheap description check before the full weighted similarity
+            desc_i, desc_j = desc_tokens[i], desc_tokens[j]
+            size_i, size_j = len(desc_i), len(desc_j)
+            if min(size_i, size_j) < desc_threshold * max(size_i, size_j) - 1e-9:
+                continue
+            common = len(desc_i & desc_j)
+            if common < desc_threshold * (size_i + size_j - common) - 1e-9:
+                continue
+            name_sim, desc_sim, total_sim = token_similarity(
+                name_tokens[i], desc_i, name_tokens[j], desc_j
+            )
+            if total_sim >= threshold:
+                found[(i, j)] = (skills[i], skills[j], name_sim, desc_sim, total_sim)
+
+    pairs = [found[key] for key in sorted(found)]
+    pairs.sort(key=lambda pair: pair[4], reverse=True)
+    return pairs
+
+
+def cluster_pairs(
+    pairs: List[Tuple[SkillInfo, SkillInfo, float, float, float]],
+) -> List[dict]:
+    """Group duplicate pairs into connected clusters (largest first)."""
+    parent: Dict[str, str] = {}
+
+    def find(key):
+        while parent.setdefault(key, key) != key:
+            parent[key] = parent[parent[key]]
+            key = parent[key]
+        return key
+
+    skills: Dict[str, SkillInfo] = {}
+    for skill_a, skill_b, *_ in pairs:
+        key_a, key_b = str(skill_a.path), str(skill_b.path)
+        skills[key_a], skills[key_b] = skill_a, skill_b
+        parent[find(key_a)] = find(key_b)
+
+    clusters: Dict[str, dict] = {}
+    for key in sorted(skills):
+        cluster = clusters.setdefault(find(key), {"skills": [], "pairs": []})
+        cluster["skills"].append({"name": skills[key].name, "path": key})
+
+    for skill_a, skill_b, name_sim, desc_sim, total_sim in pairs:
+        clusters[find(str(skill_a.path))]["pairs"].append(
+            {
+                "a": str(skill_a.path),
+                "b": str(skill_b.path),
+                "name_similarity": round(name_sim * 100, 1),
+                "description_similarity": round(desc_sim * 100, 1),
+                "total_similarity": round(total_sim * 100, 1),
+            }
+        )
+
+    result = [{"size": len(c["skills"]), **c} for c in clusters.values()]
+    result.sort(key=lambda c: (-c["size"], c["skills"][0]["path"]))
+    return result
+
+
+def skill_tokens(skill: SkillInfo) -> set:
+    """Return the combined name and description tokens of a skill."""
+    return tokenize(skill.name or "") | tokenize(skill.description or "")
+
+
+def read_skill_info(skill_md: Path) -> Optional[Tuple[str, str]]:
+    """Read (name, description) from a SKILL.md, or None if it has no name."""
+    frontmatter = read_frontmatter(skill_md)
+    if frontmatter and "name" in frontmatter:
+        return frontmatter.get("name", ""), frontmatter.get("description", "")
+    return None
+
+
+def load_index(path: Path) -> dict:
+    """Load the skill index (graceful fallback on corruption)."""
+    empty = {"version": INDEX_VERSION, "entries": {}}
+    if not path.exists():
+        return empty
+
+    try:
+        index = json.loads(path.read_text())
+        record_read(path)
+    except (OSError, json.JSONDecodeError):
+        return empty
+
+    if not isinstance(index, dict) or index.get("version") != INDEX_VERSION:
+        return empty
+    if not isinstance(index.get("entries"), dict):
+        return empty
+    return index
+
+
+def save_index(path: Path, index: dict) -> None:
+    """Save the skill index atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    index["updated_at"] = datetime.now().isoformat()
+
+    # Write to temp file first (atomic save)
+    temp_path = path.with_suffix(".json.tmp")
+    temp_path.write_text(json.dumps(index, default=str))
+    temp_path.replace(path)
+
+
+def parse_skill_file(path: str) -> Tuple[str, bool, Optional[Tuple[str, str]]]:
+    """Parse one SKILL.md for a worker: (path, readable, (name, description))."""
+    try:
+        return path, True, read_skill_info(Path(path))
+    except Exception:
+        return path, False, None
+
+
+def parse_skill_files(
+    paths: List[str], jobs: Optional[int] = 1
+) -> List[Tuple[str, bool, Optional[Tuple[str, str]]]]:
+    """
+    Parse SKILL.md files, in parallel when worthwhile.
 
     Args:
-        skill_name: Name of the skill to check
-        skill_description: Description of the skill
-        threshold: Similarity threshold (0.0 to 1.0)
-        exclude_path: Path to exclude from comparison (e.g., the skill being created)
+        paths: SKILL.md paths to parse
+        jobs: Worker processes (None or 0 for one per CPU, 1 for serial)
 
     Returns:
-        List of similar skills above threshold
+        parse_skill_file() results in the same order as paths
+    """
+    jobs = jobs or os.cpu_count() or 1
+    jobs = min(jobs, len(paths) // PARALLEL_MIN_FILES)
+    if jobs > 1:
+        chunksize = max(1, len(paths) // (jobs * 4))
+        try:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                return list(executor.map(parse_skill_file, paths, chunksize=chunksize))
+        except (OSError, BrokenProcessPool):
+            pass  # Fall back to serial parsing (e.g. no multiprocessing support)
+
+    return [parse_skill_file(path) for path in paths]
+
+
+def discover_skills(
+    search_paths: List[Path],
+    index_path: Optional[Path] = None,
+    rebuild_index: bool = False,
+    signatures: bool = False,
+    jobs: Optional[int] = 1,
+) -> List[SkillInfo]:
     """
-    # Define search paths
+    Discover all skills in given paths.
+
+    Args:
+        search_paths: Directories to scan recursively for SKILL.md files
+        index_path: Persistent index file; when set, only new or changed
+            SKILL.md files (by mtime and size) are re-read and re-parsed
+        rebuild_index: Ignore the existing index and re-parse every file
+        signatures: Attach MinHash signatures (cached in the index)
+        jobs: Worker processes for parsing (None or 0 for one per CPU)
+
+    Returns:
+        Skills with a `name` in their frontmatter, ordered by search path
+        and then by SKILL.md path
+    """
+    if index_path and not rebuild_index:
+        with span("load index"):
+            index = load_index(index_path)
+    else:
+        index = {"version": INDEX_VERSION, "entries": {}}
+    entries = index["entries"]
+    dirty = rebuild_index
+
+    # Look for SKILL.md files (sorted for deterministic output)
+    found = []
+    stale = {}
+    with span("scan"):
+        for base_path in search_paths:
+            if not base_path.exists():
+                continue
+
+            for skill_md in sorted(base_path.rglob("SKILL.md")):
+                key = str(skill_md)
+                try:
+                    stat = skill_md.stat()
+                except OSError:
+                    continue
+                found.append(key)
+                entry = entries.get(key)
+                if (
+                    entry is None
+                    or entry.get("mtime_ns") != stat.st_mtime_ns
+                    or entry.get("size") != stat.st_size
+                ):
+                    stale[key] = stat
+
+    # Re-read and re-parse only new or changed files
+    unreadable = set()
+    with span("parse", files=len(stale)):
+        parsed = parse_skill_files(list(stale), jobs)
+    for key, readable, info in parsed:
+        if not readable:
+            unreadable.add(key)
+            continue
+        entries[key] = {
+            "mtime_ns": stale[key].st_mtime_ns,
+            "size": stale[key].st_size,
+            "name": info[0] if info else None,
+            "description": info[1] if info else None,
+        }
+        dirty = True
+
+    skills = []
+    seen = set()
+    for key in found:
+        if key in unreadable or key in seen:
+            continue
+        seen.add(key)
+        entry = entries[key]
+        if entry["name"] is not None:
+            skill = SkillInfo(
+                name=entry["name"],
+                description=entry["description"],
+                path=Path(key).parent,
+            )
+            if signatures:
+                if "minhash" not in entry:
+                    entry["minhash"] = minhash_signature(skill_tokens(skill))
+                    dirty = True
+                skill.signature = entry["minhash"]
+            skills.append(skill)
+
+    # Drop entries for deleted files under the paths we just scanned
+    for key in list(entries):
+        if key in seen:
+            continue
+        if any(Path(key).is_relative_to(base) for base in search_paths):
+            del entries[key]
+            dirty = True
+
+    if index_path and dirty:
+        try:
+            with span("save index"):
+                save_index(index_path, index)
+        except OSError:
+            pass
+
+    return skills
+
+
+def default_search_paths() -> List[Path]:
+    """Return the directories searched for existing skills."""
     search_paths = [
         Path.home() / ".claude" / "skills",  # User skills
         Path.home()
@@ -199,8 +645,46 @@ def check_duplicates(
     if project_skills.exists():
         search_paths.append(project_skills)
 
+    return search_paths
+
+
+def check_duplicates(
+    skill_name: str,
+    skill_description: str,
+    threshold: float = 0.5,
+    exclude_path: Optional[Path] = None,
+    index_path: Optional[Path] = INDEX_PATH,
+    rebuild_index: bool = False,
+    approximate: bool = False,
+    top_k: int = 10,
+    jobs: Optional[int] = 1,
+) -> List[SimilarityResult]:
+    """
+    Check for duplicate or similar skills.
+
+    Args:
+        skill_name: Name of the skill to check
+        skill_description: Description of the skill
+        threshold: Similarity threshold (0.0 to 1.0)
+        exclude_path: Path to exclude from comparison (e.g., the skill being created)
+        index_path: Persistent skill index (None to always re-parse)
+        rebuild_index: Discard the persistent index and rebuild it
+        approximate: Use MinHash/LSH candidates instead of the exact scan
+        top_k: Maximum number of results in approximate mode
+        jobs: Worker processes for parsing changed SKILL.md files
+
+    Returns:
+        List of similar skills above threshold
+    """
     # Discover existing skills
-    existing_skills = discover_skills(search_paths)
+    with span("discover"):
+        existing_skills = discover_skills(
+            default_search_paths(),
+            index_path,
+            rebuild_index,
+            signatures=approximate,
+            jobs=jobs,
+        )
 
     # Create skill info for comparison
     new_skill = SkillInfo(
@@ -208,15 +692,14 @@ def check_duplicates(
     )
 
     # Find similar skills
-    similar = []
-    for skill in existing_skills:
-        # Skip if this is the same skill being created/updated
-        if exclude_path and skill.path.resolve() == exclude_path.resolve():
-            continue
-
-        result = calculate_similarity(new_skill, skill)
-        if result.total_similarity >= threshold:
-            similar.append(result)
+    with span("query"):
+        if approximate:
+            return LSHIndex(existing_skills).query(
+                new_skill, threshold, exclude_path, top_k
+            )
+        similar = DuplicateIndex(existing_skills).query(
+            new_skill, threshold, exclude_path
+        )
 
     # Sort by similarity (highest first)
     similar.sort(key=lambda x: x.total_similarity, reverse=True)
@@ -249,8 +732,8 @@ def format_report(similar: List[SimilarityResult], threshold: float) -> str:
 
 def main():
     parser = argparse.ArgumentParser(description="Check for similar existing skills")
-    parser.add_argument("name", help="Skill name to check")
-    parser.add_argument("description", help="Skill description to check")
+    parser.add_argument("name", nargs="?", help="Skill name to check")
+    parser.add_argument("description", nargs="?", help="Skill description to check")
     parser.add_argument(
         "--threshold",
         type=float,
@@ -259,15 +742,83 @@ def main():
     )
     parser.add_argument("--exclude", type=Path, help="Path to exclude from comparison")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument(
+        "--rebuild-index",
+        action="store_true",
+        help=f"Discard and rebuild the skill index ({INDEX_PATH})",
+    )
+    parser.add_argument(
+        "--approximate",
+        action="store_true",
+        help="Use MinHash/LSH candidate search (lossy: recall ~0.65 at "
+        "threshold 0.3; only the query is sub-linear, each call still loads "
+        "and indexes every skill)",
+    )
+    parser.add_argument(
+        "--top-k",
+        type=int,
+        default=10,
+        help="Maximum results in --approximate mode (default: 10)",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=0,
+        help="Worker processes for parsing SKILL.md files (default: 0 = one per CPU)",
+    )
+    parser.add_argument(
+        "--all-pairs",
+        action="store_true",
+        help="Audit all existing skills for duplicate pairs (JSON clusters)",
+    )
 
     args = parser.parse_args()
 
+    if not args.all_pairs and (args.name is None or args.description is None):
+        parser.error("name and description are required unless --all-pairs is set")
+
     if not 0.0 <= args.threshold <= 1.0:
         print("Error: threshold must be between 0.0 and 1.0", file=sys.stderr)
         sys.exit(ExitCode.INVALID_ARGUMENTS)
 
+    if args.jobs < 0:
+        print("Error: --jobs must be 0 or more", file=sys.stderr)
+        sys.exit(ExitCode.INVALID_ARGUMENTS)
+
+    if args.top_k < 1:
+        print("Error: --top-k must be at least 1", file=sys.stderr)
+        sys.exit(ExitCode.INVALID_ARGUMENTS)
+
+    if args.all_pairs:
+        if args.threshold <= 0:
+            print("Error: --all-pairs needs a threshold above 0.0", file=sys.stderr)
+            sys.exit(ExitCode.INVALID_ARGUMENTS)
+
+        skills = discover_skills(
+            default_search_paths(), INDEX_PATH, args.rebuild_index, jobs=args.jobs
+        )
+        pairs = find_all_pairs(skills, args.threshold)
+        clusters = cluster_pairs(pairs)
+        output = {
+            "threshold": args.threshold * 100,
+            "skills_scanned": len(skills),
+            "pair_count": len(pairs),
+            "cluster_count": len(clusters),
+            "clusters": clusters,
+        }
+        print(json.dumps(output, indent=2))
+        sys.exit(ExitCode.SUCCESS)
+
     similar = check_duplicates(
-        args.name, args.description, args.threshold, args.exclude
+        args.name,
+        args.description,
+        args.threshold,
+        args.exclude,
+        rebuild_index=args.rebuild_index,
+        approximate=args.approximate,
+        top_k=args.top_k,
+        jobs=args.jobs,
     )
 
     if args.json:
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+# /// script
+# dependencies = []
+# ///
+"""
+Approximate context cost of a skill.
+
+When a skill triggers, its SKILL.md is loaded into the model context and the
+references it links are read on demand, so their size is paid on every
+invocation. estimate_tokens() approximates a byte-pair tokenizer offline:
+text is split into word pieces (letter runs split at case changes, digit
+groups, punctuation runs, whitespace) and each distinct piece is costed
+once, from its length, and memoized.
+
+    cost = estimate_context(skill_path)
+    problems = Budget(total=20000).violations(cost)
+    report = cost.to_dict()  # files and heaviest sections, ranked
+
+It is an approximation for budgeting, not an exact count; budgets should
+leave some headroom.
+"""
+
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional
+
+from markdown_sections import FenceTracker, atx_heading
+from skill_tree import SkillTree, local_link_targets
+from validation_cache import ValidationCache
+
+# Default budgets (estimated tokens). SKILL.md guidance: body under 5k
+# words; references over 10k words need grep patterns. No total by default
+SKILL_MD_BUDGET = 6500
+REFERENCE_BUDGET = 13000
+HEAVIEST_COUNT = 10
+
+# Word pieces as byte-pair tokenizers split them: a capitalized or lowercase
+# run, an all-caps run, digits, other non-space characters, whitespace
+_PIECE = re.compile(
+    r"[A-Z]?[a-z]+|[A-Z]+(?![a-z])|\d+|[^\sA-Za-z\d]+|\s+",
+)
+
+
+@lru_cache(maxsize=65536)
+def piece_tokens(piece: str) -> int:
+    """Estimated tokens of one word piece."""
+    first = piece[0]
+    if first.isspace():
+        # A single space merges into the next word; other runs (newlines,
+        # indentation) are about one token each
+        return 0 if piece == " " else 1
+    if first.isdigit():
+        return (len(piece) + 2) // 3  # Digits are grouped in threes
+    if first.isascii() and first.isalpha():
+        return 1 if len(piece) <= 7 else (len(piece) + 3) // 4
+    if not piece.isascii():
+        return len(piece)  # Non-ASCII (accents, CJK, emoji): ~1 per char
+    return (len(piece) + 2) // 3  # Punctuation runs (```, **, ](, ...)
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate the token count of text (offline, no tokenizer needed)."""
+    return sum(
+        piece_tokens(piece) * count
+        for piece, count in Counter(_PIECE.findall(text)).items()
+    )
+
+
+@dataclass
+class SectionCost:
+    """Estimated tokens of one heading's section."""
+
+    path: str
+    title: str
+    line: int
+    tokens: int
+
+    def to_dict(self) -> dict:
+        return {
+            "path": self.path,
+            "title": self.title,
+            "line": self.line,
+            "tokens": self.tokens,
+        }
+
+
+@dataclass
+class FileCost:
+    """Estimated tokens of one file loaded into context."""
+
+    path: str
+    tokens: int
+    sections: List[SectionCost] = field(default_factory=list)
+
+
+def section_costs(path: str, content: str) -> List[SectionCost]:
+    """
+    Split a Markdown document at its headings and estimate each part.
+
+    Text before the first heading (frontmatter, title) is reported as
+    "(preamble)". Headings inside fenced code do not split.
+    """
+    sections = []
+    title, start_line, lines = "(preamble)", 1, []
+    tracker = FenceTracker()
+    for number, line in enumerate(content.splitlines(keepends=True), 1):
+        heading = None if tracker.feed(line) else atx_heading(line.rstrip("\n"))
+        if heading is not None:
+            if lines:
+                sections.append(
+                    SectionCost(
+                        path, title, start_line, estimate_tokens("".join(lines))
+                    )
+                )
+            title, start_line, lines = heading or "(untitled)", number, []
+        lines.append(line)
+    if lines:
+        sections.append(
+            SectionCost(path, title, start_line, estimate_tokens("".join(lines)))
+        )
+    return sections
+
+
+@dataclass
+class ContextCost:
+    """SKILL.md and the references it links, with estimated token counts."""
+
+    files: List[FileCost] = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        return sum(f.tokens for f in self.files)
+
+    def heaviest_sections(self, count: int = HEAVIEST_COUNT) -> List[SectionCost]:
+        sections = [s for f in self.files for s in f.sections]
+        return sorted(sections, key=lambda s: -s.tokens)[:count]
+
+    def to_dict(self, top: int = HEAVIEST_COUNT) -> dict:
+        return {
+            "total_tokens": self.total,
+            "files": [
+                {"path": f.path, "tokens": f.tokens}
+                for f in sorted(self.files, key=lambda f: -f.tokens)
+            ],
+            "heaviest_sections": [s.to_dict() for s in self.heaviest_sections(top)],
+        }
+
+    def summary(self) -> str:
+        """One-line description, e.g. "~5,120 tokens (SKILL.md ~4,000 + 2 ...)"."""
+        skill_md = self.files[0].tokens if self.files else 0
+        refs = self.files[1:]
+        text = f"~{self.total:,} tokens (SKILL.md ~{skill_md:,}"
+        if refs:
+            noun = "reference" if len(refs) == 1 else "references"
+            text += f" + {len(refs)} linked {noun} ~{self.total - skill_md:,}"
+        return text + ")"
+
+
+def file_cost(tree: SkillTree, rel: str, cache: Optional[ValidationCache]) -> FileCost:
+    """Estimate the cost of a file of tree (cached by content hash)."""
+    key = None
+    if cache is not None:
+        key = "cost:" + tree.digest(rel, cache)
+        entry = cache.get(key)
+        if entry is not None:
+            sections = [SectionCost(rel, *s) for s in entry["sections"]]
+            return FileCost(rel, entry["tokens"], sections)
+
+    content = tree.read_text(rel)
+    cost = FileCost(rel, estimate_tokens(content), section_costs(rel, content))
+    if key is not None:
+        cache.put(
+            key,
+            {
+                "tokens": cost.tokens,
+                "sections": [[s.title, s.line, s.tokens] for s in cost.sections],
+            },
+        )
+    return cost
+
+
+def estimate_context(
+    skill_path: Path,
+    cache: Optional[ValidationCache] = None,
+    tree: Optional[SkillTree] = None,
+) -> ContextCost:
+    """
+    Estimate the context cost of SKILL.md plus the Markdown files it links
+    to inside the skill (each counted once).
+    """
+    tree = tree or SkillTree(Path(skill_path))
+    cost = ContextCost([file_cost(tree, "SKILL.md", cache)])
+
+    seen = {"SKILL.md"}
+    for _, _, path, _ in local_link_targets(tree.document("SKILL.md").content):
+        rel = tree.normalize(path)
+        if (
+            rel is None
+            or rel in seen
+            or not rel.lower().endswith(".md")
+            or not tree.is_file(rel)
+        ):
+            continue
+        seen.add(rel)
+        cost.files.append(file_cost(tree, rel, cache))
+    return cost
+
+
+@dataclass
+class Budget:
+    """Token budgets (None disables a limit)."""
+
+    skill_md: Optional[int] = SKILL_MD_BUDGET
+    reference: Optional[int] = REFERENCE_BUDGET
+    total: Optional[int] = None
+
+    def violations(self, cost: ContextCost) -> List[str]:
+        """Describe every budget the skill exceeds."""
+        problems = []
+        for index, f in enumerate(cost.files):
+            limit = self.skill_md if index == 0 else self.reference
+            if limit and f.tokens > limit:
+                problems.append(f"{f.path} ~{f.tokens:,} tokens (budget {limit:,})")
+        if self.total and cost.total > self.total:
+            problems.append(f"total ~{cost.total:,} tokens (budget {self.total:,})")
+        return problems
+
+
+def add_budget_arguments(parser) -> None:
+    """Add the --max-*-tokens / --budget-fail options to an argparse parser."""
+    parser.add_argument(
+        "--max-skill-tokens",
+        type=int,
+        default=SKILL_MD_BUDGET,
+        help=f"SKILL.md token budget (default: {SKILL_MD_BUDGET}, 0 disables)",
+    )
+    parser.add_argument(
+        "--max-reference-tokens",
+        type=int,
+        default=REFERENCE_BUDGET,
+        help=f"Budget per linked reference (default: {REFERENCE_BUDGET}, 0 disables)",
+    )
+    parser.add_argument(
+        "--max-total-tokens",
+        type=int,
+        default=0,
+        help="Budget for SKILL.md plus linked references (default: none)",
+    )
+    parser.add_argument(
+        "--budget-fail",
+        action="store_true",
+        help="Fail instead of warning when a token budget is exceeded",
+    )
+
+
+def budget_from_args(args) -> Budget:
+    return Budget(
+        skill_md=args.max_skill_tokens or None,
+        reference=args.max_reference_tokens or None,
+        total=args.max_total_tokens or None,
+    )
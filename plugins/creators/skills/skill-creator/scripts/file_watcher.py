@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# /// script
+# dependencies = []
+# ///
+"""
+Directory watcher for --watch modes.
+
+Uses Linux inotify through ctypes when available (no third-party
+dependency) and falls back to polling file stats elsewhere. Both yield
+batches of changed paths; events arriving within a short settle window are
+coalesced so one editor save (often write + rename + chmod) triggers one
+re-run.
+
+    with open_watcher(skill_dir) as watcher:
+        for changed in watcher.changes():
+            ...
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+# Seconds to wait for more events after the first one of a batch
+SETTLE_SECONDS = 0.05
+POLL_INTERVAL = 0.5
+
+# Editor swap/backup files and caches that never affect validation
+IGNORED_DIRS = {".git", "__pycache__", ".state"}
+IGNORED_SUFFIXES = (".swp", ".swx", ".tmp", "~")
+
+# inotify constants (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = (
+    IN_MODIFY
+    | IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def is_ignored(name: str) -> bool:
+    """Check if a file or directory name should not trigger a re-run."""
+    return (
+        name in IGNORED_DIRS or name.startswith(".#") or name.endswith(IGNORED_SUFFIXES)
+    )
+
+
+def walk_dirs(root: Path) -> Iterator[str]:
+    """Yield root and every non-ignored directory below it."""
+    for dirpath, dirnames, _ in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not is_ignored(d)]
+        yield dirpath
+
+
+class PollingWatcher:
+    """Detect changes by comparing file stats every interval seconds."""
+
+    def __init__(self, root: Path, interval: float = POLL_INTERVAL):
+        self.root = root
+        self.interval = interval
+        self.snapshot = self._scan()
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        state = {}
+        for dirpath in walk_dirs(self.root):
+            try:
+                with os.scandir(dirpath) as entries:
+                    files = [e for e in entries if not is_ignored(e.name)]
+            except OSError:
+                continue  # Deleted or renamed since the walk listed it
+            for entry in files:
+                try:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                state[entry.path] = (stat.st_mtime_ns, stat.st_size)
+        return state
+
+    def changes(self) -> Iterator[Set[Path]]:
+        """Yield sets of added, removed or modified files."""
+        while True:
+            time.sleep(self.interval)
+            current = self._scan()
+            changed = {
+                path
+                for path in current.keys() | self.snapshot.keys()
+                if current.get(path) != self.snapshot.get(path)
+            }
+            self.snapshot = current
+            if changed:
+                yield {Path(path) for path in changed}
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class InotifyWatcher:
+    """Linux inotify watcher (recursive, via ctypes)."""
+
+    def __init__(self, root: Path):
+        libc_name = ctypes.util.find_library("c")
+        if not libc_name:
+            raise OSError("libc not found")
+        self.libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(self.libc, "inotify_init1"):
+            raise OSError("inotify not supported")
+
+        self.root = root
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.dirs: Dict[int, str] = {}
+        try:
+            for dirpath in walk_dirs(root):
+                self._add(dirpath)
+        except OSError:
+            self.close()
+            raise
+
+    def _add(self, dirpath: str) -> None:
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(dirpath), WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed: {dirpath}")
+        self.dirs[wd] = dirpath
+
+    def _read(self, timeout: Optional[float]) -> Set[Path]:
+        """Read pending events (waiting up to timeout) as changed paths."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed = set()
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+            offset += length
+
+            dirpath = self.dirs.get(wd)
+            if dirpath is None or (name and is_ignored(name)):
+                continue
+            path = os.path.join(dirpath, name) if name else dirpath
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                # Watch new subdirectories (and report what they contain)
+                for subdir in walk_dirs(Path(path)):
+                    try:
+                        self._add(subdir)
+                        changed.update(Path(subdir, f) for f in os.listdir(subdir))
+                    except OSError:
+                        pass  # Removed again before we got to it
+            changed.add(Path(path))
+        return changed
+
+    def changes(self) -> Iterator[Set[Path]]:
+        """Yield sets of changed paths, one per settled burst of events."""
+        while True:
+            changed = self._read(None)
+            while changed:
+                more = self._read(SETTLE_SECONDS)
+                if not more:
+                    break
+                changed |= more
+            if changed:
+                yield changed
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_watcher(root: Path, polling: bool = False, interval: float = POLL_INTERVAL):
+    """
+    Watch a directory tree, preferring inotify.
+
+    Args:
+        root: Directory to watch recursively
+        polling: Force the polling watcher
+        interval: Polling interval in seconds
+
+    Returns:
+        InotifyWatcher or PollingWatcher
+    """
+    if not polling:
+        try:
+            return InotifyWatcher(root)
+        except (OSError, AttributeError):
+            pass  # Not Linux, or out of inotify watches
+    return PollingWatcher(root, interval)
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+# /// script
+# dependencies = []
+# ///
+"""
+Single-pass Markdown section scanner.
+
+scan_sections() walks a document once and records every `##`-or-deeper
+heading, skipping fenced code blocks. Each section keeps the text ranges of
+its prose (fences excluded) so list items are counted only for sections a
+check actually asks about. The scoring and validation checks (triggers,
+extension points, WHY / anti-patterns sections) query that map instead of
+re-scanning the full content with one regex each.
+
+Results are memoized by content, so quick_validate's and score_evolution's
+checks on the same SKILL.md share one scan.
+
+heading_anchors() lists the `#fragment` targets a document defines, for
+checking links into it.
+"""
+
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Optional, Pattern, Set, Tuple, Union
+
+from patterns import compiled
+
+# Heading and fence lines. Anchored on a literal newline (the scanned text is
+# prefixed with one) rather than `^` + re.MULTILINE, which the regex engine
+# has to try at every position
+_BLOCK_LINE = re.compile(r"\n[ \t]*(?:###*|````*|~~~~*)[^\n]*")
+_FENCE_LINE = re.compile(r"\n[ \t]*(?:```|~~~)[^\n]*")
+_LIST_ITEM = re.compile(r"\n[ \t]*([-*]|\d+\.)(?=\s)")
+
+# Line-level patterns for heading anchors (CommonMark setext headings)
+_SETEXT_UNDERLINE = re.compile(r" {0,3}(?:=+|-+)[ \t]*")
+_NOT_PARAGRAPH = re.compile(r" {0,3}(?:[-*+>|]|\d+[.)]|$)")
+# Character classes exclude the opening delimiter too, so no match attempt
+# scans past the next one (linear time on long lines of brackets)
+_INLINE_LINK = re.compile(r"!?\[([^\[\]]*)\]\([^()]*\)")
+_HTML_TAG = re.compile(r"<[^>]*>")
+_HTML_ANCHOR = re.compile(r"""<[a-zA-Z][^<>]*?\s(?:id|name)\s*=\s*["']([^"'<>]+)["']""")
+_SLUG_DROP = re.compile(r"[^\w\- ]")
+
+
+class FenceTracker:
+    """
+    Streaming state machine for fenced code blocks (``` and ~~~).
+
+    Feed lines in document order. Only lines starting with a fence marker
+    can change the state, so callers may skip every other line; each call
+    is O(len(line)), which keeps whole-document scans linear even for
+    unterminated fences. A fence is closed by a run of the same character
+    at least as long as the opening one; indented fences (in list items)
+    count as well.
+    """
+
+    def __init__(self):
+        self.fence: Optional[str] = None
+
+    @property
+    def in_code(self) -> bool:
+        return self.fence is not None
+
+    def feed(self, line: str) -> bool:
+        """Advance past line; return True if it is code or a fence delimiter."""
+        token = line.lstrip()
+        if self.fence is not None:
+            if token.startswith(self.fence) and not token.lstrip(self.fence[0]).strip():
+                self.fence = None
+            return True
+
+        mark = token[:1]
+        if mark != "`" and mark != "~":
+            return False
+        run = len(token) - len(token.lstrip(mark))
+        # Backtick fences cannot have backticks in their info string
+        if run < 3 or (mark == "`" and "`" in token[run:]):
+            return False
+        self.fence = token[:run]
+        return True
+
+
+def fenced_blocks(content: str) -> List[Tuple[int, int]]:
+    """
+    Return (start, end) offsets of the fenced code blocks in content.
+
+    Each block spans its fence lines; an unterminated fence runs to the end
+    of the document.
+    """
+    text = "\n" + content
+    tracker = FenceTracker()
+    blocks = []
+    start = 0
+    for match in _FENCE_LINE.finditer(text):
+        was_code = tracker.in_code
+        tracker.feed(match.group())
+        # Offsets in text are one past those in content
+        if not was_code and tracker.in_code:
+            start = match.start()
+        elif was_code and not tracker.in_code:
+            blocks.append((start, match.end() - 1))
+    if tracker.in_code:
+        blocks.append((start, len(content)))
+    return blocks
+
+
+def strip_fenced_code(content: str) -> str:
+    """Return content with its fenced code blocks removed (in linear time)."""
+    parts = []
+    position = 0
+    for start, end in fenced_blocks(content):
+        parts.append(content[position:start])
+        position = end
+    parts.append(content[position:])
+    return "".join(parts)
+
+
+def atx_heading(line: str) -> Optional[str]:
+    """Return the title of an ATX heading line (`## Title ##`), else None."""
+    token = line.lstrip(" ")
+    if len(line) - len(token) > 3 or not token.startswith("#"):
+        return None
+    level = len(token) - len(token.lstrip("#"))
+    rest = token[level:]
+    if level > 6 or (rest and rest[0] not in " \t"):
+        return None
+    title = rest.strip()
+    unclosed = title.rstrip("#")
+    # A closing run of #s must be preceded by whitespace
+    if not unclosed or unclosed[-1] in " \t":
+        title = unclosed.strip()
+    return title
+
+
+@dataclass
+class Section:
+    """A `##`-or-deeper heading of a document."""
+
+    title: str
+    level: int
+    line: int
+    # (start, end) offsets of the body outside fenced code blocks
+    spans: List[Tuple[int, int]] = field(default_factory=list, repr=False)
+
+    @property
+    def key(self) -> str:
+        """Lowercase title with runs of whitespace collapsed."""
+        return " ".join(self.title.lower().split())
+
+
+@dataclass
+class SectionMap:
+    """Headings of a document in order of appearance."""
+
+    text: str = field(repr=False)
+    sections: List[Section] = field(default_factory=list)
+    _items: Dict[int, List[str]] = field(default_factory=dict, repr=False)
+
+    def find(self, pattern: Union[str, Pattern]) -> Optional[Section]:
+        """
+        Return the first section whose whole title matches pattern.
+
+        A string pattern is matched case-insensitively; a compiled one
+        (see patterns.py) with its own flags.
+        """
+        regex = (
+            compiled(pattern, re.IGNORECASE) if isinstance(pattern, str) else pattern
+        )
+        for section in self.sections:
+            if regex.fullmatch(section.key):
+                return section
+        return None
+
+    def has_section(self, *names: str) -> bool:
+        """Check if any heading starts with one of the names (case-insensitive)."""
+        prefixes = tuple(" ".join(name.lower().split()) for name in names)
+        return any(section.key.startswith(prefixes) for section in self.sections)
+
+    def list_items(self, pattern: Union[str, Pattern]) -> List[str]:
+        """
+        Return the list markers (`-`, `*`, `1.`) in the first matching section.
+
+        Returns:
+            One marker per item, or an empty list if no section matches
+        """
+        section = self.find(pattern)
+        if section is None:
+            return []
+        key = id(section)
+        if key not in self._items:
+            self._items[key] = [
+                marker
+                for start, end in section.spans
+                for marker in _LIST_ITEM.findall(self.text, start, end)
+            ]
+        return self._items[key]
+
+
+@lru_cache(maxsize=64)
+def scan_sections(content: str) -> SectionMap:
+    """
+    Build the section map of a Markdown document in one pass.
+
+    Level-1 headings (the document title) do not open sections; their
+    content belongs to the preceding section, if any.
+    """
+    text = "\n" + content + "\n"
+    result = SectionMap(text)
+    current: Optional[Section] = None
+    tracker = FenceTracker()
+    prose_start = 0
+    line, scanned = 0, 0
+
+    for match in _BLOCK_LINE.finditer(text):
+        token = match.group().lstrip()
+        start = match.start() + 1
+        if tracker.in_code or token[0] != "#":
+            was_code = tracker.in_code
+            tracker.feed(token)
+            if was_code and not tracker.in_code:
+                prose_start = match.end()
+            elif not was_code and tracker.in_code and current is not None:
+                current.spans.append((prose_start, start))
+            continue
+
+        if current is not None:
+            current.spans.append((prose_start, start))
+        line += text.count("\n", scanned, start)
+        scanned = start
+        run = len(token) - len(token.lstrip("#"))
+        current = Section(token[run:].strip().rstrip("#").strip(), run, line)
+        result.sections.append(current)
+        prose_start = match.end()
+
+    if current is not None and not tracker.in_code:
+        current.spans.append((prose_start, len(text)))
+
+    return result
+
+
+def github_slug(title: str) -> str:
+    """Return the anchor GitHub generates for a heading title."""
+    text = _HTML_TAG.sub("", _INLINE_LINK.sub(r"\1", title))
+    return _SLUG_DROP.sub("", text.strip().lower()).replace(" ", "-")
+
+
+def heading_anchors(content: str) -> Set[str]:
+    """
+    Return the fragment identifiers a rendered document defines.
+
+    Covers GitHub-style slugs of every ATX and setext heading outside
+    fenced code (repeated slugs get -1, -2, ... suffixes) and explicit
+    `id`/`name` attributes of inline HTML tags.
+    """
+    anchors = {anchor.lower() for anchor in _HTML_ANCHOR.findall(content)}
+    seen: Dict[str, int] = {}
+    tracker = FenceTracker()
+    previous = ""  # Last paragraph line (setext heading candidate)
+
+    for line in content.splitlines():
+        if tracker.feed(line):
+            previous = ""
+            continue
+
+        title = atx_heading(line)
+        if title is None and previous and _SETEXT_UNDERLINE.fullmatch(line):
+            title = previous
+
+        if title is not None:
+            slug = github_slug(title)
+            if slug:
+                count = seen.get(slug, 0)
+                seen[slug] = count + 1
+                anchors.add(f"{slug}-{count}" if count else slug)
+            previous = ""
+        elif not _NOT_PARAGRAPH.match(line):
+            previous = line.strip()
+        else:
+            previous = ""
+
+    return anchors
@@ -8,29 +8,80 @@ Skill Packager - Creates a distributable .skill file of a skill folder
 
 Includes:
 - Validation check
+- Context cost estimate of SKILL.md and linked references (token budgets)
 - Evolution score calculation (warning if below 7)
 - Duplicate skill detection
 - User confirmation for low scores
+- Reproducible archive with an embedded manifest of file hashes; when the
+  manifest matches the existing .skill file, nothing is rebuilt
+- Already-compressed assets (images, video, archives) stored as is, other
+  files deflated in parallel threads
+- Release builds of every skill listed in .claude-plugin/marketplace.json
+  (--all): existing skills are discovered once for duplicate detection, and
+  parsed documents and check results are shared by all skills, which are
+  packaged concurrently without prompts. A summary table with per-phase
+  timings is printed at the end.
+- Profiling (--profile FILE or SKILL_CREATOR_TRACE=FILE): a JSON trace of
+  the wall and CPU time, bytes read and files touched of every phase and
+  subphase, optionally also as a Chrome trace-event file (see tracing.py)
 
 Usage:
     python scripts/package_skill.py <path/to/skill-folder> [output-directory]
+        [--max-skill-tokens N] [--max-reference-tokens N] [--max-total-tokens N]
+        [--budget-fail] [--rebuild] [--compression-level 0-9] [--jobs N]
+        [--profile FILE] [--chrome-trace FILE]
+    python scripts/package_skill.py --all <marketplace-root> [output-directory]
+        [--no-cache] [...]
 
 Example:
     python scripts/package_skill.py skills/public/my-skill
     python scripts/package_skill.py skills/public/my-skill ./dist
+    python scripts/package_skill.py --all . ./dist
+    python scripts/package_skill.py --all . ./dist --profile trace.json
 """
 
 import sys
-import re
-import zipfile
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Dict, Iterator, List, Optional
 from enum import IntEnum
 
+from context_cost import Budget, add_budget_arguments, budget_from_args
+from skill_archive import (
+    COMPRESSION_LEVEL,
+    archive_up_to_date,
+    build_manifest,
+    collect_files,
+    resolve_jobs,
+    write_archive,
+)
+from skill_document import load_document
+from tracing import (
+    add_trace_arguments,
+    bind,
+    finish_from_args,
+    record_read,
+    span,
+    start_from_args,
+)
+from validation_cache import ValidationCache
+
 # Import from sibling modules
 try:
-    from quick_validate import validate_skill
+    from quick_validate import open_cache, validate_skill
     from score_evolution import calculate_evolution_score
-    from check_duplicates import check_duplicates
+    from check_duplicates import (
+        INDEX_PATH,
+        DuplicateIndex,
+        SkillInfo,
+        check_duplicates,
+        default_search_paths,
+        discover_skills,
+    )
 except ImportError:
     # Fallback for direct execution
     import importlib.util
@@ -45,6 +96,7 @@ except ImportError:
 
     quick_validate = load_module("quick_validate")
     validate_skill = quick_validate.validate_skill
+    open_cache = quick_validate.open_cache
     ValidationResult = quick_validate.ValidationResult
 
     score_evolution = load_module("score_evolution")
@@ -52,6 +104,11 @@ except ImportError:
 
     check_duplicates_module = load_module("check_duplicates")
     check_duplicates = check_duplicates_module.check_duplicates
+    INDEX_PATH = check_duplicates_module.INDEX_PATH
+    DuplicateIndex = check_duplicates_module.DuplicateIndex
+    SkillInfo = check_duplicates_module.SkillInfo
+    default_search_paths = check_duplicates_module.default_search_paths
+    discover_skills = check_duplicates_module.discover_skills
 
 
 class ExitCode(IntEnum):
@@ -61,23 +118,41 @@ class ExitCode(IntEnum):
     USER_CANCELLED = 20
 
 
-def extract_frontmatter(content: str) -> dict:
-    """Extract YAML frontmatter from content."""
-    if not content.startswith("---"):
-        return {}
+MARKETPLACE_FILE = Path(".claude-plugin") / "marketplace.json"
+
+# Phases of packaging one skill, in order (columns of the --all summary)
+PHASES = ("hash", "validate", "duplicates", "score", "archive")
+
+
+@dataclass
+class PackageReport:
+    """Outcome of packaging one skill of a batch."""
+
+    skill: str
+    path: Path
+    status: str = "error"  # packaged, up to date, invalid or error
+    output: Optional[Path] = None
+    files: int = 0
+    evolution_score: Optional[int] = None
+    context_tokens: Optional[int] = None
+    similar: int = 0
+    errors: List[str] = field(default_factory=list)
+    timings: Dict[str, float] = field(default_factory=dict)  # phase -> seconds
 
-    match = re.match(r"^---\n(.*?)\n---", content, re.DOTALL)
-    if not match:
-        return {}
+    @property
+    def ok(self) -> bool:
+        return self.status in ("packaged", "up to date")
 
-    # Simple parsing
-    result = {}
-    for line in match.group(1).split("\n"):
-        if ":" in line and not line.startswith(" "):
-            key, value = line.split(":", 1)
-            result[key.strip()] = value.strip().strip("\"'")
 
-    return result
+@contextmanager
+def timed(timings: Dict[str, float], phase: str) -> Iterator[None]:
+    """Add the wall time of the block to timings[phase] (seconds), and trace it."""
+    start = time.perf_counter()
+    try:
+        with span(phase):
+            yield
+    finally:
+        timings[phase] = timings.get(phase, 0.0) + time.perf_counter() - start
 
 
 def prompt_continue(message: str) -> bool:
@@ -89,7 +164,16 @@ def prompt_continue(message: str) -> bool:
         return False
 
 
-def package_skill(skill_path, output_dir=None, force=False):
+def package_skill(
+    skill_path,
+    output_dir=None,
+    force=False,
+    budget=None,
+    budget_fail=False,
+    rebuild=False,
+    compression_level=COMPRESSION_LEVEL,
+    jobs=0,
+):
     """
     Package a skill folder into a .skill file.
 
@@ -97,9 +181,14 @@ def package_skill(skill_path, output_dir=None, force=False):
         skill_path: Path to the skill folder
         output_dir: Optional output directory for the .skill file
         force: Skip confirmation prompts
+        budget: Token budgets (default: Budget())
+        budget_fail: Refuse to package a skill over a token budget
+        rebuild: Package even if the existing .skill file is up to date
+        compression_level: Deflate level, 0 (store) to 9
+        jobs: Hashing and compression threads (0 for one per CPU)
 
     Returns:
-        Path to the created .skill file, or None if error/cancelled
+        Path to the created (or reused) .skill file, or None if error/cancelled
     """
     skill_path = Path(skill_path).resolve()
 
@@ -118,15 +207,37 @@ def package_skill(skill_path, output_dir=None, force=False):
         print(f"❌ Error: SKILL.md not found in {skill_path}")
         return None
 
-    # Read skill content
-    content = skill_md.read_text()
-    frontmatter = extract_frontmatter(content)
+    # Determine output location
+    if output_dir:
+        output_path = Path(output_dir).resolve()
+    else:
+        output_path = Path.cwd()
+
+    skill_filename = output_path / f"{skill_path.name}.skill"
+
+    # Hash the files to package; an archive with the same manifest is reused
+    with span("hash"):
+        files = collect_files(skill_path, exclude=skill_filename)
+        manifest = build_manifest(skill_path.name, files, compression_level, jobs)
+        up_to_date = not rebuild and archive_up_to_date(skill_filename, manifest)
+    if up_to_date:
+        print(f"✅ Package up to date: {skill_filename}")
+        print(f"   Content digest: sha256:{manifest['digest'][:16]}")
+        print("   (contents unchanged since the last build; use --rebuild to force)")
+        return skill_filename
+
+    # Read skill content (parsed once, reused by validation and scoring)
+    document = load_document(skill_md)
+    frontmatter = document.frontmatter or {}
     skill_name = frontmatter.get("name", skill_path.name)
     skill_description = frontmatter.get("description", "")
 
     # Run validation
     print("🔍 Validating skill...")
-    result = validate_skill(skill_path)
+    with span("validate"):
+        result = validate_skill(
+            skill_path, budget=budget or Budget(), budget_fail=budget_fail, context=True
+        )
 
     if not result.is_valid:
         print("\n❌ Validation failed:")
@@ -137,11 +248,22 @@ def package_skill(skill_path, output_dir=None, force=False):
 
     print(f"✅ Validation passed ({result.summary})")
 
+    # Report the context cost (budget overruns were warned about above)
+    cost = result.context
+    over_budget = [w for w in result.warnings if "context_budget:" in w]
+    status = "⚠️ " if over_budget else "✅"
+    print(f"\n{status} Context cost: ~{cost['total_tokens']:,} estimated tokens")
+    for f in cost["files"][:5]:
+        print(f"   {f['tokens']:>7,}  {f['path']}")
+    for warning in over_budget:
+        print(f"   {warning}")
+
     # Check for similar skills
     print("\n🔍 Checking for similar skills...")
-    similar = check_duplicates(
-        skill_name, skill_description, threshold=0.5, exclude_path=skill_path
-    )
+    with span("duplicates"):
+        similar = check_duplicates(
+            skill_name, skill_description, threshold=0.5, exclude_path=skill_path
+        )
 
     if similar:
         print(f"\n⚠️  Found {len(similar)} similar skill(s):")
@@ -158,7 +280,8 @@ def package_skill(skill_path, output_dir=None, force=False):
 
     # Calculate evolution score
     print("\n🔍 Calculating evolution score...")
-    evo_score = calculate_evolution_score(content)
+    with span("score"):
+        evo_score = calculate_evolution_score(document.content)
 
     if evo_score.meets_threshold:
         print(f"✅ Evolution score: {evo_score.total}/10 (meets threshold)")
@@ -181,43 +304,25 @@ def package_skill(skill_path, output_dir=None, force=False):
                 print("\n❌ Packaging cancelled by user.")
                 return None
 
-    # Determine output location
-    if output_dir:
-        output_path = Path(output_dir).resolve()
-        output_path.mkdir(parents=True, exist_ok=True)
-    else:
-        output_path = Path.cwd()
-
-    skill_filename = output_path / f"{skill_path.name}.skill"
-
     # Create the .skill file (zip format)
     print(f"\n📦 Creating package...")
     try:
-        with zipfile.ZipFile(skill_filename, "w", zipfile.ZIP_DEFLATED) as zipf:
-            # Walk through the skill directory
-            file_count = 0
-            for file_path in skill_path.rglob("*"):
-                if file_path.is_file():
-                    # Skip hidden files and __pycache__
-                    if any(
-                        part.startswith(".") or part == "__pycache__"
-                        for part in file_path.parts
-                    ):
-                        continue
-                    # Calculate the relative path within the zip
-                    arcname = file_path.relative_to(skill_path.parent)
-                    zipf.write(file_path, arcname)
-                    file_count += 1
-                    print(f"   Added: {arcname}")
-
-        print(f"\n✅ Successfully packaged {file_count} files to: {skill_filename}")
+        with span("archive"):
+            output_path.mkdir(parents=True, exist_ok=True)
+            write_archive(skill_filename, files, manifest, jobs)
+        for arcname, _ in files:
+            print(f"   Added: {arcname}")
+
+        print(f"\n✅ Successfully packaged {len(files)} files to: {skill_filename}")
 
         # Print summary
         print(f"\n📋 Summary:")
         print(f"   Skill: {skill_name}")
         print(f"   Validation: {result.summary}")
         print(f"   Evolution score: {evo_score.total}/10")
+        print(f"   Context cost: ~{cost['total_tokens']:,} tokens")
         print(f"   Similar skills: {len(similar)} found")
+        print(f"   Content digest: sha256:{manifest['digest'][:16]}")
         print(f"   Output: {skill_filename}")
 
         return skill_filename
@@ -227,33 +332,360 @@ def package_skill(skill_path, output_dir=None, force=False):
         return None
 
 
+def marketplace_skills(path) -> List[Path]:
+    """
+    List the skill folders of the local plugins of a marketplace.
+
+    Args:
+        path: Marketplace root (containing .claude-plugin/marketplace.json)
+            or the marketplace.json file itself
+
+    Returns:
+        Folders with a SKILL.md under each plugin's skills/ directory, in
+        marketplace order; plugins with a remote source are skipped
+
+    Raises:
+        OSError: marketplace.json cannot be read
+        ValueError: marketplace.json is not valid JSON
+    """
+    path = Path(path).resolve()
+    manifest = path / MARKETPLACE_FILE if path.is_dir() else path
+    # Plugin sources are relative to the marketplace root
+    root = manifest.parent
+    if root.name == MARKETPLACE_FILE.parent.name:
+        root = root.parent
+
+    marketplace = json.loads(manifest.read_text(encoding="utf-8"))
+    record_read(manifest)
+    skills = []
+    for plugin in marketplace.get("plugins", []):
+        source = plugin.get("source")
+        if not isinstance(source, str):
+            continue  # github/url sources are not part of this tree
+        skills_dir = (root / source / "skills").resolve()
+        skills.extend(p.parent for p in sorted(skills_dir.glob("*/SKILL.md")))
+    return list(dict.fromkeys(skills))
+
+
+def build_package(
+    skill_path: Path,
+    output_path: Path,
+    index: DuplicateIndex,
+    cache: Optional[ValidationCache] = None,
+    budget: Optional[Budget] = None,
+    budget_fail: bool = False,
+    rebuild: bool = False,
+    compression_level: int = COMPRESSION_LEVEL,
+) -> PackageReport:
+    """
+    Package one skill of a batch, without output or prompts.
+
+    Similar skills and low evolution scores are reported rather than
+    confirmed; only validation errors stop the build. Hashing and
+    compression run in the calling thread, as batches are parallel across
+    skills.
+
+    Args:
+        skill_path: Skill folder (resolved)
+        output_path: Directory of the .skill file
+        index: Existing skills, for duplicate detection
+        cache: Result cache shared by the batch (the caller saves it)
+        budget: Token budgets (default: Budget())
+        budget_fail: Refuse to package a skill over a token budget
+        rebuild: Package even if the existing .skill file is up to date
+        compression_level: Deflate level, 0 (store) to 9
+    """
+    report = PackageReport(skill=skill_path.name, path=skill_path)
+    timings = report.timings
+    skill_filename = output_path / f"{skill_path.name}.skill"
+    with span("skill", skill=skill_path.name):
+        try:
+            with timed(timings, "hash"):
+                files = collect_files(skill_path, exclude=skill_filename)
+                manifest = build_manifest(skill_path.name, files, compression_level, 1)
+                up_to_date = not rebuild and archive_up_to_date(
+                    skill_filename, manifest
+                )
+            report.files = len(files)
+            if up_to_date:
+                report.status = "up to date"
+                report.output = skill_filename
+                return report
+
+            with timed(timings, "validate"):
+                result = validate_skill(
+                    skill_path,
+                    cache=cache,
+                    budget=budget or Budget(),
+                    budget_fail=budget_fail,
+                    context=True,
+                )
+            if not result.is_valid:
+                report.status = "invalid"
+                report.errors = result.errors
+                return report
+            report.context_tokens = result.context["total_tokens"]
+
+            document = load_document(skill_path / "SKILL.md")
+            frontmatter = document.frontmatter or {}
+            with timed(timings, "duplicates"):
+                skill = SkillInfo(
+                    name=frontmatter.get("name", skill_path.name),
+                    description=frontmatter.get("description", ""),
+                    path=Path("."),
+                )
+                similar = index.query(skill, threshold=0.5, exclude_path=skill_path)
+            report.similar = len(similar)
+
+            with timed(timings, "score"):
+                report.evolution_score = calculate_evolution_score(
+                    document.content
+                ).total
+
+            with timed(timings, "archive"):
+                write_archive(skill_filename, files, manifest, 1)
+            report.status = "packaged"
+            report.output = skill_filename
+        except Exception as e:  # One broken skill must not abort the batch
+            report.status = "error"
+            report.errors.append(f"{type(e).__name__}: {e}")
+    return report
+
+
+def package_all(
+    skill_paths: List[Path],
+    output_dir=None,
+    jobs: Optional[int] = 0,
+    cache: Optional[ValidationCache] = None,
+    timings: Optional[Dict[str, float]] = None,
+    **options,
+) -> List[PackageReport]:
+    """
+    Package many skills concurrently, sharing state between them.
+
+    Existing skills are discovered once and matched through one
+    DuplicateIndex; parsed documents (skill_document) and check results
+    (cache) are shared by all threads.
+
+    Args:
+        skill_paths: Skill folders
+        output_dir: Optional output directory for the .skill files
+        jobs: Skills packaged at a time (None or 0 for one per CPU)
+        cache: Result cache (the caller saves it)
+        timings: Receives the time of the shared setup ("duplicate index")
+        options: Passed on to build_package() (budget, budget_fail,
+            rebuild, compression_level)
+
+    Returns:
+        One report per skill, in skill_paths order
+    """
+    output_path = Path(output_dir).resolve() if output_dir else Path.cwd()
+    output_path.mkdir(parents=True, exist_ok=True)
+    with timed(timings if timings is not None else {}, "duplicate index"):
+        index = DuplicateIndex(discover_skills(default_search_paths(), INDEX_PATH))
+
+    # Skills of different plugins may share a folder name, and so an archive
+    owners: Dict[str, Path] = {}
+    reports: Dict[Path, PackageReport] = {}
+    for path in skill_paths:
+        owner = owners.setdefault(path.name, path)
+        if owner != path:
+            report = PackageReport(skill=path.name, path=path)
+            report.errors.append(f"{path.name}.skill is already built from {owner}")
+            reports[path] = report
+
+    pending = [path for path in skill_paths if path not in reports]
+    with ThreadPoolExecutor(max_workers=resolve_jobs(jobs)) as executor:
+        built = executor.map(
+            bind(
+                lambda path: build_package(path, output_path, index, cache, **options)
+            ),
+            pending,
+        )
+        reports.update(zip(pending, built))
+    return [reports[path] for path in skill_paths]
+
+
+def format_summary(
+    reports: List[PackageReport], timings: Dict[str, float], elapsed: float
+) -> str:
+    """Summary table of a batch, with per-phase times in milliseconds."""
+    header = (
+        f"{'Skill':<24} {'Status':<10} {'Files':>5} {'Score':>5} {'Similar':>7} "
+        f"{'Tokens':>8}" + "".join(f" {phase:>10}" for phase in PHASES) + " "
+        f"{'total':>10}"
+    )
+    rule = "-" * len(header)
+    lines = ["📋 Summary (times in ms):", header, rule]
+
+    totals = dict.fromkeys(PHASES, 0.0)
+    for report in reports:
+        score = "-" if report.evolution_score is None else report.evolution_score
+        tokens = "-" if report.context_tokens is None else f"{report.context_tokens:,}"
+        cells = ""
+        for phase in PHASES:
+            if phase in report.timings:
+                totals[phase] += report.timings[phase]
+                cells += f" {report.timings[phase] * 1000:>10.1f}"
+            else:
+                cells += f" {'-':>10}"
+        total = sum(report.timings.values()) * 1000
+        lines.append(
+            f"{report.skill:<24} {report.status:<10} {report.files:>5} "
+            f"{score:>5} {report.similar:>7} {tokens:>8}{cells} {total:>10.1f}"
+        )
+    lines.append(rule)
+    files = sum(report.files for report in reports)
+    cells = "".join(f" {totals[phase] * 1000:>10.1f}" for phase in PHASES)
+    lines.append(
+        f"{'Total':<24} {'':<10} {files:>5} {'':>5} {'':>7} {'':>8}{cells} "
+        f"{sum(totals.values()) * 1000:>10.1f}"
+    )
+
+    setup = ", ".join(
+        f"{phase} {seconds * 1000:.1f} ms" for phase, seconds in timings.items()
+    )
+    packaged = sum(report.status == "packaged" for report in reports)
+    current = sum(report.status == "up to date" for report in reports)
+    failed = sum(not report.ok for report in reports)
+    lines.append("")
+    lines.append(f"Shared setup: {setup}")
+    lines.append(
+        f"{len(reports)} skills in {elapsed:.2f}s: {packaged} packaged, "
+        f"{current} up to date, {failed} failed"
+    )
+
+    for report in reports:
+        if not report.ok:
+            lines.append(f"\n❌ {report.skill} ({report.path}):")
+            lines.extend(f"   {error}" for error in report.errors)
+    return "\n".join(lines)
+
+
+def run_all(args) -> ExitCode:
+    """Package every skill of a marketplace (--all) and print the summary."""
+    timings = {}
+    start = time.perf_counter()
+    try:
+        with timed(timings, "marketplace"):
+            skills = marketplace_skills(args.skill_path)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error reading marketplace: {e}")
+        return ExitCode.GENERAL_ERROR
+    if not skills:
+        print(f"❌ Error: No skills found in marketplace: {args.skill_path}")
+        return ExitCode.GENERAL_ERROR
+
+    print(f"📦 Packaging {len(skills)} skills of {args.skill_path}")
+    if args.output_dir:
+        print(f"   Output directory: {args.output_dir}")
+    print()
+
+    cache = None if args.no_cache else open_cache()
+    reports = package_all(
+        skills,
+        args.output_dir,
+        jobs=args.jobs,
+        cache=cache,
+        timings=timings,
+        budget=budget_from_args(args),
+        budget_fail=args.budget_fail,
+        rebuild=args.rebuild,
+        compression_level=args.compression_level,
+    )
+    print(format_summary(reports, timings, time.perf_counter() - start))
+    if cache is not None:
+        with span("save cache"):
+            cache.save()
+
+    failed = any(not report.ok for report in reports)
+    return ExitCode.VALIDATION_FAILED if failed else ExitCode.SUCCESS
+
+
+def run_single(args) -> ExitCode:
+    """Package the skill folder given on the command line."""
+    print(f"📦 Packaging skill: {args.skill_path}")
+    if args.output_dir:
+        print(f"   Output directory: {args.output_dir}")
+    print()
+
+    result = package_skill(
+        args.skill_path,
+        args.output_dir,
+        args.force,
+        budget=budget_from_args(args),
+        budget_fail=args.budget_fail,
+        rebuild=args.rebuild,
+        compression_level=args.compression_level,
+        jobs=args.jobs,
+    )
+    return ExitCode.SUCCESS if result else ExitCode.GENERAL_ERROR
+
+
 def main():
     import argparse
 
     parser = argparse.ArgumentParser(
         description="Package a skill folder into a .skill file"
     )
-    parser.add_argument("skill_path", help="Path to the skill folder")
+    parser.add_argument(
+        "skill_path",
+        help="Path to the skill folder (with --all: marketplace root or "
+        "marketplace.json)",
+    )
     parser.add_argument(
         "output_dir", nargs="?", help="Optional output directory for the .skill file"
     )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Package every skill of the marketplace's plugins (no prompts)",
+    )
     parser.add_argument(
         "--force", "-f", action="store_true", help="Skip confirmation prompts"
     )
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Package even if the existing .skill file is up to date",
+    )
+    parser.add_argument(
+        "--compression-level",
+        type=int,
+        choices=range(10),
+        default=COMPRESSION_LEVEL,
+        metavar="0-9",
+        help=f"Deflate level, 0 to store everything (default: {COMPRESSION_LEVEL})",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=0,
+        help="Hashing and compression threads; with --all, skills packaged at "
+        "a time (default: one per CPU)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="With --all, re-run every check instead of reusing cached results",
+    )
+    add_budget_arguments(parser)
+    add_trace_arguments(parser)
 
     args = parser.parse_args()
 
-    print(f"📦 Packaging skill: {args.skill_path}")
-    if args.output_dir:
-        print(f"   Output directory: {args.output_dir}")
-    print()
-
-    result = package_skill(args.skill_path, args.output_dir, args.force)
-
-    if result:
-        sys.exit(ExitCode.SUCCESS)
-    else:
-        sys.exit(ExitCode.GENERAL_ERROR)
+    start_from_args(args)
+    try:
+        if args.all:
+            with span("package all", marketplace=args.skill_path):
+                code = run_all(args)
+        else:
+            with span("package", skill=args.skill_path):
+                code = run_single(args)
+    finally:
+        finish_from_args(args, "package_skill")
+    sys.exit(code)
 
 
 if __name__ == "__main__":
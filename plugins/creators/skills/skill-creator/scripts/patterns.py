@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# /// script
+# dependencies = []
+# ///
+"""
+Precompiled regular expressions shared by the validation scripts.
+
+Patterns used on every file are compiled once at import instead of being
+passed to re.search()/re.findall() as strings, which looks them up in (and,
+in batch runs, churns) the re module's small internal cache. Patterns built
+at run time go through compiled(), which memoizes them.
+
+The hardcoded-version detectors run as one alternation, so a document is
+scanned once rather than once per detector:
+
+    for text, label in find_versions(content):
+        print(f"{text} ({label})")
+"""
+
+import re
+from functools import lru_cache
+from typing import List, Tuple
+
+# Hardcoded version detectors: (group name, label, pattern)
+VERSION_DETECTORS = [
+    ("claude", "Claude model version", r"claude-\d+-\d+-\w+-\d{8}"),
+    ("gpt", "GPT model version", r"gpt-\d+\.?\d*-\w+-\d{4}"),
+    ("semver", "Semantic version", r"(?<![a-zA-Z])v\d+\.\d+\.\d+(?![a-zA-Z])"),
+    ("package", "Package version", r"@\d+\.\d+\.\d+"),
+]
+# The lookahead on each detector's first character lets the engine skip
+# most positions quickly; a bare alternation is slower than separate scans
+HARDCODED_VERSION = re.compile(
+    "(?=[cgv@])(?:"
+    + "|".join(f"(?P<{name}>{pattern})" for name, _, pattern in VERSION_DETECTORS)
+    + ")"
+)
+_VERSION_LABELS = {name: label for name, label, _ in VERSION_DETECTORS}
+_VERSION_ORDER = {name: index for index, (name, _, _) in enumerate(VERSION_DETECTORS)}
+
+# Skill names: lowercase letters, digits and hyphens (see quick_validate)
+SKILL_NAME = re.compile(r"[a-z0-9-]+")
+# Word tokens of lowercased text (check_duplicates)
+WORD = re.compile(r"[a-z]+")
+# Section titles (matched against SectionMap keys, whole title)
+TRIGGERS_SECTION = re.compile(r"triggers?", re.IGNORECASE)
+EXTENSION_POINTS_SECTION = re.compile(r"extension ?points?", re.IGNORECASE)
+
+
+@lru_cache(maxsize=256)
+def compiled(pattern: str, flags: int = 0) -> "re.Pattern":
+    """Return pattern compiled with flags (memoized)."""
+    return re.compile(pattern, flags)
+
+
+def find_versions(content: str) -> List[Tuple[str, str]]:
+    """
+    Find hardcoded version strings in one scan.
+
+    Returns:
+        (matched text, label) pairs, grouped by detector in
+        VERSION_DETECTORS order and in document order within a detector
+    """
+    found = [(m.lastgroup, m.group()) for m in HARDCODED_VERSION.finditer(content)]
+    found.sort(key=lambda f: _VERSION_ORDER[f[0]])  # Stable: keeps document order
+    return [(text, _VERSION_LABELS[name]) for name, text in found]
+
+
+def has_versions(content: str) -> bool:
+    """Check for any hardcoded version string."""
+    return HARDCODED_VERSION.search(content) is not None
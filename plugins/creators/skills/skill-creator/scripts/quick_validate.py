@@ -5,23 +5,80 @@
 # ///
 """
 Enhanced validation script for skills with Evolution Scoring integration.
+
+Usage:
+    python scripts/quick_validate.py <skill-dir> [--json] [--verbose] [--strict]
+                                     [--deep] [--shell] [--timings]
+                                     [--context-report] [--budget-fail]
+    python scripts/quick_validate.py --all <root> [--jobs N] [--strict]
+    python scripts/quick_validate.py --watch <skill-dir> [--json] [--poll]
+
+With --all, every directory under <root> containing a SKILL.md is validated
+(across a worker pool), one JSON object per skill is streamed to stdout as
+results complete, and the exit code is 10 if any skill fails.
+
+With --watch, the skill is re-validated on every change (inotify, or polling
+where unavailable) by one long-running process that keeps parsed documents,
+cached check results and the duplicate index in memory. The duplicate check
+re-runs only when the name or description changes.
+
+With --deep, every other Markdown file of the skill (references/ etc.) also
+gets the link, hardcoded-version and size checks, and the report lists each
+file's estimated token cost.
+
+The estimated context cost (tokens) of SKILL.md plus the references it links
+is checked against budgets (--max-skill-tokens, --max-reference-tokens,
+--max-total-tokens); exceeding one warns, or fails with --budget-fail.
+--context-report adds the per-file costs and heaviest sections.
+
+Every Python file below scripts/ is byte-compiled (in a process pool for
+large bundles); --shell also runs `bash -n` on shell scripts and --timings
+reports how long each script check took.
+
+Check results are cached in ~/.claude/skills/.state/validation-cache.json,
+keyed on the content hashes of SKILL.md and each script and on the link
+target directories (and files, for #anchor links), so re-validating an
+unchanged skill only re-runs the checks whose inputs changed. Use
+--no-cache to re-run everything.
 """
 
 import sys
-import re
-import ast
+import os
+import json
+import posixpath
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import List, Tuple
+from typing import Callable, Iterator, List, Optional, Tuple
 from enum import IntEnum
-
-# Try to import yaml, fallback to simple parser
-try:
-    import yaml
-
-    HAS_YAML = True
-except ImportError:
-    HAS_YAML = False
+from functools import lru_cache
+
+from context_cost import (
+    Budget,
+    add_budget_arguments,
+    budget_from_args,
+    estimate_context,
+    estimate_tokens,
+)
+from markdown_sections import scan_sections
+from patterns import (
+    EXTENSION_POINTS_SECTION,
+    SKILL_NAME,
+    TRIGGERS_SECTION,
+    has_versions,
+)
+from script_checks import ScriptCheck, check_scripts, check_sources
+from skill_document import SkillDocument, load_document
+from skill_tree import SkillTree, local_link_targets
+from tracing import span
+from validation_cache import (
+    CACHE_PATH,
+    ValidationCache,
+    directory_state,
+    source_fingerprint,
+)
 
 
 class ExitCode(IntEnum):
@@ -34,6 +91,16 @@ class ExitCode(IntEnum):
     VALIDATION_FAILED = 10
 
 
+# Below this many skills a worker pool costs more than it saves
+PARALLEL_MIN_SKILLS = 8
+# Similarity threshold of the duplicate check in --watch mode
+DUPLICATE_THRESHOLD = 0.5
+# Size guidance from skill-creator's SKILL.md: keep the SKILL.md body under
+# 500 lines; give references over 10k words grep patterns or split them
+SKILL_MD_MAX_LINES = 500
+REFERENCE_MAX_WORDS = 10000
+
+
 @dataclass
 class ValidationResult:
     """Validation result object for multi-check tracking."""
@@ -41,6 +108,12 @@ class ValidationResult:
     passed: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
     errors: List[str] = field(default_factory=list)
+    # Per-script check timings (only collected on request)
+    timings: Optional[List[dict]] = None
+    # Per-Markdown-file size and token estimates (deep validation only)
+    files: Optional[List[dict]] = None
+    # Context cost report: files and heaviest sections (on request)
+    context: Optional[dict] = None
 
     def check(
         self, name: str, condition: bool, message: str, warning_only: bool = False
@@ -64,6 +137,33 @@ class ValidationResult:
         total = len(self.passed) + len(self.warnings) + len(self.errors)
         return f"{len(self.passed)}/{total} passed, {len(self.warnings)} warnings, {len(self.errors)} errors"
 
+    def extend(self, other: "ValidationResult") -> None:
+        """Append the checks recorded in another result."""
+        self.passed.extend(other.passed)
+        self.warnings.extend(other.warnings)
+        self.errors.extend(other.errors)
+
+    def failed(self, name: str) -> bool:
+        """True if the named check failed (as an error)."""
+        return any(e.startswith(f"[FAIL] {name}:") for e in self.errors)
+
+    def to_dict(self) -> dict:
+        """JSON-serializable form of the result."""
+        result = {
+            "passed": self.passed,
+            "warnings": self.warnings,
+            "errors": self.errors,
+            "is_valid": self.is_valid,
+            "summary": self.summary,
+        }
+        if self.timings is not None:
+            result["timings"] = self.timings
+        if self.files is not None:
+            result["files"] = self.files
+        if self.context is not None:
+            result["context"] = self.context
+        return result
+
     def format_report(self) -> str:
         """Format full validation report."""
         lines = []
@@ -83,162 +183,118 @@ class ValidationResult:
             for p in self.passed:
                 lines.append(p)
 
+        if self.timings:
+            lines.append("\n=== SCRIPT TIMINGS ===")
+            for t in sorted(self.timings, key=lambda t: -t["elapsed_ms"]):
+                source = "cached" if t["cached"] else f"{t['elapsed_ms']:.1f} ms"
+                lines.append(f"{source:>10}  {t['name']}")
+
+        if self.files:
+            lines.append("\n=== CONTEXT COST (estimated tokens) ===")
+            for f in sorted(self.files, key=lambda f: -f["tokens"]):
+                lines.append(f"{f['tokens']:>8,}  {f['path']} ({f['lines']} lines)")
+            total = sum(f["tokens"] for f in self.files)
+            lines.append(f"{total:>8,}  total")
+
+        if self.context:
+            lines.append("\n=== CONTEXT COST (estimated tokens) ===")
+            for f in self.context["files"]:
+                lines.append(f"{f['tokens']:>8,}  {f['path']}")
+            lines.append(f"{self.context['total_tokens']:>8,}  total")
+            lines.append("\nHeaviest sections:")
+            for s in self.context["heaviest_sections"]:
+                lines.append(
+                    f"{s['tokens']:>8,}  {s['path']}:{s['line']}  {s['title']}"
+                )
+
         lines.append(f"\n{self.summary}")
         return "\n".join(lines)
 
 
-def parse_yaml_simple(text: str) -> dict:
-    """Simple YAML parser fallback."""
-    result = {}
-    for line in text.split("\n"):
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-        if ":" in line and not line.startswith(" "):
-            key, value = line.split(":", 1)
-            result[key.strip()] = value.strip().strip("\"'")
-    return result
-
-
-def extract_frontmatter(content: str) -> Tuple[dict, str]:
-    """Extract YAML frontmatter from content."""
-    if not content.startswith("---"):
-        raise ValueError("No YAML frontmatter found")
-
-    match = re.match(r"^---\n(.*?)\n---", content, re.DOTALL)
-    if not match:
-        raise ValueError("Invalid frontmatter format")
-
-    frontmatter_text = match.group(1)
-    body = content[match.end() :]
-
-    if HAS_YAML:
-        frontmatter = yaml.safe_load(frontmatter_text)
-    else:
-        frontmatter = parse_yaml_simple(frontmatter_text)
-
-    if not isinstance(frontmatter, dict):
-        raise ValueError("Frontmatter must be a YAML dictionary")
-
-    return frontmatter, body
-
-
 def count_triggers(content: str) -> int:
     """Count trigger entries in the skill."""
-    trigger_section = re.search(
-        r"##\s*Triggers?\s*\n(.*?)(?=\n##|\Z)", content, re.DOTALL | re.IGNORECASE
-    )
-    if not trigger_section:
-        return 0
-
-    section_content = trigger_section.group(1)
-    # Count list items (lines starting with -)
-    triggers = re.findall(r"^\s*-\s+", section_content, re.MULTILINE)
-    return len(triggers)
+    return scan_sections(content).list_items(TRIGGERS_SECTION).count("-")
 
 
 def count_extension_points(content: str) -> int:
     """Count extension points in the skill."""
-    ext_section = re.search(
-        r"##\s*Extension\s*Points?\s*\n(.*?)(?=\n##|\Z)",
-        content,
-        re.DOTALL | re.IGNORECASE,
-    )
-    if not ext_section:
-        return 0
-
-    section_content = ext_section.group(1)
-    # Count numbered or bulleted items
-    items = re.findall(r"^\s*(?:\d+\.|[-*])\s+", section_content, re.MULTILINE)
-    return len(items)
+    return len(scan_sections(content).list_items(EXTENSION_POINTS_SECTION))
 
 
 def has_section(content: str, section_name: str) -> bool:
     """Check if a section exists."""
-    pattern = rf"##\s*{re.escape(section_name)}"
-    return bool(re.search(pattern, content, re.IGNORECASE))
+    return scan_sections(content).has_section(section_name)
 
 
 def has_anti_patterns_section(content: str) -> bool:
     """Check for anti-patterns section."""
-    return has_section(content, "Anti-Patterns") or has_section(
-        content, "Anti Patterns"
-    )
+    return scan_sections(content).has_section("Anti-Patterns", "Anti Patterns")
 
 
 def has_why_section(content: str) -> bool:
     """Check for WHY/Design Rationale section."""
-    return (
-        has_section(content, "WHY")
-        or has_section(content, "Design Rationale")
-        or has_section(content, "Design Reason")
+    return scan_sections(content).has_section(
+        "WHY", "Design Rationale", "Design Reason"
     )
 
 
+@lru_cache(maxsize=64)
 def has_hardcoded_versions(content: str) -> bool:
-    """Check for hardcoded version strings."""
-    # Common version patterns to detect
-    patterns = [
-        r"claude-\d+-\d+-\w+-\d{8}",  # claude-3-5-sonnet-20241022
-        r"gpt-\d+\.?\d*-\w+-\d{4}",  # gpt-4-turbo-2024
-        r"v\d+\.\d+\.\d+",  # v1.2.3 (semver)
-        r"@\d+\.\d+\.\d+",  # @1.2.3 (npm style)
-    ]
-
-    for pattern in patterns:
-        if re.search(pattern, content):
-            return True
-    return False
-
-
-def remove_code_blocks(content: str) -> str:
-    """Remove fenced code blocks from content."""
-    # Remove triple-backtick code blocks (including language specifier)
-    return re.sub(r"```[^\n]*\n.*?```", "", content, flags=re.DOTALL)
+    """Check for hardcoded version strings (see patterns.VERSION_DETECTORS)."""
+    return has_versions(content)
+
+
+def broken_links(
+    tree: SkillTree, targets: List[Tuple[str, str, str, str]], base: str = ""
+) -> List[str]:
+    """
+    Return the links whose target file (or anchor in a .md file) is missing.
+
+    Args:
+        tree: Snapshot of the skill directory
+        targets: local_link_targets() of one document
+        base: Directory of that document, relative to the skill root
+    """
+    broken = []
+    for text, href, path, fragment in targets:
+        path = posixpath.join(base, path)
+        if not tree.exists(path):
+            broken.append(f"{href} (referenced as '{text}')")
+        elif (
+            fragment
+            and path.lower().endswith(".md")
+            and tree.is_file(path)
+            and fragment.lower() not in tree.anchors(path)
+        ):
+            broken.append(f"{href} (referenced as '{text}', anchor not found)")
+    return broken
 
 
 def validate_internal_links(skill_path: Path, content: str) -> List[str]:
     """Validate internal links in the skill (excluding code blocks)."""
-    invalid_links = []
-
-    # Remove code blocks first to avoid checking example links
-    content_without_code = remove_code_blocks(content)
-
-    # Find markdown links to local files
-    links = re.findall(r"\[([^\]]+)\]\(([^)]+)\)", content_without_code)
-
-    for text, href in links:
-        # Skip external links
-        if href.startswith("http://") or href.startswith("https://"):
-            continue
-        # Skip anchor links
-        if href.startswith("#"):
-            continue
-
-        # Resolve relative path
-        link_path = skill_path / href
-        if not link_path.exists():
-            invalid_links.append(f"{href} (referenced as '{text}')")
-
-    return invalid_links
-
+    return broken_links(SkillTree(skill_path), local_link_targets(content))
+
+
+def validate_scripts(
+    skill_path: Path,
+    cache: Optional[ValidationCache] = None,
+    shell: bool = False,
+    jobs: Optional[int] = 1,
+    tree: Optional[SkillTree] = None,
+) -> List[ScriptCheck]:
+    """Check the scripts below scripts/ (unchanged scripts reuse cached results)."""
+    if tree is not None and not tree.on_disk:
+        sources = {
+            rel[len("scripts/") :]: tree.read_bytes(rel)
+            for rel in tree.files()
+            if rel.startswith("scripts/")
+        }
+        return check_sources(sources, shell=shell, cache=cache)
 
-def validate_python_scripts(skill_path: Path) -> List[str]:
-    """Validate Python syntax in scripts."""
-    syntax_errors = []
     scripts_dir = skill_path / "scripts"
-
-    if not scripts_dir.exists():
+    if not scripts_dir.is_dir():
         return []
-
-    for py_file in scripts_dir.glob("*.py"):
-        try:
-            content = py_file.read_text()
-            ast.parse(content)
-        except SyntaxError as e:
-            syntax_errors.append(f"{py_file.name}: line {e.lineno}: {e.msg}")
-
-    return syntax_errors
+    return check_scripts(scripts_dir, shell=shell, cache=cache, jobs=jobs)
 
 
 def calculate_evolution_score(content: str) -> Tuple[int, List[str]]:
@@ -276,32 +332,40 @@ def calculate_evolution_score(content: str) -> Tuple[int, List[str]]:
     return score, suggestions
 
 
-def validate_skill(skill_path: str, verbose: bool = False) -> ValidationResult:
-    """Comprehensive validation of a skill."""
-    result = ValidationResult()
-    skill_path = Path(skill_path)
-
-    # Check directory exists
-    if not skill_path.exists():
-        result.errors.append(f"[FAIL] path: Skill directory not found: {skill_path}")
-        return result
+def cached_phase(
+    cache: Optional[ValidationCache],
+    key: str,
+    compute: Callable[[], ValidationResult],
+) -> ValidationResult:
+    """Return a cached check result for key, computing and storing it on a miss."""
+    entry = cache.get(key) if cache is not None else None
+    if entry is not None:
+        return ValidationResult(entry["passed"], entry["warnings"], entry["errors"])
+
+    result = compute()
+    if cache is not None:
+        cache.put(
+            key,
+            {
+                "passed": result.passed,
+                "warnings": result.warnings,
+                "errors": result.errors,
+            },
+        )
+    return result
 
-    # Check SKILL.md exists
-    skill_md = skill_path / "SKILL.md"
-    result.check("skill_md", skill_md.exists(), "SKILL.md exists")
-    if not skill_md.exists():
-        return result
 
-    # Read content
-    content = skill_md.read_text()
+def check_document(document: SkillDocument) -> ValidationResult:
+    """Run the checks that depend only on SKILL.md content."""
+    result = ValidationResult()
+    content = document.content
 
     # Validate frontmatter
-    try:
-        frontmatter, body = extract_frontmatter(content)
-        result.check("frontmatter", True, "Valid YAML frontmatter")
-    except ValueError as e:
-        result.check("frontmatter", False, str(e))
+    if document.error:
+        result.check("frontmatter", False, document.error)
         return result
+    frontmatter = document.frontmatter
+    result.check("frontmatter", True, "Valid YAML frontmatter")
 
     # Allowed properties
     ALLOWED_PROPERTIES = {"name", "description", "license", "allowed-tools", "metadata"}
@@ -328,7 +392,7 @@ def validate_skill(skill_path: str, verbose: bool = False) -> ValidationResult:
             name = name.strip()
             # Naming convention
             valid_name = (
-                re.match(r"^[a-z0-9-]+$", name)
+                SKILL_NAME.fullmatch(name)
                 and not name.startswith("-")
                 and not name.endswith("-")
                 and "--" not in name
@@ -389,8 +453,37 @@ def validate_skill(skill_path: str, verbose: bool = False) -> ValidationResult:
         warning_only=True,
     )
 
-    # Internal links
-    invalid_links = validate_internal_links(skill_path, content)
+    return result
+
+
+def check_links(tree: SkillTree, content: str) -> Tuple[ValidationResult, dict]:
+    """
+    Check the internal links of SKILL.md content.
+
+    Returns:
+        (result, directory_state) where directory_state holds the mtimes of
+        the directories containing each link target and of the Markdown
+        files whose anchors were checked (empty for trees not on disk)
+    """
+    result = ValidationResult()
+    targets = local_link_targets(content)
+    invalid_links = broken_links(tree, targets)
+
+    # A link's existence depends on its target directory's listing, an
+    # anchor's on the content of the file it points into
+    state = {}
+    if tree.on_disk:
+        watched = [
+            os.path.dirname(os.path.realpath(tree.full_path(path)))
+            for _, _, path, _ in targets
+        ]
+        watched.extend(
+            os.path.realpath(tree.full_path(path))
+            for _, _, path, fragment in targets
+            if fragment and path.lower().endswith(".md")
+        )
+        state = directory_state(watched)
+
     result.check(
         "internal_links",
         len(invalid_links) == 0,
@@ -402,19 +495,116 @@ def validate_skill(skill_path: str, verbose: bool = False) -> ValidationResult:
         warning_only=True,
     )
 
-    # Python syntax
-    syntax_errors = validate_python_scripts(skill_path)
+    return result, state
+
+
+def markdown_summary(content: str) -> dict:
+    """Return the size, token estimate and local links of a Markdown file."""
+    return {
+        "lines": len(content.splitlines()),
+        "words": len(content.split()),
+        "tokens": estimate_tokens(content),
+        "hardcoded_versions": has_hardcoded_versions(content),
+        "links": local_link_targets(content),
+    }
+
+
+def check_markdown_files(
+    skill_path: Path,
+    cache: Optional[ValidationCache] = None,
+    tree: Optional[SkillTree] = None,
+) -> Tuple[ValidationResult, List[dict]]:
+    """
+    Run the link, hardcoded version and size checks on every Markdown file
+    of the skill, one file at a time.
+
+    SKILL.md itself is only measured here (its other checks run in every
+    mode). Per-file summaries are cached by content hash, so unchanged files
+    are not read again; links are re-resolved against the current tree.
+
+    Returns:
+        (result, per-file {path, lines, words, tokens} rows)
+    """
+    result = ValidationResult()
+    tree = tree or SkillTree(skill_path)
+    files = []
+    broken, versioned, oversized = [], [], []
+
+    for rel in tree.files(".md"):
+        if cache is not None:
+            key = "markdown:" + tree.digest(rel, cache)
+            summary = cache.get(key)
+            if summary is None:
+                summary = markdown_summary(tree.read_text(rel))
+                cache.put(key, summary)
+        else:
+            summary = markdown_summary(tree.read_text(rel))
+        files.append(
+            {
+                "path": rel,
+                "lines": summary["lines"],
+                "words": summary["words"],
+                "tokens": summary["tokens"],
+            }
+        )
+
+        if rel == "SKILL.md":
+            if summary["lines"] > SKILL_MD_MAX_LINES:
+                oversized.append(
+                    f"{rel}: {summary['lines']} lines "
+                    f"(recommended: under {SKILL_MD_MAX_LINES})"
+                )
+            continue
+
+        targets = [tuple(link) for link in summary["links"]]
+        invalid = broken_links(tree, targets, posixpath.dirname(rel))
+        if invalid:
+            broken.append(f"{rel}: {', '.join(invalid)}")
+        if summary["hardcoded_versions"]:
+            versioned.append(rel)
+        if summary["words"] > REFERENCE_MAX_WORDS:
+            oversized.append(
+                f"{rel}: {summary['words']:,} words (recommended: under "
+                f"{REFERENCE_MAX_WORDS:,}; add grep patterns or split it)"
+            )
+
+    count = len(files)
+    result.check(
+        "reference_links",
+        not broken,
+        (
+            f"Invalid links: {'; '.join(broken)}"
+            if broken
+            else f"All internal links valid in {count} Markdown files"
+        ),
+        warning_only=True,
+    )
     result.check(
-        "python_syntax",
-        len(syntax_errors) == 0,
+        "reference_versions",
+        not versioned,
         (
-            f"Syntax errors: {'; '.join(syntax_errors)}"
-            if syntax_errors
-            else "All Python scripts valid"
+            f"Hardcoded version strings in: {', '.join(versioned)}"
+            if versioned
+            else f"No hardcoded version strings in {count} Markdown files"
         ),
+        warning_only=True,
     )
+    result.check(
+        "reference_size",
+        not oversized,
+        (
+            f"Oversized: {'; '.join(oversized)}"
+            if oversized
+            else "All Markdown files within size guidance"
+        ),
+        warning_only=True,
+    )
+    return result, files
 
-    # Evolution score (informational)
+
+def check_evolution(content: str, verbose: bool) -> ValidationResult:
+    """Report the evolution score (informational)."""
+    result = ValidationResult()
     evo_score, suggestions = calculate_evolution_score(content)
     if evo_score >= 7:
         result.passed.append(
@@ -431,38 +621,491 @@ def validate_skill(skill_path: str, verbose: bool = False) -> ValidationResult:
     return result
 
 
+def validate_skill(
+    skill_path: str,
+    verbose: bool = False,
+    cache: Optional[ValidationCache] = None,
+    shell: bool = False,
+    timings: bool = False,
+    jobs: Optional[int] = 1,
+    deep: bool = False,
+    budget: Optional[Budget] = None,
+    budget_fail: bool = False,
+    context: bool = False,
+    tree: Optional[SkillTree] = None,
+) -> ValidationResult:
+    """
+    Comprehensive validation of a skill.
+
+    Args:
+        skill_path: Skill directory
+        verbose: Include improvement suggestions
+        cache: Persistent result cache; checks whose inputs (SKILL.md,
+            scripts, link target directories) are unchanged are not re-run.
+            The caller is responsible for cache.save().
+        shell: Also check shell scripts with `bash -n`
+        timings: Record per-script check timings in result.timings
+        jobs: Worker processes for script checks (None or 0 for one per CPU)
+        deep: Also check every other Markdown file of the skill and record
+            per-file token estimates in result.files
+        budget: Token budgets of SKILL.md and its linked references
+            (default: Budget())
+        budget_fail: Report exceeded budgets as errors instead of warnings
+        context: Record the context cost report in result.context
+        tree: Files of the skill to validate instead of reading skill_path
+            (e.g. a skill_archive.ArchiveTree of a .skill file's members)
+    """
+    result = ValidationResult()
+    skill_path = Path(skill_path)
+
+    # Check directory exists
+    if tree is None and not skill_path.exists():
+        result.errors.append(f"[FAIL] path: Skill directory not found: {skill_path}")
+        return result
+    tree = tree or SkillTree(skill_path)
+
+    # Check SKILL.md exists
+    has_skill_md = tree.is_file("SKILL.md")
+    result.check("skill_md", has_skill_md, "SKILL.md exists")
+    if not has_skill_md:
+        return result
+
+    # Frontmatter and content checks
+    with span("document"):
+        document = tree.document("SKILL.md")
+        digest = tree.digest("SKILL.md", cache, lambda path: load_document(path).digest)
+        document_result = cached_phase(
+            cache, f"document:{digest}", lambda: check_document(document)
+        )
+    result.extend(document_result)
+    if document_result.failed("frontmatter"):
+        return result
+
+    # Internal links (valid while the target directories and anchor files
+    # are unchanged)
+    links_key = f"links:{os.path.realpath(skill_path)}:{digest}"
+    entry = cache.get(links_key) if cache is not None and tree.on_disk else None
+    with span("links"):
+        if entry and directory_state(entry["directories"]) == entry["directories"]:
+            links_result = ValidationResult(**entry["result"])
+        else:
+            links_result, state = check_links(tree, document.content)
+            if cache is not None and tree.on_disk:
+                cache.put(
+                    links_key,
+                    {
+                        "directories": state,
+                        "result": {
+                            "passed": links_result.passed,
+                            "warnings": links_result.warnings,
+                            "errors": links_result.errors,
+                        },
+                    },
+                )
+    result.extend(links_result)
+
+    # Context cost of SKILL.md plus linked references
+    with span("context cost"):
+        cost = estimate_context(skill_path, cache, tree)
+    over_budget = (budget or Budget()).violations(cost)
+    result.check(
+        "context_budget",
+        not over_budget,
+        (
+            f"Over budget: {'; '.join(over_budget)}"
+            if over_budget
+            else f"{cost.summary()} within budget"
+        ),
+        warning_only=not budget_fail,
+    )
+    if context:
+        result.context = cost.to_dict()
+
+    # Script syntax (scripts/ recursively)
+    with span("scripts"):
+        scripts = validate_scripts(skill_path, cache, shell, jobs, tree)
+    for kind, label, name in (
+        ("python", "Python", "python_syntax"),
+        ("shell", "shell", "shell_syntax"),
+    ):
+        if kind == "shell" and not shell:
+            continue
+        syntax_errors = [
+            f"{c.name}: {c.error}" for c in scripts if c.kind == kind and c.error
+        ]
+        result.check(
+            name,
+            len(syntax_errors) == 0,
+            (
+                f"Syntax errors: {'; '.join(syntax_errors)}"
+                if syntax_errors
+                else f"All {label} scripts valid"
+            ),
+        )
+    if timings:
+        result.timings = [c.to_dict() for c in scripts]
+
+    # References and other Markdown files (deep mode)
+    if deep:
+        with span("markdown"):
+            markdown_result, result.files = check_markdown_files(
+                skill_path, cache, tree
+            )
+        result.extend(markdown_result)
+
+    # Evolution score (informational)
+    with span("evolution"):
+        result.extend(
+            cached_phase(
+                cache,
+                f"evolution:{digest}:{int(verbose)}",
+                lambda: check_evolution(document.content, verbose),
+            )
+        )
+
+    return result
+
+
+def open_cache() -> ValidationCache:
+    """Open the persistent result cache, invalidated when the checks change."""
+    sources = sorted(Path(__file__).resolve().parent.glob("*.py"))
+    return ValidationCache(CACHE_PATH, source_fingerprint(sources))
+
+
+# Per-process cache of pool workers (opened on first use)
+_worker_cache: Optional[ValidationCache] = None
+
+
+def validate_path(
+    path: str,
+    verbose: bool = False,
+    strict: bool = False,
+    cache: Optional[ValidationCache] = None,
+    **options,
+) -> dict:
+    """
+    Validate one skill directory for a batch run.
+
+    Args:
+        options: Passed on to validate_skill() (shell, timings, deep,
+            budget, budget_fail, context)
+
+    Returns:
+        ValidationResult.to_dict() plus `path`, `ok` (is_valid, and no
+        warnings when strict) and `elapsed_ms`
+    """
+    start = time.perf_counter()
+    try:
+        result = validate_skill(path, verbose=verbose, cache=cache, **options)
+    except (OSError, UnicodeDecodeError) as e:
+        result = ValidationResult()
+        result.check("read", False, str(e))
+    ok = result.is_valid and not (strict and result.warnings)
+    elapsed_ms = round((time.perf_counter() - start) * 1000, 3)
+    return {"path": path, **result.to_dict(), "ok": ok, "elapsed_ms": elapsed_ms}
+
+
+def validate_paths(
+    paths: List[str],
+    verbose: bool,
+    strict: bool,
+    use_cache: bool,
+    options: Optional[dict] = None,
+) -> Tuple[List[dict], dict]:
+    """
+    Validate a chunk of skill directories (one worker task).
+
+    Returns:
+        (results, cache entries added by this chunk) - the parent process
+        merges the entries and saves the cache once
+    """
+    global _worker_cache
+    if use_cache and _worker_cache is None:
+        _worker_cache = open_cache()
+    cache = _worker_cache if use_cache else None
+
+    results = [
+        validate_path(path, verbose, strict, cache, **(options or {})) for path in paths
+    ]
+    added = {}
+    if cache is not None:
+        added, cache.added = cache.added, {}
+    return results, added
+
+
+def validate_all(
+    paths: List[str],
+    jobs: Optional[int] = 1,
+    verbose: bool = False,
+    strict: bool = False,
+    cache: Optional[ValidationCache] = None,
+    options: Optional[dict] = None,
+) -> Iterator[dict]:
+    """
+    Validate skill directories, in parallel when worthwhile.
+
+    Args:
+        paths: Skill directories to validate
+        jobs: Worker processes (None or 0 for one per CPU, 1 for serial)
+        verbose: Include improvement suggestions
+        strict: Treat warnings as failures
+        cache: Result cache; entries computed by workers are merged into it
+        options: Passed on to validate_skill() (shell, timings, deep,
+            budget, budget_fail, context)
+
+    Yields:
+        validate_path() results in completion order
+    """
+    jobs = jobs or os.cpu_count() or 1
+    jobs = min(jobs, len(paths) // PARALLEL_MIN_SKILLS)
+    pending = set(paths)
+    if jobs > 1:
+        chunksize = max(1, min(16, len(paths) // (jobs * 4)))
+        chunks = [paths[i : i + chunksize] for i in range(0, len(paths), chunksize)]
+        use_cache = cache is not None
+        try:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                futures = [
+                    executor.submit(
+                        validate_paths, chunk, verbose, strict, use_cache, options
+                    )
+                    for chunk in chunks
+                ]
+                for future in as_completed(futures):
+                    results, added = future.result()
+                    for key, value in added.items():
+                        cache.put(key, value)
+                    for result in results:
+                        pending.discard(result["path"])
+                        yield result
+        except (OSError, BrokenProcessPool):
+            pass  # Finish serially (e.g. no multiprocessing support)
+
+    for path in paths:
+        if path in pending:
+            yield validate_path(path, verbose, strict, cache, **(options or {}))
+
+
+def discover_skill_dirs(root: Path) -> List[str]:
+    """Return every directory under root that contains a SKILL.md, sorted."""
+    return sorted(str(skill_md.parent) for skill_md in root.rglob("SKILL.md"))
+
+
+def check_options(args) -> dict:
+    """Return the optional-check keyword arguments of validate_skill()."""
+    return {
+        "shell": args.shell,
+        "timings": args.timings,
+        "deep": args.deep,
+        "budget": budget_from_args(args),
+        "budget_fail": args.budget_fail,
+        "context": args.context_report,
+    }
+
+
+def run_all(args) -> int:
+    """Validate every skill under args.path, streaming JSON Lines to stdout."""
+    if not args.path.is_dir():
+        print(f"Error: Directory not found: {args.path}", file=sys.stderr)
+        return ExitCode.FILE_NOT_FOUND
+
+    paths = discover_skill_dirs(args.path)
+    if not paths:
+        print(f"Error: No skills found under {args.path}", file=sys.stderr)
+        return ExitCode.FILE_NOT_FOUND
+
+    start = time.perf_counter()
+    cache = None if args.no_cache else open_cache()
+    failed = 0
+    results = validate_all(
+        paths, args.jobs, args.verbose, args.strict, cache, check_options(args)
+    )
+    for result in results:
+        failed += not result["ok"]
+        print(json.dumps(result), flush=True)
+    if cache is not None:
+        cache.save()
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"Validated {len(paths)} skills in {elapsed:.2f}s: "
+        f"{len(paths) - failed} passed, {failed} failed",
+        file=sys.stderr,
+    )
+    return ExitCode.VALIDATION_FAILED if failed else ExitCode.SUCCESS
+
+
+def watch_skill(args) -> int:
+    """Re-validate a skill on every change until interrupted."""
+    from check_duplicates import (
+        INDEX_PATH,
+        DuplicateIndex,
+        SkillInfo,
+        default_search_paths,
+        discover_skills,
+    )
+    from file_watcher import open_watcher
+
+    skill_path = args.path.resolve()
+    skill_md = skill_path / "SKILL.md"
+    cache = ValidationCache(None) if args.no_cache else open_cache()
+    duplicate_index = DuplicateIndex(
+        discover_skills(default_search_paths(), INDEX_PATH)
+    )
+    identity = None
+    similar = []
+
+    def run(changed: List[str]) -> None:
+        nonlocal identity, similar
+        start = time.perf_counter()
+        result = validate_skill(
+            skill_path, verbose=args.verbose, cache=cache, **check_options(args)
+        )
+
+        # Duplicate check only when the name or description changed
+        document = load_document(skill_md) if skill_md.exists() else None
+        if document is None or document.error:
+            identity, similar = None, []
+        elif (document.name, document.description) != identity:
+            identity = (document.name, document.description)
+            skill = SkillInfo(name=identity[0], description=identity[1], path=skill_md)
+            similar = duplicate_index.query(skill, DUPLICATE_THRESHOLD, skill_path)
+            similar.sort(key=lambda x: x.total_similarity, reverse=True)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        if args.json:
+            output = {
+                "changed": changed,
+                **result.to_dict(),
+                "similar_skills": [r.to_dict() for r in similar],
+                "elapsed_ms": round(elapsed_ms, 3),
+            }
+            print(json.dumps(output), flush=True)
+            return
+
+        stamp = time.strftime("%H:%M:%S")
+        what = ", ".join(changed) if changed else "initial run"
+        print(f"[{stamp}] {what}: {result.summary} ({elapsed_ms:.1f} ms)")
+        for line in result.errors + result.warnings:
+            print(f"  {line}")
+        for r in similar:
+            print(
+                f"  [DUP] {r.skill.name}: {r.total_similarity*100:.1f}% similar"
+                f" ({r.skill.path})"
+            )
+        sys.stdout.flush()
+
+    run([])
+    try:
+        with open_watcher(skill_path, polling=args.poll) as watcher:
+            if not args.json:
+                print(
+                    f"Watching {skill_path} ({type(watcher).__name__}); Ctrl+C to stop"
+                )
+            for changed in watcher.changes():
+                names = sorted(os.path.relpath(path, skill_path) for path in changed)
+                run(names)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        cache.save()
+
+    return ExitCode.SUCCESS
+
+
 def main():
     import argparse
 
     parser = argparse.ArgumentParser(description="Validate skill directory")
-    parser.add_argument("path", type=Path, help="Skill directory path")
+    parser.add_argument(
+        "path", type=Path, help="Skill directory path (with --all: root to search)"
+    )
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
     parser.add_argument(
         "--strict", action="store_true", help="Treat warnings as errors"
     )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Validate every skill under path, streaming JSON Lines",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=0,
+        help="Worker processes for --all or script checks (default: one per CPU)",
+    )
+    parser.add_argument(
+        "--shell",
+        action="store_true",
+        help="Also check shell scripts under scripts/ with `bash -n`",
+    )
+    parser.add_argument(
+        "--deep",
+        action="store_true",
+        help="Also check every Markdown file (links, versions, size) "
+        "and report per-file token estimates",
+    )
+    parser.add_argument(
+        "--context-report",
+        action="store_true",
+        help="Report the estimated context cost, ranking the heaviest sections",
+    )
+    add_budget_arguments(parser)
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Report how long each script check took",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Re-validate the skill on every change until interrupted",
+    )
+    parser.add_argument(
+        "--poll",
+        action="store_true",
+        help="With --watch, poll for changes instead of using inotify",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-run every check instead of reusing cached results",
+    )
 
     args = parser.parse_args()
 
+    if args.jobs < 0:
+        print("Error: --jobs must be 0 or more", file=sys.stderr)
+        sys.exit(ExitCode.INVALID_ARGUMENTS)
+
     if not args.path.exists():
         print(f"Error: Path not found: {args.path}", file=sys.stderr)
         sys.exit(ExitCode.INVALID_ARGUMENTS)
 
-    result = validate_skill(args.path, verbose=args.verbose)
+    if args.all:
+        sys.exit(run_all(args))
+
+    if args.watch:
+        sys.exit(watch_skill(args))
+
+    cache = None if args.no_cache else open_cache()
+    result = validate_skill(
+        args.path,
+        verbose=args.verbose,
+        cache=cache,
+        jobs=args.jobs,
+        **check_options(args),
+    )
 
     if args.json:
-        import json
-
-        output = {
-            "passed": result.passed,
-            "warnings": result.warnings,
-            "errors": result.errors,
-            "is_valid": result.is_valid,
-            "summary": result.summary,
-        }
-        print(json.dumps(output, indent=2))
+        print(json.dumps(result.to_dict(), indent=2))
     else:
         print(result.format_report())
+    if cache is not None:
+        cache.save()
 
     if args.strict and result.warnings:
         sys.exit(ExitCode.VALIDATION_FAILED)
@@ -14,24 +14,31 @@ Evaluates a skill's future-readiness based on:
 - Base score: +2 points
 
 Total: 10 points max, 7+ recommended
+
+Usage:
+    python scripts/score_evolution.py <skill-path> [--json] [--quiet]
+    python scripts/score_evolution.py --recursive <root> [--jobs N] [--quiet]
+
+With --recursive, every SKILL.md under <root> is scored in one process
+(with a worker pool), one JSON object per line is streamed to stdout as
+results complete, and an aggregate summary is printed to stderr.
 """
 
 import sys
-import re
+import os
 import argparse
 import json
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import List
+from typing import Dict, Iterator, List, Optional
 from enum import IntEnum
 
-# Try to import yaml
-try:
-    import yaml
-
-    HAS_YAML = True
-except ImportError:
-    HAS_YAML = False
+from markdown_sections import scan_sections
+from patterns import EXTENSION_POINTS_SECTION, find_versions
+from skill_document import load_document
 
 
 class ExitCode(IntEnum):
@@ -41,6 +48,12 @@ class ExitCode(IntEnum):
     FILE_NOT_FOUND = 3
 
 
+THRESHOLD = 7
+# Below this many files a worker pool costs more than it saves
+PARALLEL_MIN_FILES = 32
+SLOWEST_COUNT = 5
+
+
 @dataclass
 class ScoreItem:
     """Individual score item."""
@@ -69,14 +82,14 @@ class EvolutionScore:
 
     @property
     def meets_threshold(self) -> bool:
-        return self.total >= 7
+        return self.total >= THRESHOLD
 
     def to_dict(self) -> dict:
         return {
             "score": self.total,
             "max_score": self.max_total,
             "meets_threshold": self.meets_threshold,
-            "threshold": 7,
+            "threshold": THRESHOLD,
             "items": [
                 {
                     "name": item.name,
@@ -91,73 +104,31 @@ class EvolutionScore:
         }
 
 
-def parse_yaml_simple(text: str) -> dict:
-    """Simple YAML parser fallback."""
-    result = {}
-    for line in text.split("\n"):
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-        if ":" in line and not line.startswith(" "):
-            key, value = line.split(":", 1)
-            result[key.strip()] = value.strip().strip("\"'")
-    return result
-
-
 def count_extension_points(content: str) -> int:
     """Count extension points in the skill."""
-    ext_section = re.search(
-        r"##\s*Extension\s*Points?\s*\n(.*?)(?=\n##|\Z)",
-        content,
-        re.DOTALL | re.IGNORECASE,
-    )
-    if not ext_section:
-        return 0
-
-    section_content = ext_section.group(1)
-    # Count numbered or bulleted items
-    items = re.findall(r"^\s*(?:\d+\.|[-*])\s+", section_content, re.MULTILINE)
-    return len(items)
+    return len(scan_sections(content).list_items(EXTENSION_POINTS_SECTION))
 
 
 def has_section(content: str, section_name: str) -> bool:
     """Check if a section exists."""
-    pattern = rf"##\s*{re.escape(section_name)}"
-    return bool(re.search(pattern, content, re.IGNORECASE))
+    return scan_sections(content).has_section(section_name)
 
 
 def has_anti_patterns_section(content: str) -> bool:
     """Check for anti-patterns section."""
-    return has_section(content, "Anti-Patterns") or has_section(
-        content, "Anti Patterns"
-    )
+    return scan_sections(content).has_section("Anti-Patterns", "Anti Patterns")
 
 
 def has_why_section(content: str) -> bool:
     """Check for WHY/Design Rationale section."""
-    return (
-        has_section(content, "WHY")
-        or has_section(content, "Design Rationale")
-        or has_section(content, "Design Reason")
+    return scan_sections(content).has_section(
+        "WHY", "Design Rationale", "Design Reason"
     )
 
 
 def find_hardcoded_versions(content: str) -> List[str]:
     """Find hardcoded version strings and return matches."""
-    patterns = [
-        (r"claude-\d+-\d+-\w+-\d{8}", "Claude model version"),
-        (r"gpt-\d+\.?\d*-\w+-\d{4}", "GPT model version"),
-        (r"(?<![a-zA-Z])v\d+\.\d+\.\d+(?![a-zA-Z])", "Semantic version"),
-        (r"@\d+\.\d+\.\d+", "Package version"),
-    ]
-
-    found = []
-    for pattern, label in patterns:
-        matches = re.findall(pattern, content)
-        for match in matches:
-            found.append(f"{match} ({label})")
-
-    return found
+    return [f"{match} ({label})" for match, label in find_versions(content)]
 
 
 def calculate_evolution_score(content: str) -> EvolutionScore:
@@ -258,9 +229,10 @@ def calculate_evolution_score(content: str) -> EvolutionScore:
 
 def format_report(score: EvolutionScore, skill_name: str = "Skill") -> str:
     """Format score report for display."""
+    status = "PASS" if score.meets_threshold else "BELOW THRESHOLD"
     lines = [
         f"Evolution Score: {score.total}/{score.max_total}",
-        f"Threshold: 7 ({"PASS" if score.meets_threshold else "BELOW THRESHOLD"})",
+        f"Threshold: {THRESHOLD} ({status})",
         "",
         "Breakdown:",
     ]
@@ -279,6 +251,128 @@ def format_report(score: EvolutionScore, skill_name: str = "Skill") -> str:
     return "\n".join(lines)
 
 
+def score_file(path: str) -> dict:
+    """
+    Score one SKILL.md for a batch run.
+
+    Returns:
+        EvolutionScore.to_dict() plus `path` and `elapsed_ms`, or `path` and
+        `error` if the file could not be read
+    """
+    start = time.perf_counter()
+    try:
+        result = calculate_evolution_score(load_document(Path(path)).content).to_dict()
+    except (OSError, UnicodeDecodeError) as e:
+        result = {"error": str(e)}
+    elapsed_ms = round((time.perf_counter() - start) * 1000, 3)
+    return {"path": path, **result, "elapsed_ms": elapsed_ms}
+
+
+def score_files(paths: List[str]) -> List[dict]:
+    """Score a chunk of SKILL.md files (one worker task)."""
+    return [score_file(path) for path in paths]
+
+
+def score_tree(paths: List[str], jobs: Optional[int] = 1) -> Iterator[dict]:
+    """
+    Score SKILL.md files, in parallel when worthwhile.
+
+    Args:
+        paths: SKILL.md paths to score
+        jobs: Worker processes (None or 0 for one per CPU, 1 for serial)
+
+    Yields:
+        score_file() results in completion order
+    """
+    jobs = jobs or os.cpu_count() or 1
+    jobs = min(jobs, len(paths) // PARALLEL_MIN_FILES)
+    pending = set(paths)
+    if jobs > 1:
+        chunksize = max(1, min(64, len(paths) // (jobs * 4)))
+        chunks = [paths[i : i + chunksize] for i in range(0, len(paths), chunksize)]
+        try:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                futures = [executor.submit(score_files, chunk) for chunk in chunks]
+                for future in as_completed(futures):
+                    for result in future.result():
+                        pending.discard(result["path"])
+                        yield result
+        except (OSError, BrokenProcessPool):
+            pass  # Finish serially (e.g. no multiprocessing support)
+
+    for path in paths:
+        if path in pending:
+            yield score_file(path)
+
+
+def summarize(results: List[dict]) -> dict:
+    """Aggregate batch results: score distribution, failures, slowest files."""
+    scored = [r for r in results if "error" not in r]
+    distribution: Dict[str, int] = {}
+    for r in sorted(scored, key=lambda r: r["score"], reverse=True):
+        distribution[str(r["score"])] = distribution.get(str(r["score"]), 0) + 1
+
+    slowest = sorted(results, key=lambda r: r["elapsed_ms"], reverse=True)
+    return {
+        "files": len(results),
+        "scored": len(scored),
+        "errors": len(results) - len(scored),
+        "threshold": THRESHOLD,
+        "below_threshold": sum(1 for r in scored if not r["meets_threshold"]),
+        "mean_score": (
+            round(sum(r["score"] for r in scored) / len(scored), 2) if scored else None
+        ),
+        "distribution": distribution,
+        "slowest": [
+            {"path": r["path"], "elapsed_ms": r["elapsed_ms"]}
+            for r in slowest[:SLOWEST_COUNT]
+        ],
+    }
+
+
+def format_summary(summary: dict) -> str:
+    """Format a batch summary for display."""
+    lines = [
+        f"Scored {summary['scored']}/{summary['files']} skills"
+        f" ({summary['errors']} errors)",
+        f"Mean score: {summary['mean_score']}",
+        f"Below threshold ({summary['threshold']}): {summary['below_threshold']}",
+        "Distribution:",
+    ]
+    for score, count in summary["distribution"].items():
+        lines.append(f"  {score:>2}: {count}")
+    lines.append("Slowest:")
+    for entry in summary["slowest"]:
+        lines.append(f"  {entry['elapsed_ms']:8.2f} ms  {entry['path']}")
+    return "\n".join(lines)
+
+
+def run_recursive(args) -> int:
+    """Score every SKILL.md under args.path, streaming JSON Lines to stdout."""
+    if not args.path.is_dir():
+        print(f"Error: Directory not found: {args.path}", file=sys.stderr)
+        return ExitCode.FILE_NOT_FOUND
+
+    paths = sorted(str(p) for p in args.path.rglob("SKILL.md"))
+    if not paths:
+        print(f"Error: No SKILL.md files under {args.path}", file=sys.stderr)
+        return ExitCode.FILE_NOT_FOUND
+
+    results = []
+    for result in score_tree(paths, args.jobs):
+        results.append(result)
+        if not args.quiet:
+            print(json.dumps(result), flush=True)
+
+    summary = summarize(results)
+    if args.json:
+        print(json.dumps(summary, indent=2), file=sys.stderr)
+    else:
+        print(format_summary(summary), file=sys.stderr)
+
+    return ExitCode.GENERAL_ERROR if summary["errors"] else ExitCode.SUCCESS
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Calculate evolution score for a skill"
@@ -288,11 +382,34 @@ def main():
     )
     parser.add_argument("--json", action="store_true", help="Output as JSON")
     parser.add_argument(
-        "--quiet", "-q", action="store_true", help="Only output score number"
+        "--quiet",
+        "-q",
+        action="store_true",
+        help="Only output score number (with --recursive: only the summary)",
+    )
+    parser.add_argument(
+        "--recursive",
+        "-r",
+        action="store_true",
+        help="Score every SKILL.md under path, streaming JSON Lines",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=0,
+        help="Worker processes for --recursive (default: one per CPU)",
     )
 
     args = parser.parse_args()
 
+    if args.jobs < 0:
+        print("Error: --jobs must be 0 or more", file=sys.stderr)
+        sys.exit(ExitCode.INVALID_ARGUMENTS)
+
+    if args.recursive:
+        sys.exit(run_recursive(args))
+
     # Determine SKILL.md path
     if args.path.is_file():
         skill_md = args.path
@@ -304,7 +421,7 @@ def main():
         sys.exit(ExitCode.FILE_NOT_FOUND)
 
     # Read and score
-    content = skill_md.read_text()
+    content = load_document(skill_md).content
     score = calculate_evolution_score(content)
 
     # Output
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+# /// script
+# dependencies = []
+# ///
+"""
+Syntax checks for the scripts a skill bundles.
+
+Every `*.py` file below scripts/ is byte-compiled and, optionally, every
+shell script is checked with `bash -n`. Results are cached by file content
+hash, and files still to check are spread over a process pool once there
+are enough of them to pay for it.
+
+    checks = check_scripts(skill_path / "scripts", shell=True, cache=cache)
+    errors = [f"{c.name}: {c.error}" for c in checks if c.error]
+
+check_sources() runs the same checks on scripts held in memory (e.g. the
+members of a .skill archive); `bash -n` then reads the script from stdin.
+"""
+
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from skill_tree import SKIPPED_DIRS
+from tracing import record_read
+from validation_cache import ValidationCache, file_sha256
+
+PYTHON_SUFFIXES = (".py",)
+SHELL_SUFFIXES = (".sh", ".bash")
+# Below this many uncached files a process pool costs more than it saves
+PARALLEL_MIN_SCRIPTS = 32
+SHELL_TIMEOUT = 10
+SHELL_TIMEOUT_ERROR = f"bash -n timed out after {SHELL_TIMEOUT}s"
+# Python results depend on the grammar of the running interpreter
+PYTHON_VERSION = "{}.{}".format(*sys.version_info[:2])
+
+
+def check_key(kind: str, digest: str) -> str:
+    """Return the cache key of a script check result."""
+    if kind == "python":
+        return f"python:{PYTHON_VERSION}:{digest}"
+    return f"{kind}:{digest}"
+
+
+@dataclass
+class ScriptCheck:
+    """Result of checking one script."""
+
+    name: str  # Path relative to the scripts directory
+    kind: str  # "python" or "shell"
+    error: Optional[str] = None
+    elapsed_ms: float = 0.0
+    cached: bool = False
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "error": self.error,
+            "elapsed_ms": self.elapsed_ms,
+            "cached": self.cached,
+        }
+
+
+def discover_scripts(scripts_dir: Path, shell: bool = False) -> List[Path]:
+    """Return the Python (and shell) scripts below scripts_dir, sorted."""
+    suffixes = PYTHON_SUFFIXES + (SHELL_SUFFIXES if shell else ())
+    found = []
+    for dirpath, dirnames, filenames in os.walk(scripts_dir):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIPPED_DIRS)
+        found.extend(
+            Path(dirpath, name) for name in filenames if name.endswith(suffixes)
+        )
+    return sorted(found)
+
+
+def script_kind(path: Path) -> str:
+    return "python" if path.name.endswith(PYTHON_SUFFIXES) else "shell"
+
+
+def is_cacheable(kind: str, error: Optional[str]) -> bool:
+    """
+    Check if a result depends on the script alone and may be cached.
+
+    A shell script is not checked where bash is missing, and a `bash -n`
+    timeout says nothing about the script: neither result is kept.
+    """
+    if kind != "shell":
+        return True
+    return shutil.which("bash") is not None and error != SHELL_TIMEOUT_ERROR
+
+
+def python_syntax_error(py_file: Path, source: Optional[bytes] = None) -> Optional[str]:
+    """
+    Return "line N: message" if the script does not compile, else None.
+
+    Args:
+        py_file: Script path (only names the script when source is given)
+        source: Script content, instead of reading py_file
+    """
+    if source is None:
+        source = py_file.read_bytes()
+        record_read(py_file, len(source))
+    try:
+        # Bytes, so a PEP 263 coding declaration is honoured
+        compile(source, str(py_file), "exec", dont_inherit=True)
+    except SyntaxError as e:
+        return f"line {e.lineno}: {e.msg}"
+    except ValueError as e:  # Null bytes
+        return str(e)
+    return None
+
+
+def shell_syntax_error(script: Path, source: Optional[bytes] = None) -> Optional[str]:
+    """
+    Return the first `bash -n` diagnostic for a script, else None.
+
+    Args:
+        script: Script path (only names the script when source is given)
+        source: Script content, checked from stdin instead of reading script
+    """
+    bash = shutil.which("bash")
+    if bash is None:
+        return None  # Nothing to check with
+    if source is None:
+        command, prefix = [bash, "-n", str(script)], f"{script}: "
+    else:
+        # Diagnostics for stdin are prefixed with argv[0]
+        command, prefix = ["bash", "-n"], "bash: "
+    try:
+        completed = subprocess.run(
+            command,
+            executable=bash,
+            input=source,
+            capture_output=True,
+            timeout=SHELL_TIMEOUT,
+        )
+    except subprocess.TimeoutExpired:
+        return SHELL_TIMEOUT_ERROR
+    if completed.returncode == 0:
+        return None
+    lines = completed.stderr.decode(errors="replace").strip().splitlines()
+    message = lines[0] if lines else f"bash -n exited {completed.returncode}"
+    # "path: line 3: syntax error ..." -> "line 3: syntax error ..."
+    return message.split(prefix, 1)[-1]
+
+
+def check_script(path: str) -> dict:
+    """Check one script (pool task); returns {"error", "elapsed_ms"}."""
+    start = time.perf_counter()
+    script = Path(path)
+    if script_kind(script) == "python":
+        error = python_syntax_error(script)
+    else:
+        error = shell_syntax_error(script)
+    elapsed_ms = round((time.perf_counter() - start) * 1000, 3)
+    return {"error": error, "elapsed_ms": elapsed_ms}
+
+
+def check_paths(paths: List[str], jobs: Optional[int] = 1) -> List[dict]:
+    """Check scripts, in a process pool when worthwhile; results in order."""
+    jobs = jobs or os.cpu_count() or 1
+    jobs = min(jobs, len(paths) // PARALLEL_MIN_SCRIPTS)
+    if jobs > 1:
+        chunksize = max(1, len(paths) // (jobs * 4))
+        try:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                return list(executor.map(check_script, paths, chunksize=chunksize))
+        except (OSError, BrokenProcessPool):
+            pass  # Check serially (e.g. no multiprocessing support)
+    return [check_script(path) for path in paths]
+
+
+def check_scripts(
+    scripts_dir: Path,
+    shell: bool = False,
+    cache: Optional[ValidationCache] = None,
+    jobs: Optional[int] = 1,
+) -> List[ScriptCheck]:
+    """
+    Check every script below scripts_dir.
+
+    Args:
+        scripts_dir: Directory to search recursively
+        shell: Also check shell scripts with `bash -n`
+        cache: Result cache; unchanged files reuse their stored result
+        jobs: Worker processes (None or 0 for one per CPU, 1 for serial)
+
+    Returns:
+        One ScriptCheck per script, sorted by path
+    """
+    checks = []
+    pending = []  # (check, cache key) of files not in the cache
+    for script in discover_scripts(scripts_dir, shell):
+        kind = script_kind(script)
+        check = ScriptCheck(script.relative_to(scripts_dir).as_posix(), kind)
+        checks.append(check)
+        key = None
+        if cache is not None:
+            key = check_key(kind, cache.file_digest(script, file_sha256))
+            entry = cache.get(key)
+            if entry is not None:
+                check.error = entry["error"]
+                check.cached = True
+                continue
+        pending.append((check, key))
+
+    results = check_paths([str(scripts_dir / c.name) for c, _ in pending], jobs)
+    for (check, key), result in zip(pending, results):
+        check.error = result["error"]
+        check.elapsed_ms = result["elapsed_ms"]
+        if key is not None and is_cacheable(check.kind, check.error):
+            cache.put(key, {"error": check.error})
+
+    return checks
+
+
+def check_sources(
+    sources: Dict[str, bytes],
+    shell: bool = False,
+    cache: Optional[ValidationCache] = None,
+) -> List[ScriptCheck]:
+    """
+    Check scripts held in memory.
+
+    Args:
+        sources: Content of the files below scripts/, keyed by their path
+            relative to it ("lib/util.py"); other files are ignored
+        shell: Also check shell scripts with `bash -n`
+        cache: Result cache, shared with check_scripts() (same keys)
+
+    Returns:
+        One ScriptCheck per script, sorted by path
+    """
+    suffixes = PYTHON_SUFFIXES + (SHELL_SUFFIXES if shell else ())
+    checks = []
+    for name in sorted(sources):
+        directories = name.split("/")[:-1]
+        if not name.endswith(suffixes) or SKIPPED_DIRS.intersection(directories):
+            continue
+        kind = script_kind(Path(name))
+        check = ScriptCheck(name, kind)
+        checks.append(check)
+        source = sources[name]
+        key = None
+        if cache is not None:
+            key = check_key(kind, hashlib.sha256(source).hexdigest())
+            entry = cache.get(key)
+            if entry is not None:
+                check.error = entry["error"]
+                check.cached = True
+                continue
+
+        start = time.perf_counter()
+        if kind == "python":
+            check.error = python_syntax_error(Path(name), source)
+        else:
+            check.error = shell_syntax_error(Path(name), source)
+        check.elapsed_ms = round((time.perf_counter() - start) * 1000, 3)
+        if key is not None and is_cacheable(kind, check.error):
+            cache.put(key, {"error": check.error})
+
+    return checks
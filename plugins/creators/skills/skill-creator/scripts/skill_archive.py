@@ -0,0 +1,589 @@
+#!/usr/bin/env python3
+# /// script
+# dependencies = []
+# ///
+"""
+Reproducible .skill archives.
+
+A .skill file is a zip of the skill folder. Archives are built
+deterministically so the same inputs give the same bytes and can be cached
+or deduplicated by content: entries are sorted, timestamps fixed, modes
+normalized (0644, or 0755 for executables) and the compression level
+recorded.
+
+Every archive embeds a manifest, `<skill>/.skill-manifest.json`, as its
+first member:
+
+    {
+      "format": 1,
+      "skill": "my-skill",
+      "compression_level": 6,
+      "digest": "<sha256 of skill + files below>",
+      "files": {"my-skill/SKILL.md": {"sha256": "...", "size": 1234,
+                                      "mode": "0644"}, ...}
+    }
+
+The digest identifies the package contents; when it matches the manifest
+of an existing archive built at the same level, the build can be skipped:
+
+    files = collect_files(skill_path)
+    manifest = build_manifest(skill_path.name, files)
+    if not archive_up_to_date(output, manifest):
+        write_archive(output, files, manifest)
+
+Compression policy: already-compressed formats (images, audio, video,
+archives, fonts) are stored as is, and so is any file deflate does not
+shrink. Members are read and deflated in a thread pool (zlib releases the
+GIL) and appended in archive order, so the output does not depend on the
+number of threads. zipfile cannot append data compressed elsewhere, so the
+zip container is written here; it has no ZIP64 support (members and the
+archive must stay under 4 GiB).
+
+read_archive() reads an archive back in one streaming pass, checking each
+member against the manifest as it goes, and keeps the members in memory;
+ArchiveTree serves them to the validation checks like a directory on disk:
+
+    contents = read_archive(Path("my-skill.skill"))
+    result = validate_skill(contents.skill, tree=contents.tree())
+"""
+
+import errno
+import hashlib
+import json
+import os
+import stat
+import struct
+import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from skill_document import SkillDocument, parse_document
+from skill_tree import SkillTree
+from tracing import bind, record_read, span
+
+MANIFEST_NAME = ".skill-manifest.json"
+MANIFEST_FORMAT = 1
+# zlib's default. 0 stores every member uncompressed
+COMPRESSION_LEVEL = 6
+FILE_MODE = 0o644
+EXECUTABLE_MODE = 0o755
+# Formats that are compressed already; deflating them only costs time
+STORED_SUFFIXES = frozenset(
+    {
+        # Images
+        ".png", ".jpg", ".jpeg", ".gif", ".webp", ".avif", ".heic", ".ico",
+        # Audio and video
+        ".mp3", ".m4a", ".aac", ".ogg", ".opus", ".flac",
+        ".mp4", ".m4v", ".mov", ".webm", ".mkv", ".avi",
+        # Archives and packages
+        ".zip", ".gz", ".tgz", ".bz2", ".xz", ".zst", ".7z", ".rar",
+        ".jar", ".whl", ".skill",
+        # Documents and fonts with compressed streams
+        ".pdf", ".docx", ".xlsx", ".pptx", ".woff", ".woff2",
+    }
+)  # fmt: skip
+# Below this many bytes to deflate a thread pool costs more than it saves
+PARALLEL_MIN_BYTES = 1 << 20
+# Members in flight per worker (bounds memory held by compressed members)
+QUEUE_PER_WORKER = 2
+
+# Largest total uncompressed size read_archive() holds in memory
+MAX_UNPACKED_BYTES = 1 << 30
+
+# Zip container records (APPNOTE.TXT 4.3.7, 4.3.12, 4.3.16)
+_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+_CENTRAL_HEADER = struct.Struct("<4s4B4HL2L5H2L")
+_END_OF_CENTRAL_DIR = struct.Struct("<4s4H2LH")
+_VERSION = 20  # 2.0: deflate, directories
+_UNIX = 3  # "Version made by" host system: external attributes are Unix modes
+_UTF8_FLAG = 0x800
+_DOS_EPOCH = (0, (1 << 5) | 1)  # (time, date) of 1980-01-01 00:00:00
+_ZIP32_LIMIT = 0xFFFFFFFF
+
+
+def is_packaged(parts: Tuple[str, ...]) -> bool:
+    """Check if a skill-relative path belongs in the package."""
+    return not any(part.startswith(".") or part == "__pycache__" for part in parts)
+
+
+def collect_files(
+    skill_path: Path, exclude: Optional[Path] = None
+) -> List[Tuple[str, Path]]:
+    """
+    List the files to package, sorted by archive name.
+
+    Hidden files and directories and __pycache__ are skipped.
+
+    Args:
+        skill_path: Skill folder
+        exclude: A file never to include (e.g. the output archive itself)
+
+    Returns:
+        (archive name, path) pairs; archive names start with the folder name
+    """
+    skill_path = Path(skill_path)
+    files = []
+    for file_path in skill_path.rglob("*"):
+        relative = file_path.relative_to(skill_path)
+        if not is_packaged(relative.parts) or not file_path.is_file():
+            continue
+        if exclude is not None and file_path.resolve() == exclude:
+            continue
+        files.append((f"{skill_path.name}/{relative.as_posix()}", file_path))
+    return sorted(files)
+
+
+def file_mode(path: Path) -> int:
+    """Return the normalized permission bits of a file."""
+    executable = path.stat().st_mode & (stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return EXECUTABLE_MODE if executable else FILE_MODE
+
+
+def resolve_jobs(jobs: Optional[int]) -> int:
+    """Return the number of threads to use (None or 0: one per CPU)."""
+    return max(1, jobs or os.cpu_count() or 1)
+
+
+def hash_entry(path: Path) -> dict:
+    """Return the manifest entry of one file."""
+    data = path.read_bytes()
+    record_read(path, len(data))
+    return {
+        "sha256": hashlib.sha256(data).hexdigest(),
+        "size": len(data),
+        "mode": f"{file_mode(path):04o}",
+    }
+
+
+def manifest_digest(skill_name: str, entries: dict) -> str:
+    """Return the content digest of a skill name and its file entries."""
+    canonical = json.dumps(
+        {"skill": skill_name, "files": entries}, sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def build_manifest(
+    skill_name: str,
+    files: List[Tuple[str, Path]],
+    compression_level: int = COMPRESSION_LEVEL,
+    jobs: Optional[int] = 1,
+) -> dict:
+    """Hash every file to package (in threads) and return the manifest."""
+    paths = [path for _, path in files]
+    with span("hash files", files=len(paths)):
+        with ThreadPoolExecutor(max_workers=resolve_jobs(jobs)) as executor:
+            hashed = list(executor.map(bind(hash_entry), paths))
+    entries = {arcname: entry for (arcname, _), entry in zip(files, hashed)}
+    return {
+        "format": MANIFEST_FORMAT,
+        "skill": skill_name,
+        "compression_level": compression_level,
+        "digest": manifest_digest(skill_name, entries),
+        "files": entries,
+    }
+
+
+def manifest_arcname(skill_name: str) -> str:
+    return f"{skill_name}/{MANIFEST_NAME}"
+
+
+def read_manifest(archive_path: Path, skill_name: str) -> Optional[dict]:
+    """Return the manifest embedded in an archive, or None if unreadable."""
+    try:
+        with zipfile.ZipFile(archive_path) as archive:
+            data = archive.read(manifest_arcname(skill_name))
+            record_read(archive_path, len(data))
+            manifest = json.loads(data)
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+        return None
+    return manifest if isinstance(manifest, dict) else None
+
+
+def archive_up_to_date(archive_path: Path, manifest: dict) -> bool:
+    """Check if archive_path was built from the same contents as manifest."""
+    with span("read manifest"):
+        existing = read_manifest(archive_path, manifest["skill"])
+    return (
+        existing is not None
+        and existing.get("format") == MANIFEST_FORMAT
+        and existing.get("digest") == manifest["digest"]
+        and existing.get("compression_level", COMPRESSION_LEVEL)
+        == manifest.get("compression_level", COMPRESSION_LEVEL)
+    )
+
+
+def is_incompressible(arcname: str) -> bool:
+    """Check if a member is in an already-compressed format."""
+    return os.path.splitext(arcname)[1].lower() in STORED_SUFFIXES
+
+
+@dataclass
+class Member:
+    """One archive member, compressed and ready to append."""
+
+    arcname: str
+    mode: int
+    method: int  # zipfile.ZIP_STORED or zipfile.ZIP_DEFLATED
+    crc: int
+    size: int
+    data: bytes  # As stored in the archive
+
+
+def compress_member(arcname: str, data: bytes, mode: int, level: int) -> Member:
+    """Compress one member's data according to the compression policy."""
+    crc = zlib.crc32(data)
+    if level > 0 and data and not is_incompressible(arcname):
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+        deflated = compressor.compress(data) + compressor.flush()
+        if len(deflated) < len(data):
+            return Member(arcname, mode, zipfile.ZIP_DEFLATED, crc, len(data), deflated)
+    return Member(arcname, mode, zipfile.ZIP_STORED, crc, len(data), data)
+
+
+def read_and_compress(arcname: str, path: Path, entry: dict, level: int) -> Member:
+    """
+    Read and compress one file, checking it against its manifest entry.
+
+    Raises:
+        ValueError: If the file changed since the manifest was built (the
+            archive would not match its own manifest)
+    """
+    data = path.read_bytes()
+    record_read(path, len(data))
+    if hashlib.sha256(data).hexdigest() != entry["sha256"]:
+        raise ValueError(f"{arcname}: file changed while packaging; rebuild")
+    return compress_member(arcname, data, int(entry["mode"], 8), level)
+
+
+def compressed_members(
+    files: List[Tuple[str, Path]], manifest: dict, level: int, jobs: Optional[int]
+) -> Iterator[Member]:
+    """
+    Yield the archive members in order, compressing ahead in threads when
+    there is enough data to deflate.
+    """
+    tasks = [
+        (arcname, path, manifest["files"][arcname], level) for arcname, path in files
+    ]
+    deflated_bytes = sum(
+        manifest["files"][arcname]["size"]
+        for arcname, _ in files
+        if not is_incompressible(arcname)
+    )
+    jobs = resolve_jobs(jobs)
+    if jobs == 1 or level == 0 or deflated_bytes < PARALLEL_MIN_BYTES:
+        for task in tasks:
+            yield read_and_compress(*task)
+        return
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        pending = deque()
+        for task in tasks:
+            pending.append(executor.submit(bind(read_and_compress), *task))
+            if len(pending) >= jobs * QUEUE_PER_WORKER:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+class ZipWriter:
+    """Append-only writer of a plain (non-ZIP64) zip archive."""
+
+    def __init__(self, stream: BinaryIO):
+        self.stream = stream
+        self.offset = 0
+        self.central: List[bytes] = []
+
+    def write(self, data: bytes) -> None:
+        self.stream.write(data)
+        self.offset += len(data)
+
+    def add(self, member: Member) -> None:
+        """Append a member's local header and data."""
+        if max(member.size, len(member.data), self.offset) >= _ZIP32_LIMIT:
+            raise ValueError(f"{member.arcname}: archive exceeds 4 GiB (no ZIP64)")
+        name = member.arcname.encode("utf-8")
+        flags = 0 if member.arcname.isascii() else _UTF8_FLAG
+        common = (
+            flags,
+            member.method,
+            *_DOS_EPOCH,
+            member.crc,
+            len(member.data),
+            member.size,
+            len(name),
+        )
+        header = _LOCAL_HEADER.pack(b"PK\003\004", _VERSION, 0, *common, 0)
+        self.central.append(
+            _CENTRAL_HEADER.pack(
+                b"PK\001\002",
+                _VERSION,
+                _UNIX,
+                _VERSION,
+                0,
+                *common,
+                0,  # Extra field length
+                0,  # Comment length
+                0,  # Disk number
+                0,  # Internal attributes
+                (stat.S_IFREG | member.mode) << 16,
+                self.offset,
+            )
+            + name
+        )
+        self.write(header + name)
+        self.write(member.data)
+
+    def close(self) -> None:
+        """Write the central directory and end record."""
+        if len(self.central) >= 0xFFFF or self.offset >= _ZIP32_LIMIT:
+            raise ValueError("Too many members for a zip without ZIP64")
+        start = self.offset
+        directory = b"".join(self.central)
+        self.write(directory)
+        count = len(self.central)
+        self.write(
+            _END_OF_CENTRAL_DIR.pack(
+                b"PK\005\006", 0, 0, count, count, len(directory), start, 0
+            )
+        )
+
+
+def write_archive(
+    archive_path: Path,
+    files: List[Tuple[str, Path]],
+    manifest: dict,
+    jobs: Optional[int] = 1,
+) -> None:
+    """
+    Write a deterministic archive of files with manifest as its first member.
+
+    The compression level is taken from the manifest. The archive is
+    written to a temporary file and moved into place, so an interrupted
+    build never leaves a partial archive behind. A file whose content no
+    longer matches the manifest fails the build (ValueError).
+
+    Args:
+        archive_path: Output .skill file
+        files: (archive name, path) pairs from collect_files()
+        manifest: Manifest of files from build_manifest()
+        jobs: Compression threads (None or 0 for one per CPU, 1 for serial)
+    """
+    archive_path = Path(archive_path)
+    level = manifest.get("compression_level", COMPRESSION_LEVEL)
+    temp_path = archive_path.with_name(f".{archive_path.name}.{os.getpid()}.tmp")
+    try:
+        with span("write archive", files=len(files)), open(temp_path, "wb") as stream:
+            writer = ZipWriter(stream)
+            manifest_json = json.dumps(manifest, indent=2, sort_keys=True) + "\n"
+            writer.add(
+                compress_member(
+                    manifest_arcname(manifest["skill"]),
+                    manifest_json.encode("utf-8"),
+                    FILE_MODE,
+                    level,
+                )
+            )
+            for member in compressed_members(files, manifest, level, jobs):
+                writer.add(member)
+            writer.close()
+        temp_path.replace(archive_path)
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
+
+
+@dataclass
+class ArchiveContents:
+    """Members of a .skill archive, read and checked against its manifest."""
+
+    path: str
+    skill: str = ""
+    # Skill-relative path -> content (the manifest itself excluded)
+    members: Dict[str, bytes] = field(default_factory=dict, repr=False)
+    manifest: Optional[dict] = None
+    errors: List[str] = field(default_factory=list)
+
+    def tree(self) -> "ArchiveTree":
+        return ArchiveTree(self.skill, self.members)
+
+    def to_dict(self) -> dict:
+        return {
+            "path": self.path,
+            "skill": self.skill,
+            "files": len(self.members),
+            "digest": (self.manifest or {}).get("digest"),
+            "errors": self.errors,
+        }
+
+
+def unsafe_name(name: str) -> bool:
+    """Check if a member name could escape the extraction directory."""
+    return (
+        name.startswith("/")
+        or "\\" in name
+        or (len(name) > 1 and name[1] == ":")
+        or ".." in name.split("/")
+    )
+
+
+def read_archive(archive_path: Path) -> ArchiveContents:
+    """
+    Read a .skill archive in one pass, verifying it against its manifest.
+
+    Every member is read once (zipfile checks its CRC), hashed and kept in
+    memory. The manifest is the first member of archives built by
+    write_archive(), so members are compared as they are read; a manifest
+    found later is checked against the hashes collected so far.
+
+    Problems (unreadable archive, unsafe or stray member names, hash, size
+    or mode mismatches, missing members) are listed in errors. An archive
+    without a manifest has nothing to verify its contents against and
+    reports that as an error too.
+    """
+    contents = ArchiveContents(str(archive_path))
+    errors = contents.errors
+    record_read(archive_path)
+    try:
+        archive = zipfile.ZipFile(archive_path)
+    except (OSError, zipfile.BadZipFile) as e:
+        errors.append(f"Cannot open archive: {e}")
+        return contents
+
+    with archive:
+        infos = [info for info in archive.infolist() if not info.is_dir()]
+        roots = {info.filename.split("/", 1)[0] for info in infos}
+        if len(roots) != 1 or not all("/" in info.filename for info in infos):
+            errors.append(
+                "Expected every member below one skill folder, found: "
+                + ", ".join(sorted(roots) or ["(empty archive)"])
+            )
+            return contents
+        if sum(info.file_size for info in infos) > MAX_UNPACKED_BYTES:
+            errors.append(f"Unpacks to more than {MAX_UNPACKED_BYTES:,} bytes")
+            return contents
+
+        contents.skill = skill = roots.pop()
+        manifest_name = manifest_arcname(skill)
+        expected: Dict[str, dict] = {}
+        # name -> {sha256, size, mode}; mode None if the archive has no
+        # Unix permissions (written on another system)
+        hashes: Dict[str, dict] = {}
+
+        def compare(name: str, actual: dict) -> None:
+            entry = expected.get(name)
+            if not isinstance(entry, dict):
+                errors.append(f"{name}: not in manifest")
+                return
+            for label, value in actual.items():
+                if value is not None and value != entry.get(label):
+                    errors.append(
+                        f"{name}: {label} {value} != manifest {entry.get(label)}"
+                    )
+
+        for info in infos:
+            name = info.filename
+            if unsafe_name(name):
+                errors.append(f"{name}: unsafe member name")
+                continue
+            try:
+                data = archive.read(info)
+            except (OSError, zipfile.BadZipFile, zlib.error) as e:
+                errors.append(f"{name}: unreadable ({e})")
+                continue
+
+            if name == manifest_name:
+                try:
+                    manifest = json.loads(data)
+                except ValueError as e:
+                    errors.append(f"{name}: invalid JSON ({e})")
+                    continue
+                if not isinstance(manifest, dict):
+                    errors.append(f"{name}: not a JSON object")
+                    continue
+                contents.manifest = manifest
+                expected = manifest.get("files")
+                if not isinstance(expected, dict):
+                    expected = {}
+                for seen, actual in hashes.items():
+                    compare(seen, actual)
+                continue
+
+            mode = (info.external_attr >> 16) & 0o777
+            actual = {
+                "sha256": hashlib.sha256(data).hexdigest(),
+                "size": len(data),
+                "mode": f"{mode:04o}" if info.create_system == _UNIX else None,
+            }
+            hashes[name] = actual
+            if contents.manifest is not None:
+                compare(name, actual)
+            contents.members[name[len(skill) + 1 :]] = data
+
+        manifest = contents.manifest
+        if manifest is None:
+            errors.append(f"No manifest ({manifest_name}); contents not verified")
+            return contents
+        if manifest.get("format") != MANIFEST_FORMAT:
+            errors.append(f"Unsupported manifest format: {manifest.get('format')}")
+        if manifest.get("skill") != skill:
+            errors.append(f"Manifest is for skill {manifest.get('skill')!r}")
+        if manifest_digest(manifest.get("skill"), expected) != manifest.get("digest"):
+            errors.append("Manifest digest does not match its file list")
+        for name in sorted(set(expected) - set(hashes)):
+            errors.append(f"{name}: listed in manifest but missing")
+
+    return contents
+
+
+class ArchiveTree(SkillTree):
+    """SkillTree over archive members held in memory (no filesystem access)."""
+
+    on_disk = False
+
+    def __init__(self, skill: str, members: Dict[str, bytes]):
+        super().__init__(Path(skill))
+        self.members = members
+
+    def _scan(self):
+        if self._files is None:
+            self._files = set(self.members)
+            self._dirs = {""}
+            for rel in self._files:
+                parts = rel.split("/")
+                self._dirs.update("/".join(parts[:i]) for i in range(1, len(parts)))
+        return self._files
+
+    def exists(self, path: str) -> bool:
+        normalized = self.normalize(path)
+        files = self._scan()
+        return normalized is not None and (
+            normalized in files or normalized in self._dirs
+        )
+
+    def is_file(self, path: str) -> bool:
+        normalized = self.normalize(path)
+        return normalized is not None and normalized in self._scan()
+
+    def read_bytes(self, path: str) -> bytes:
+        normalized = self.normalize(path)
+        if normalized not in self.members:
+            raise FileNotFoundError(errno.ENOENT, "Not in archive", path)
+        return self.members[normalized]
+
+    def read_text(self, path: str) -> str:
+        # Universal newlines, as Path.read_text() reads extracted files
+        text = self.read_bytes(path).decode("utf-8")
+        return text.replace("\r\n", "\n").replace("\r", "\n")
+
+    def document(self, path: str) -> SkillDocument:
+        return parse_document(self.read_text(path))
+
+    def digest(self, path: str, cache=None, compute=None) -> str:
+        """Return the SHA-256 of a member (no stat to key a cache on)."""
+        return hashlib.sha256(self.read_bytes(path)).hexdigest()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# Recommended: use ./run.sh to execute this script for proper dependency management
+# /// script
+# dependencies = ["pyyaml"]
+# ///
+"""
+Thin client for skill_server.py.
+
+Sends one request to the local validation server and prints the JSON
+result. When no server is listening, the same method runs in-process, so
+callers get identical results either way (just without the warm caches).
+
+Usage:
+    python scripts/skill_client.py validate <skill-dir> [--verbose]
+    python scripts/skill_client.py score <skill-dir-or-SKILL.md>
+    python scripts/skill_client.py duplicates <name> <description> [--threshold 0.5]
+    python scripts/skill_client.py validate-output <analysis.json>
+
+Exit codes: 0 on success, 10 when validation fails, 1 on request errors.
+"""
+
+import sys
+import argparse
+import json
+import socket
+from pathlib import Path
+from typing import Optional
+
+from skill_protocol import SOCKET_PATH, ExitCode, RequestError
+
+# Seconds to wait for a response (the first duplicate check builds the index)
+TIMEOUT = 60.0
+
+
+class ServerUnavailable(Exception):
+    """No server is listening on the socket."""
+
+
+def call_server(method: str, params: dict, socket_path: Path = SOCKET_PATH):
+    """
+    Call a method on the running server.
+
+    Raises:
+        ServerUnavailable: If nothing usable is listening on socket_path
+            (no socket, refused, not ours, or no response within TIMEOUT)
+        RequestError: If the server reports an error
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(TIMEOUT)
+        try:
+            sock.connect(str(socket_path))
+            request = {"id": 1, "method": method, "params": params}
+            sock.sendall(json.dumps(request).encode() + b"\n")
+            with sock.makefile("rb") as stream:
+                line = stream.readline()
+        except (
+            FileNotFoundError,
+            PermissionError,
+            ConnectionError,
+            socket.timeout,
+        ) as e:
+            raise ServerUnavailable(str(e) or type(e).__name__) from e
+
+    if not line:
+        raise ServerUnavailable("Server closed the connection")
+    response = json.loads(line)
+    if "error" in response:
+        error = response["error"]
+        raise RequestError(error.get("type", "Error"), error.get("message", ""))
+    return response.get("result")
+
+
+def call(
+    method: str,
+    params: dict,
+    socket_path: Optional[Path] = SOCKET_PATH,
+    fallback: bool = True,
+):
+    """
+    Call a method on the server, or in-process when it is not running.
+
+    Args:
+        method: Server method name
+        params: Method parameters
+        socket_path: Server socket (None to always run in-process)
+        fallback: Run in-process when no server is listening
+
+    Raises:
+        RequestError: If the method fails
+    """
+    if socket_path is not None:
+        try:
+            return call_server(method, params, socket_path)
+        except ServerUnavailable:
+            if not fallback:
+                raise
+
+    from skill_server import SkillService
+
+    service = SkillService()
+    try:
+        return service.call(method, params)
+    finally:
+        service.save_cache(force=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Call the skill validation server")
+    parser.add_argument(
+        "--socket", type=Path, default=SOCKET_PATH, help="Unix socket path"
+    )
+    parser.add_argument(
+        "--no-fallback",
+        action="store_true",
+        help="Fail instead of running in-process when no server is running",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    validate = subparsers.add_parser("validate", help="Validate a skill")
+    validate.add_argument("path", type=Path, help="Skill directory")
+    validate.add_argument("--verbose", "-v", action="store_true")
+
+    score = subparsers.add_parser("score", help="Calculate the evolution score")
+    score.add_argument("path", type=Path, help="Skill directory or SKILL.md")
+
+    duplicates = subparsers.add_parser("duplicates", help="Find similar skills")
+    duplicates.add_argument("name", help="Skill name")
+    duplicates.add_argument("description", help="Skill description")
+    duplicates.add_argument("--threshold", type=float, default=0.5)
+    duplicates.add_argument("--exclude", type=Path, help="Path to exclude")
+
+    output = subparsers.add_parser(
+        "validate-output", help="Validate an image-insight analysis JSON file"
+    )
+    output.add_argument("path", type=Path, help="Analysis JSON file")
+
+    args = parser.parse_args()
+
+    if args.command == "validate":
+        method = "validate_skill"
+        params = {"path": str(args.path.resolve()), "verbose": args.verbose}
+    elif args.command == "score":
+        method = "calculate_evolution_score"
+        params = {"path": str(args.path.resolve())}
+    elif args.command == "duplicates":
+        method = "check_duplicates"
+        params = {
+            "name": args.name,
+            "description": args.description,
+            "threshold": args.threshold,
+        }
+        if args.exclude:
+            params["exclude"] = str(args.exclude.resolve())
+    else:
+        method = "validate_output"
+        params = {"path": str(args.path.resolve())}
+
+    try:
+        result = call(method, params, args.socket, fallback=not args.no_fallback)
+    except ServerUnavailable:
+        print(f"Error: No server running on {args.socket}", file=sys.stderr)
+        sys.exit(ExitCode.GENERAL_ERROR)
+    except RequestError as e:
+        print(f"Error ({e.type}): {e}", file=sys.stderr)
+        sys.exit(ExitCode.GENERAL_ERROR)
+
+    print(json.dumps(result, indent=2))
+
+    failed = isinstance(result, dict) and (
+        result.get("is_valid") is False or result.get("success") is False
+    )
+    sys.exit(ExitCode.VALIDATION_FAILED if failed else ExitCode.SUCCESS)
+
+
+if __name__ == "__main__":
+    main()
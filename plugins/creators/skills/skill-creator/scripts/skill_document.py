@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+# /// script
+# dependencies = ["pyyaml"]
+# ///
+"""
+Shared SKILL.md document helpers for the skill-creator scripts.
+
+Frontmatter is the block between an opening `---` line and the next line
+starting with `---`:
+
+    ---
+    name: my-skill
+    description: ...
+    ---
+    # Body
+
+read_frontmatter_text() streams a file only up to the closing delimiter, so
+callers that need just the name and description never read the body.
+
+load_document() and parse_document() memoize parsed documents per process,
+keyed by a SHA-256 hash of the content, so validation, scoring and packaging
+of the same SKILL.md share one read and one YAML parse. Cached documents and
+their frontmatter dicts are shared: treat them as read-only. The memos keep
+the most recently used entries only, so long-running processes (--watch,
+skill_server.py) do not hold every revision they have seen.
+"""
+
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from tracing import record_read
+
+# Try to import yaml (preferring the libyaml-backed loader), fallback to simple parser
+try:
+    import yaml
+
+    try:
+        from yaml import CSafeLoader as YAMLLoader
+    except ImportError:
+        from yaml import SafeLoader as YAMLLoader
+
+    HAS_YAML = True
+except ImportError:
+    HAS_YAML = False
+
+# Keys and plain scalars matching these (case-insensitively) resolve to
+# bool/null in YAML 1.1, so the flat fast path leaves them to the full parser
+_YAML_SPECIAL_WORDS = frozenset(
+    ["yes", "no", "true", "false", "on", "off", "null", "~"]
+)
+# A plain scalar starting with one of these is an indicator, a number, a
+# timestamp or otherwise not guaranteed to load as a string
+_PLAIN_UNSAFE_START = frozenset("-?:,[]{}#&*!|>'\"%@`+.0123456789~=<")
+_FLAT_KEY = re.compile(r"[A-Za-z_][A-Za-z0-9_-]*\Z")
+_BLOCK_SCALAR = re.compile(r"[|>][+-]?\Z")
+
+
+@dataclass
+class SkillDocument:
+    """A parsed Markdown document with optional YAML frontmatter."""
+
+    content: str
+    digest: str
+    frontmatter: Optional[dict]
+    body: str
+    error: Optional[str] = None
+
+    @property
+    def name(self) -> str:
+        """Frontmatter name (empty if missing)."""
+        return (self.frontmatter or {}).get("name", "")
+
+    @property
+    def description(self) -> str:
+        """Frontmatter description (empty if missing)."""
+        return (self.frontmatter or {}).get("description", "")
+
+
+class _Memo:
+    """Mapping that evicts its least recently used entries (thread-safe)."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.entries: "OrderedDict[str, object]" = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key: str):
+        with self.lock:
+            value = self.entries.get(key)
+            if value is not None:
+                self.entries.move_to_end(key)
+            return value
+
+    def put(self, key: str, value) -> None:
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+
+# content digest -> parsed document
+_documents = _Memo(maxsize=256)
+# frontmatter text digest -> (parsed frontmatter, error message)
+_frontmatters = _Memo(maxsize=1024)
+# resolved path -> (mtime_ns, size, content digest)
+_file_digests = _Memo(maxsize=1024)
+
+
+def content_digest(text: str) -> str:
+    """Return the SHA-256 hex digest of text."""
+    return hashlib.sha256(text.encode("utf-8", "surrogateescape")).hexdigest()
+
+
+def load_yaml(text: str):
+    """Load YAML with the fastest available safe loader (libyaml if present)."""
+    return yaml.load(text, Loader=YAMLLoader)
+
+
+def _flat_value(value: str) -> Optional[str]:
+    """Return the string a flat YAML value loads as, or None if not trivial."""
+    if not value or not value.isprintable():
+        return None
+
+    quote = value[0]
+    if quote in "'\"":
+        inner = value[1:-1]
+        if len(value) < 2 or value[-1] != quote or quote in inner:
+            return None
+        if quote == '"' and "\\" in inner:
+            return None
+        return inner
+
+    if (
+        value[0] in _PLAIN_UNSAFE_START
+        or value.lower() in _YAML_SPECIAL_WORDS
+        or value.endswith(":")
+        or ": " in value
+        or " #" in value
+    ):
+        return None
+    return value
+
+
+def _flat_block(lines: List[str], separator: str) -> Optional[str]:
+    """Return the string a block scalar loads as (before chomping), or None."""
+    if not lines:
+        return None
+    indent = len(lines[0]) - len(lines[0].lstrip(" "))
+    prefix = " " * indent
+    for line in lines:
+        if (
+            not line.startswith(prefix)
+            or line[indent : indent + 1] in ("", " ", "\t")
+            or not line.isprintable()
+        ):
+            return None
+    return separator.join(line[indent:] for line in lines)
+
+
+def parse_flat_frontmatter(text: str) -> Optional[dict]:
+    """
+    Fast path for flat `key: value` frontmatter.
+
+    Handles the string fields skills and commands use in practice: single-line
+    plain or simply quoted values, and `>` / `|` block scalars (optionally with
+    `-` chomping) whose lines share one indentation. Anything else - nesting,
+    lists, blank lines inside blocks, numbers, booleans, escapes, comments
+    after values - makes it return None so the caller falls back to a full
+    YAML parser. When it does return a dict, it equals what yaml.safe_load()
+    would produce.
+
+    Returns:
+        Parsed dictionary, or None if the text is not trivially flat
+    """
+    if "\r" in text:
+        text = text.replace("\r\n", "\n")
+        if "\r" in text:
+            return None
+
+    lines = text.split("\n")
+    result = {}
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        i += 1
+        if not line:
+            continue
+        if line.startswith("#"):
+            # Comments may hide YAML line breaks (e.g. U+2028)
+            if not line.isprintable():
+                return None
+            continue
+        key, sep, value = line.partition(":")
+        if (
+            not sep
+            or not _FLAT_KEY.match(key)
+            or key.lower() in _YAML_SPECIAL_WORDS
+            or (value and value[0] != " ")
+        ):
+            return None
+        value = value.strip(" ")
+        if value in (">", "|", ">-", "|-"):
+            style, start = value, i
+            while i < len(lines) and lines[i].startswith(" "):
+                i += 1
+            value = _flat_block(lines[start:i], " " if style[0] == ">" else "\n")
+            # Clip chomping keeps the final line break, if there is one
+            if value is not None and len(style) == 1 and i < len(lines):
+                value += "\n"
+        else:
+            value = _flat_value(value)
+        if value is None:
+            return None
+        result[key] = value
+
+    return result or None
+
+
+def parse_yaml_simple(text: str) -> dict:
+    """
+    Simple YAML parser fallback for when PyYAML is not installed.
+
+    Supports top-level `key: value` pairs, quoted values, plain values
+    continued on indented lines, and `|` / `>` block scalars. Nested
+    structures are not parsed.
+    """
+    result = {}
+    key = None
+    style = None
+    lines: List[str] = []
+
+    def flush():
+        if key is None:
+            return
+        if style and style[0] == "|":
+            value = "\n".join(lines).rstrip("\n")
+        else:
+            # Plain and folded scalars: line breaks fold to spaces,
+            # blank lines become newlines
+            value = ""
+            for line in lines:
+                if not line:
+                    value += "\n"
+                elif value and not value.endswith("\n"):
+                    value += " " + line
+                else:
+                    value += line
+            value = value.strip("\n")
+        if style and not style.endswith("-"):
+            value += "\n"
+        if not style and len(value) >= 2 and value[0] == value[-1] in "'\"":
+            value = value[1:-1]
+        result[key] = value
+
+    indent = None
+    for raw_line in text.split("\n"):
+        line = raw_line.rstrip()
+        stripped = line.strip()
+        if line.startswith((" ", "\t")) or (not stripped and key is not None):
+            if key is None:
+                continue
+            if not stripped:
+                lines.append("")
+                continue
+            if style and style[0] == "|":
+                if indent is None:
+                    indent = len(line) - len(line.lstrip())
+                lines.append(line[indent:])
+            else:
+                lines.append(stripped)
+            continue
+        if not stripped or stripped.startswith("#") or ":" not in line:
+            continue
+
+        flush()
+        key, value = line.split(":", 1)
+        key, value = key.strip(), value.strip()
+        indent = None
+        if _BLOCK_SCALAR.match(value):
+            style, lines = value, []
+        else:
+            style, lines = None, [value] if value else []
+    flush()
+
+    return result
+
+
+def parse_frontmatter(frontmatter_text: str) -> dict:
+    """
+    Parse frontmatter text (memoized by content hash).
+
+    Raises:
+        ValueError: If the text is not valid YAML or not a dictionary
+    """
+    key = content_digest(frontmatter_text)
+    parsed = _frontmatters.get(key)
+    if parsed is None:
+        try:
+            frontmatter = parse_flat_frontmatter(frontmatter_text)
+            if frontmatter is None and HAS_YAML:
+                frontmatter = load_yaml(frontmatter_text)
+            elif frontmatter is None:
+                frontmatter = parse_yaml_simple(frontmatter_text)
+        except Exception as e:
+            parsed = (None, f"Invalid YAML in frontmatter: {e}")
+        else:
+            if isinstance(frontmatter, dict):
+                parsed = (frontmatter, None)
+            else:
+                parsed = (None, "Frontmatter must be a YAML dictionary")
+        _frontmatters.put(key, parsed)
+
+    frontmatter, error = parsed
+    if error:
+        raise ValueError(error)
+    return frontmatter
+
+
+def is_opening_delimiter(line: str) -> bool:
+    """Check if a line opens a frontmatter block."""
+    return line.rstrip("\r\n") == "---"
+
+
+def read_frontmatter_text(path: Path) -> Optional[str]:
+    """
+    Read only the frontmatter block of a Markdown file.
+
+    Returns:
+        Frontmatter text without delimiters, or None if the file does not
+        start with a complete frontmatter block
+    """
+    with open(path, encoding="utf-8") as f:
+        try:
+            if not is_opening_delimiter(f.readline()):
+                return None
+
+            lines = []
+            for line in f:
+                if line.startswith("---"):
+                    return "".join(lines)[:-1]
+                lines.append(line)
+        finally:
+            record_read(path, f.buffer.raw.tell())  # Buffered, not parsed
+
+    return None
+
+
+def split_frontmatter(content: str) -> Optional[Tuple[str, str]]:
+    """
+    Split document content into frontmatter text and body.
+
+    Returns:
+        (frontmatter_text, body) where body starts right after the closing
+        `---`, or None if content does not start with a complete block
+    """
+    first_line_end = content.find("\n")
+    if first_line_end < 0 or not is_opening_delimiter(content[: first_line_end + 1]):
+        return None
+
+    close = content.find("\n---", first_line_end)
+    if close < 0:
+        return None
+
+    return content[first_line_end + 1 : close], content[close + 4 :]
+
+
+def extract_frontmatter(content: str) -> Tuple[dict, str]:
+    """
+    Extract YAML frontmatter from content.
+
+    Returns:
+        (frontmatter, body)
+
+    Raises:
+        ValueError: If frontmatter is missing, malformed or not a dictionary
+    """
+    if not content.startswith("---"):
+        raise ValueError("No YAML frontmatter found")
+
+    parts = split_frontmatter(content)
+    if parts is None:
+        raise ValueError("Invalid frontmatter format")
+
+    frontmatter_text, body = parts
+    return parse_frontmatter(frontmatter_text), body
+
+
+def parse_document(content: str) -> SkillDocument:
+    """Parse document content (memoized by content hash)."""
+    digest = content_digest(content)
+    document = _documents.get(digest)
+    if document is None:
+        try:
+            frontmatter, body = extract_frontmatter(content)
+            error = None
+        except ValueError as e:
+            frontmatter, body, error = None, content, str(e)
+        document = SkillDocument(content, digest, frontmatter, body, error)
+        _documents.put(digest, document)
+    return document
+
+
+def load_document(path: Path) -> SkillDocument:
+    """
+    Read and parse a document, reusing the cache for unchanged files.
+
+    A file whose mtime and size match an earlier read in this process is not
+    read again.
+    """
+    key = os.path.realpath(path)
+    stat = os.stat(key)
+    known = _file_digests.get(key)
+    if known and known[:2] == (stat.st_mtime_ns, stat.st_size):
+        document = _documents.get(known[2])
+        if document is not None:
+            return document
+
+    document = parse_document(Path(key).read_text(encoding="utf-8"))
+    record_read(key, stat.st_size)
+    _file_digests.put(key, (stat.st_mtime_ns, stat.st_size, document.digest))
+    return document
+
+
+def read_frontmatter(path: Path) -> Optional[dict]:
+    """Read and parse only the frontmatter of a file, or None if invalid."""
+    frontmatter_text = read_frontmatter_text(path)
+    if frontmatter_text is None:
+        return None
+    try:
+        return parse_frontmatter(frontmatter_text)
+    except ValueError:
+        return None
+
+
+def clear_cache() -> None:
+    """Drop all memoized documents (e.g. on a long-running server's rescan)."""
+    _documents.clear()
+    _frontmatters.clear()
+    _file_digests.clear()
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+# /// script
+# dependencies = []
+# ///
+"""
+Wire-level definitions shared by skill_server.py and skill_client.py.
+
+Kept free of the validation modules, so the client starts without importing
+them when a server answers its request.
+"""
+
+from pathlib import Path
+from enum import IntEnum
+
+SOCKET_PATH = Path.home() / ".claude" / "skills" / ".state" / "skill-server.sock"
+
+
+class ExitCode(IntEnum):
+    SUCCESS = 0
+    GENERAL_ERROR = 1
+    INVALID_ARGUMENTS = 2
+    FILE_NOT_FOUND = 3
+    VALIDATION_FAILED = 10
+
+
+class RequestError(Exception):
+    """Error reported to the client as {"type": ..., "message": ...}."""
+
+    def __init__(self, error_type: str, message: str):
+        super().__init__(message)
+        self.type = error_type
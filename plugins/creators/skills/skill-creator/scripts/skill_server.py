@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+# Recommended: use ./run.sh to execute this script for proper dependency management
+# /// script
+# dependencies = ["pyyaml"]
+# ///
+"""
+Local validation server with a JSON-over-Unix-socket API.
+
+Keeps PyYAML, parsed documents, the validation result cache, the duplicate
+index and compiled regexes resident, so editor integrations and hooks avoid
+paying interpreter start-up on every save. Use skill_client.py to call it;
+the client runs the same methods in-process when no server is listening.
+
+Protocol: one JSON object per line in each direction.
+
+    -> {"id": 1, "method": "validate_skill", "params": {"path": "my-skill"}}
+    <- {"id": 1, "result": {"passed": [...], "is_valid": true, ...}}
+    <- {"id": 1, "error": {"type": "InvalidParams", "message": "..."}}
+
+Methods:
+    validate_skill             {path, verbose?, shell?, timings?, deep?,
+                                context?, budget_fail?,
+                                budget?: {skill_md?, reference?, total?}}
+    calculate_evolution_score  {path} or {content}
+    check_duplicates           {name, description, threshold?, exclude?}
+    validate_output            {path}  (image-insight analysis JSON)
+    ping                       {}
+    shutdown                   {}
+
+Usage:
+    python scripts/skill_server.py serve [--socket PATH]
+    python scripts/skill_server.py status|stop [--socket PATH]
+"""
+
+import sys
+import argparse
+import importlib.util
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from skill_document import clear_cache, load_document
+from skill_protocol import SOCKET_PATH, ExitCode, RequestError
+
+# Re-scan the skill search paths for the duplicate index at most this often
+DUPLICATE_INDEX_TTL = 30.0
+# Drop documents memoized by earlier requests at least this often (clients
+# may send any path, so the memos would otherwise fill with stale documents)
+DOCUMENT_MEMO_TTL = 30.0
+# Persist new validation cache entries at most this often
+CACHE_SAVE_INTERVAL = 60.0
+# Largest request line accepted (bytes)
+MAX_REQUEST_BYTES = 1 << 20
+
+# image-insight's validator, relative to this repo and to installed skills
+IMAGE_INSIGHT_VALIDATOR = Path("image-insight") / "scripts" / "validate_output.py"
+IMAGE_INSIGHT_CANDIDATES = [
+    Path(__file__).resolve().parents[4] / "task-forge" / "skills",
+    Path.home() / ".claude" / "skills",
+]
+
+
+def require(params: dict, name: str):
+    """Return a required request parameter."""
+    if name not in params:
+        raise RequestError("InvalidParams", f"Missing parameter: {name}")
+    return params[name]
+
+
+def load_image_validator():
+    """Import image-insight's validate_output module by file path."""
+    for base in IMAGE_INSIGHT_CANDIDATES:
+        path = base / IMAGE_INSIGHT_VALIDATOR
+        if path.is_file():
+            spec = importlib.util.spec_from_file_location(
+                "image_insight_validate", path
+            )
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            return module
+    raise RequestError("Unavailable", "image-insight validate_output.py not found")
+
+
+class SkillService:
+    """The methods served over the socket, with their resident state."""
+
+    def __init__(self, use_cache: bool = True):
+        from quick_validate import open_cache
+        from validation_cache import ValidationCache
+
+        self.cache = open_cache() if use_cache else ValidationCache(None)
+        self.cache_saved_at = time.monotonic()
+        self.duplicate_index = None
+        self.duplicate_index_at = 0.0
+        self.memos_cleared_at = time.monotonic()
+        self.image_validator = None
+        self.started_at = time.monotonic()
+        self.requests = 0
+        self.methods: Dict[str, Callable[[dict], object]] = {
+            "validate_skill": self.validate_skill,
+            "calculate_evolution_score": self.calculate_evolution_score,
+            "check_duplicates": self.check_duplicates,
+            "validate_output": self.validate_output,
+            "ping": self.ping,
+        }
+
+    def call(self, method: str, params: dict):
+        """Run a method and return its JSON-serializable result."""
+        if method not in self.methods:
+            raise RequestError("MethodNotFound", f"Unknown method: {method}")
+        if not isinstance(params, dict):
+            raise RequestError("InvalidParams", "params must be an object")
+        self.requests += 1
+        now = time.monotonic()
+        if now - self.memos_cleared_at > DOCUMENT_MEMO_TTL:
+            clear_cache()
+            self.memos_cleared_at = now
+        return self.methods[method](params)
+
+    def validate_skill(self, params: dict) -> dict:
+        from context_cost import Budget
+        from quick_validate import validate_skill
+
+        path = Path(require(params, "path"))
+        result = validate_skill(
+            path,
+            verbose=bool(params.get("verbose")),
+            cache=self.cache,
+            shell=bool(params.get("shell")),
+            timings=bool(params.get("timings")),
+            deep=bool(params.get("deep")),
+            budget=Budget(**params["budget"]) if "budget" in params else None,
+            budget_fail=bool(params.get("budget_fail")),
+            context=bool(params.get("context")),
+        )
+        self.save_cache()
+        return result.to_dict()
+
+    def calculate_evolution_score(self, params: dict) -> dict:
+        from score_evolution import calculate_evolution_score
+
+        if "content" in params:
+            content = params["content"]
+        else:
+            path = Path(require(params, "path"))
+            skill_md = path if path.is_file() else path / "SKILL.md"
+            if not skill_md.exists():
+                raise RequestError("FileNotFound", f"SKILL.md not found at {skill_md}")
+            content = load_document(skill_md).content
+        return calculate_evolution_score(content).to_dict()
+
+    def check_duplicates(self, params: dict) -> List[dict]:
+        from check_duplicates import (
+            INDEX_PATH,
+            DuplicateIndex,
+            SkillInfo,
+            default_search_paths,
+            discover_skills,
+        )
+
+        name = require(params, "name")
+        description = require(params, "description")
+        threshold = float(params.get("threshold", 0.5))
+        exclude = params.get("exclude")
+
+        now = time.monotonic()
+        if self.duplicate_index is None or now - self.duplicate_index_at > (
+            DUPLICATE_INDEX_TTL
+        ):
+            skills = discover_skills(default_search_paths(), INDEX_PATH)
+            self.duplicate_index = DuplicateIndex(skills)
+            self.duplicate_index_at = now
+
+        skill = SkillInfo(name=name, description=description, path=Path("."))
+        similar = self.duplicate_index.query(
+            skill, threshold, Path(exclude) if exclude else None
+        )
+        similar.sort(key=lambda x: x.total_similarity, reverse=True)
+        return [r.to_dict() for r in similar]
+
+    def validate_output(self, params: dict) -> dict:
+        if self.image_validator is None:
+            self.image_validator = load_image_validator()
+        success, errors, warnings = self.image_validator.validate_output(
+            str(require(params, "path"))
+        )
+        return {"success": success, "errors": errors, "warnings": warnings}
+
+    def ping(self, params: dict) -> dict:
+        return {
+            "pid": os.getpid(),
+            "uptime_s": round(time.monotonic() - self.started_at, 3),
+            "requests": self.requests,
+        }
+
+    def save_cache(self, force: bool = False) -> None:
+        """Persist new cache entries (throttled unless forced)."""
+        now = time.monotonic()
+        if force or now - self.cache_saved_at > CACHE_SAVE_INTERVAL:
+            self.cache.save()
+            self.cache_saved_at = now
+
+
+def handle_request(service: SkillService, line: bytes) -> dict:
+    """Decode one request line and return the response object."""
+    request_id = None
+    try:
+        request = json.loads(line)
+        if not isinstance(request, dict):
+            raise RequestError("InvalidRequest", "Request must be a JSON object")
+        request_id = request.get("id")
+        method = require(request, "method")
+        result = service.call(method, request.get("params") or {})
+        return {"id": request_id, "result": result}
+    except json.JSONDecodeError as e:
+        error = {"type": "ParseError", "message": str(e)}
+    except RequestError as e:
+        error = {"type": e.type, "message": str(e)}
+    except Exception as e:
+        error = {"type": type(e).__name__, "message": str(e)}
+    return {"id": request_id, "error": error}
+
+
+class SkillServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, service: SkillService):
+        self.service = service
+        # Resident state is not thread-safe: run one request at a time
+        self.lock = threading.Lock()
+        super().__init__(str(socket_path), RequestHandler)
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        server = self.server
+        while True:
+            line = self.rfile.readline(MAX_REQUEST_BYTES)
+            if not line:
+                return
+            if not line.strip():
+                continue
+
+            if json_method(line) == "shutdown":
+                self.respond({"id": None, "result": {"stopping": True}})
+                threading.Thread(target=server.shutdown, daemon=True).start()
+                return
+
+            with server.lock:
+                response = handle_request(server.service, line)
+            self.respond(response)
+
+    def respond(self, response: dict) -> None:
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+        self.wfile.flush()
+
+
+def json_method(line: bytes) -> Optional[str]:
+    """Return the method of a request line without validating it."""
+    try:
+        request = json.loads(line)
+    except json.JSONDecodeError:
+        return None
+    return request.get("method") if isinstance(request, dict) else None
+
+
+def server_running(socket_path: Path) -> bool:
+    """Check if a server is accepting connections on socket_path."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(socket_path))
+        except OSError:
+            return False
+    return True
+
+
+def serve(socket_path: Path, use_cache: bool = True) -> int:
+    """Run the server until a shutdown request or Ctrl+C."""
+    if socket_path.exists():
+        if server_running(socket_path):
+            print(f"Error: Server already running on {socket_path}", file=sys.stderr)
+            return ExitCode.GENERAL_ERROR
+        socket_path.unlink()  # Stale socket from a crashed server
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+    service = SkillService(use_cache)
+    old_umask = os.umask(0o177)  # Socket accessible to this user only
+    try:
+        server = SkillServer(socket_path, service)
+    finally:
+        os.umask(old_umask)
+
+    print(f"Listening on {socket_path} (pid {os.getpid()})", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.save_cache(force=True)
+        if socket_path.exists():
+            socket_path.unlink()
+    return ExitCode.SUCCESS
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local skill validation server")
+    parser.add_argument("command", choices=["serve", "status", "stop"])
+    parser.add_argument(
+        "--socket", type=Path, default=SOCKET_PATH, help="Unix socket path"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Keep validation results in memory only",
+    )
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        sys.exit(serve(args.socket, use_cache=not args.no_cache))
+
+    from skill_client import ServerUnavailable, call_server
+
+    try:
+        if args.command == "status":
+            print(json.dumps(call_server("ping", {}, args.socket), indent=2))
+        else:
+            call_server("shutdown", {}, args.socket)
+            print("Server stopped")
+    except ServerUnavailable:
+        print(f"No server running on {args.socket}", file=sys.stderr)
+        sys.exit(ExitCode.GENERAL_ERROR)
+    sys.exit(ExitCode.SUCCESS)
+
+
+if __name__ == "__main__":
+    main()
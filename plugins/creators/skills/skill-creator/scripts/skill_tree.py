@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# /// script
+# dependencies = []
+# ///
+"""
+Directory snapshot of a skill for link checking.
+
+SkillTree lists the skill directory once (on first use) and answers link
+existence from that listing instead of one stat call per link. Hrefs are
+normalized the way a Markdown renderer resolves them: `#fragment` and
+`?query` suffixes are split off, `%XX` escapes decoded and `./`, `../`
+collapsed. Paths the snapshot cannot answer (absolute paths, links leaving
+the skill, and anything below a symlinked or skipped directory) fall back to
+the filesystem.
+
+Checks read files through the tree (read_text(), document(), digest()), so
+a tree served from memory (see skill_archive.ArchiveTree) can stand in for
+a directory on disk.
+
+    tree = SkillTree(skill_path)
+    tree.exists("references/guide.md")
+    "quick-start" in tree.anchors("references/guide.md")
+"""
+
+import os
+import posixpath
+import re
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from urllib.parse import unquote
+
+from markdown_sections import heading_anchors, strip_fenced_code
+from skill_document import SkillDocument, load_document
+from tracing import record_read
+from validation_cache import ValidationCache, file_sha256
+
+# Never descend into these (virtualenvs, caches, vendored packages); links
+# into them are checked against the filesystem
+SKIPPED_DIRS = {".git", "__pycache__", "node_modules", ".venv", "venv"}
+
+_URL_SCHEME = re.compile(r"[a-zA-Z][a-zA-Z0-9+.-]*:")
+# [text](href). Neither part may contain its own opening delimiter, so a
+# failed match never scans past the next link (linear on huge documents)
+_MARKDOWN_LINK = re.compile(r"\[([^\[\]]+)\]\(([^()]+)\)")
+
+
+def split_href(href: str) -> Optional[Tuple[str, str]]:
+    """
+    Split a Markdown link destination into (path, fragment).
+
+    Returns:
+        Decoded path and fragment, or None for external (scheme) links.
+        The path is empty for same-document `#fragment` links.
+    """
+    href = href.strip()
+    if href.startswith("<") and ">" in href:
+        href = href[1 : href.index(">")]
+    else:
+        href = href.split(None, 1)[0] if href else ""  # Drop a "title"
+    if _URL_SCHEME.match(href) and not re.match(r"[a-zA-Z]:[\\/]", href):
+        return None
+
+    path, _, fragment = href.partition("#")
+    path = path.partition("?")[0]
+    return unquote(path), unquote(fragment)
+
+
+def local_link_targets(content: str) -> List[Tuple[str, str, str, str]]:
+    """
+    Return (text, href, path, fragment) for local links outside code blocks.
+
+    External links and same-document `#anchor` links are skipped; path and
+    fragment are the decoded parts of href (see split_href).
+    """
+    # Remove code blocks first to avoid checking example links
+    content_without_code = strip_fenced_code(content)
+
+    # Find markdown links to local files
+    links = _MARKDOWN_LINK.findall(content_without_code)
+
+    targets = []
+    for text, href in links:
+        parts = split_href(href)
+        # Skip external and anchor links
+        if parts is None or not parts[0]:
+            continue
+        targets.append((text, href, *parts))
+
+    return targets
+
+
+class SkillTree:
+    """Listing of every file and directory below a skill root."""
+
+    # False for trees served from memory: no paths to stat or watch
+    on_disk = True
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self._files: Optional[Set[str]] = None
+        self._dirs: Set[str] = set()
+        # Symlinked or skipped directories (contents not listed)
+        self._opaque: Set[str] = set()
+        self._anchors: Dict[str, Set[str]] = {}
+
+    def _scan(self) -> Set[str]:
+        if self._files is None:
+            self._files = set()
+            self._dirs = {""}
+            root = str(self.root)
+            for dirpath, dirnames, filenames in os.walk(root):
+                rel = os.path.relpath(dirpath, root).replace(os.sep, "/")
+                prefix = "" if rel == "." else rel + "/"
+                listed = []
+                for name in dirnames:
+                    if name in SKIPPED_DIRS or os.path.islink(
+                        os.path.join(dirpath, name)
+                    ):
+                        self._opaque.add(prefix + name)
+                    else:
+                        listed.append(name)
+                dirnames[:] = listed
+                self._dirs.update(prefix + name for name in listed)
+                self._files.update(prefix + name for name in filenames)
+        return self._files
+
+    def files(self, suffix: str = "") -> List[str]:
+        """Return the listed files ending in suffix, sorted (root-relative)."""
+        return sorted(path for path in self._scan() if path.endswith(suffix))
+
+    def normalize(self, path: str) -> Optional[str]:
+        """
+        Return path relative to the root with `.` and `..` resolved.
+
+        Returns:
+            Normalized relative path ("" for the root itself), or None if
+            the path is absolute or leaves the skill directory
+        """
+        if not path or path.startswith("/") or os.path.isabs(path):
+            return None
+        normalized = posixpath.normpath(path.replace(os.sep, "/"))
+        if normalized == ".":
+            return ""
+        if normalized == ".." or normalized.startswith("../"):
+            return None
+        return normalized
+
+    def full_path(self, path: str) -> str:
+        """Return the filesystem path of a link target."""
+        normalized = self.normalize(path)
+        if normalized is None:
+            return os.path.normpath(os.path.join(self.root, path))
+        return os.path.join(self.root, normalized)
+
+    def _listed(self, normalized: str) -> bool:
+        """Check if the snapshot covers normalized (not below an opaque dir)."""
+        parts = normalized.split("/")
+        return not any(
+            "/".join(parts[:i]) in self._opaque for i in range(1, len(parts))
+        )
+
+    def exists(self, path: str) -> bool:
+        """Check if a link target exists."""
+        normalized = self.normalize(path)
+        if normalized is None:
+            return os.path.exists(self.full_path(path))
+        files = self._scan()
+        if normalized in files or normalized in self._dirs:
+            return True
+        if normalized in self._opaque or not self._listed(normalized):
+            return os.path.exists(self.full_path(path))
+        return False
+
+    def is_file(self, path: str) -> bool:
+        """Check if a link target is a regular file."""
+        normalized = self.normalize(path)
+        files = self._scan()
+        if normalized is not None and self._listed(normalized):
+            return normalized in files
+        return os.path.isfile(self.full_path(path))
+
+    def read_bytes(self, path: str) -> bytes:
+        data = Path(self.full_path(path)).read_bytes()
+        record_read(self.full_path(path), len(data))
+        return data
+
+    def read_text(self, path: str) -> str:
+        content = Path(self.full_path(path)).read_text(encoding="utf-8")
+        record_read(self.full_path(path))
+        return content
+
+    def document(self, path: str) -> SkillDocument:
+        """Return a parsed Markdown document (see skill_document)."""
+        return load_document(Path(self.full_path(path)))
+
+    def digest(
+        self,
+        path: str,
+        cache: Optional[ValidationCache] = None,
+        compute: Callable[[Path], str] = file_sha256,
+    ) -> str:
+        """Return a content digest of a file (reused while its stat is unchanged)."""
+        full_path = Path(self.full_path(path))
+        if cache is not None:
+            return cache.file_digest(full_path, compute)
+        return compute(full_path)
+
+    def anchors(self, path: str) -> Set[str]:
+        """Return the (lowercase) anchors defined by a Markdown file."""
+        full_path = self.full_path(path)
+        if full_path not in self._anchors:
+            try:
+                content = self.read_text(path)
+            except (OSError, UnicodeDecodeError):
+                content = ""
+            self._anchors[full_path] = heading_anchors(content)
+        return self._anchors[full_path]
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+# /// script
+# dependencies = []
+# ///
+"""
+Phase tracing for the skill-creator scripts.
+
+A trace records the wall time, CPU time, bytes read and files touched of
+every phase and subphase of a run:
+
+    start_tracing()
+    with span("validate"):
+        with span("links"):
+            content = path.read_text()
+            record_read(path)
+    trace = stop_tracing()
+    write_trace(trace, "trace.json")
+
+Spans nest per thread and their counts include those of their subspans.
+Work handed to a thread pool is attributed to the submitting span by
+wrapping it with bind(). Reads are counted where the scripts read files
+(record_read()), in this process only: work done in worker processes is
+not traced.
+
+While no trace is active, span(), bind() and record_read() return at once,
+so instrumented code runs at full speed.
+
+Scripts expose tracing with add_trace_arguments(): `--profile FILE` (or the
+SKILL_CREATOR_TRACE environment variable) writes the JSON trace, and
+`--chrome-trace FILE` a Chrome trace-event file that chrome://tracing and
+https://ui.perfetto.dev display as a timeline.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+TRACE_ENV = "SKILL_CREATOR_TRACE"
+TRACE_VERSION = "1.0"
+
+
+class Span:
+    """One timed phase; counts include those of its subspans."""
+
+    __slots__ = (
+        "name",
+        "parent",
+        "path",
+        "args",
+        "thread",
+        "start",
+        "wall",
+        "cpu",
+        "bytes_read",
+        "files",
+        "_cpu_start",
+    )
+
+    def __init__(self, name: str, parent: Optional["Span"], args: dict):
+        self.name = name
+        self.parent = parent
+        self.path = f"{parent.path}/{name}" if parent else name
+        self.args = args
+        self.thread = threading.current_thread()
+        self.start = 0.0
+        self.wall = 0.0
+        self.cpu = 0.0  # Own thread, plus work bound to the span in pools
+        self.bytes_read = 0
+        self.files = set()
+        self._cpu_start = 0.0
+
+    def to_dict(self, origin: float) -> dict:
+        return {
+            "name": self.name,
+            "path": self.path,
+            "thread": self.thread.name,
+            "start_ms": round((self.start - origin) * 1000, 3),
+            "wall_ms": round(self.wall * 1000, 3),
+            "cpu_ms": round(self.cpu * 1000, 3),
+            "bytes_read": self.bytes_read,
+            "files": len(self.files),
+            "args": self.args,
+        }
+
+
+class Tracer:
+    """Spans of one run."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.spans: List[Span] = []
+        self.started = datetime.now(timezone.utc)
+        self.origin = time.perf_counter()
+        self.cpu_origin = time.process_time()
+        self.wall = 0.0
+        self.cpu = 0.0
+
+    def add(self, span: Optional[Span], nbytes: int, path: str, cpu: float) -> None:
+        """Add reads and pool CPU time to span and its ancestors."""
+        with self.lock:
+            while span is not None:
+                span.bytes_read += nbytes
+                if path:
+                    span.files.add(path)
+                span.cpu += cpu
+                span = span.parent
+
+    def to_dict(self, tool: str = "") -> dict:
+        """
+        JSON trace: every span in start order, and `phases` aggregating the
+        spans of each path (e.g. the same phase of many skills).
+        """
+        spans = sorted(self.spans, key=lambda s: s.start)
+        phases: Dict[str, dict] = {}
+        for span in spans:
+            phase = phases.setdefault(
+                span.path,
+                {"count": 0, "wall_ms": 0.0, "cpu_ms": 0.0, "bytes_read": 0},
+            )
+            phase["count"] += 1
+            phase["wall_ms"] += span.wall * 1000
+            phase["cpu_ms"] += span.cpu * 1000
+            phase["bytes_read"] += span.bytes_read
+        for phase in phases.values():
+            phase["wall_ms"] = round(phase["wall_ms"], 3)
+            phase["cpu_ms"] = round(phase["cpu_ms"], 3)
+
+        return {
+            "version": TRACE_VERSION,
+            "tool": tool,
+            "argv": sys.argv[1:],
+            "pid": os.getpid(),
+            "started": self.started.isoformat(),
+            "wall_ms": round(self.wall * 1000, 3),
+            "cpu_ms": round(self.cpu * 1000, 3),
+            "phases": phases,
+            "spans": [span.to_dict(self.origin) for span in spans],
+        }
+
+    def to_chrome(self) -> dict:
+        """Chrome trace-event format: one complete ("X") event per span."""
+        pid = os.getpid()
+        events = []
+        threads = {}
+        for span in sorted(self.spans, key=lambda s: s.start):
+            threads[span.thread.ident] = span.thread.name
+            args = dict(span.args)
+            args.update(
+                cpu_ms=round(span.cpu * 1000, 3),
+                bytes_read=span.bytes_read,
+                files=len(span.files),
+            )
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.path.split("/", 1)[0],
+                    "ph": "X",
+                    "ts": round((span.start - self.origin) * 1e6, 3),
+                    "dur": round(span.wall * 1e6, 3),
+                    "pid": pid,
+                    "tid": span.thread.ident,
+                    "args": args,
+                }
+            )
+        for tid, name in threads.items():
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"name": name},
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+# Active tracer (None: tracing off) and the current span of each thread
+_tracer: Optional[Tracer] = None
+_local = threading.local()
+
+
+class _SpanContext:
+    """Context manager opening one span on the current thread."""
+
+    __slots__ = ("tracer", "name", "args", "span", "previous")
+
+    def __init__(self, tracer: Tracer, name: str, args: dict):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+
+    def __enter__(self) -> Span:
+        self.previous = getattr(_local, "span", None)
+        self.span = Span(self.name, self.previous, self.args)
+        _local.span = self.span
+        self.span.start = time.perf_counter()
+        self.span._cpu_start = time.thread_time()
+        return self.span
+
+    def __exit__(self, *exc_info) -> None:
+        span = self.span
+        span.wall = time.perf_counter() - span.start
+        cpu = time.thread_time() - span._cpu_start
+        _local.span = self.previous
+        with self.tracer.lock:
+            span.cpu += cpu
+            self.tracer.spans.append(span)
+
+
+class _NoSpan:
+    """Context manager used while tracing is off."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+
+_NO_SPAN = _NoSpan()
+
+
+def start_tracing() -> Tracer:
+    """Start recording spans (replacing any active trace)."""
+    global _tracer
+    _tracer = Tracer()
+    return _tracer
+
+
+def stop_tracing() -> Optional[Tracer]:
+    """Stop recording and return the trace (None if none was active)."""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    if tracer is not None:
+        tracer.wall = time.perf_counter() - tracer.origin
+        tracer.cpu = time.process_time() - tracer.cpu_origin
+    return tracer
+
+
+def tracing() -> bool:
+    """Check whether a trace is being recorded."""
+    return _tracer is not None
+
+
+def span(name: str, **args):
+    """
+    Time a block as a subphase of the current span.
+
+    Args:
+        name: Phase name (the span's path joins it to its parents' names)
+        args: Details recorded with the span (e.g. skill="my-skill")
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NO_SPAN
+    return _SpanContext(tracer, name, args)
+
+
+def bind(function: Callable) -> Callable:
+    """
+    Attribute the work of function to the current span when it runs on
+    another thread (e.g. executor.map(bind(hash_entry), paths)).
+    """
+    tracer = _tracer
+    if tracer is None:
+        return function
+    owner = getattr(_local, "span", None)
+
+    def traced(*args, **kwargs):
+        previous = getattr(_local, "span", None)
+        _local.span = owner
+        start = time.thread_time()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _local.span = previous
+            if previous is not owner:  # Pool thread: count its CPU time too
+                tracer.add(owner, 0, "", time.thread_time() - start)
+
+    return traced
+
+
+def record_read(path, nbytes: Optional[int] = None) -> None:
+    """
+    Count a file read in the current span.
+
+    Args:
+        path: File read
+        nbytes: Bytes read (default: the file's size, for whole-file reads)
+    """
+    tracer = _tracer
+    if tracer is None:
+        return
+    path = os.fspath(path)
+    if nbytes is None:
+        try:
+            nbytes = os.stat(path).st_size
+        except OSError:
+            nbytes = 0
+    tracer.add(getattr(_local, "span", None), nbytes, path, 0.0)
+
+
+def write_trace(data: dict, path: str) -> None:
+    """Write a trace as JSON to path ("-" for stderr)."""
+    text = json.dumps(data, indent=2)
+    if path == "-":
+        print(text, file=sys.stderr)
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+
+
+def add_trace_arguments(parser) -> None:
+    """Add --profile and --chrome-trace to an argparse parser."""
+    group = parser.add_argument_group("profiling")
+    group.add_argument(
+        "--profile",
+        metavar="FILE",
+        default=os.environ.get(TRACE_ENV) or None,
+        help="Write a JSON trace of per-phase wall/CPU time, bytes read and "
+        f"files touched to FILE, '-' for stderr (default: ${TRACE_ENV})",
+    )
+    group.add_argument(
+        "--chrome-trace",
+        metavar="FILE",
+        help="Also write a Chrome trace-event file (chrome://tracing, Perfetto)",
+    )
+
+
+def start_from_args(args) -> bool:
+    """Start tracing if the parsed arguments ask for a trace."""
+    if args.profile or args.chrome_trace:
+        start_tracing()
+        return True
+    return False
+
+
+def finish_from_args(args, tool: str) -> None:
+    """Stop tracing and write the traces the parsed arguments ask for."""
+    tracer = stop_tracing()
+    if tracer is None:
+        return
+    if args.profile:
+        write_trace(tracer.to_dict(tool), args.profile)
+    if args.chrome_trace:
+        write_trace(tracer.to_chrome(), args.chrome_trace)
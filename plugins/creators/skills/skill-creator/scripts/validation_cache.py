@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# /// script
+# dependencies = []
+# ///
+"""
+Persistent cache for quick_validate.py check results.
+
+Entries are keyed on content hashes, so a check re-runs only when one of its
+inputs changed:
+
+    file:<path>          stat fingerprint -> content digest (skips re-hashing
+                         files whose mtime and size are unchanged)
+    document:<digest>    SKILL.md checks that depend on its content alone
+    links:<dir>:<digest> link check result plus the mtimes of the directories
+                         holding each target (adding, removing or renaming a
+                         file updates its directory's mtime) and of the
+                         Markdown files checked for #anchors
+    python:<v>:<digest>  compile check result of one Python script under
+                         Python version v (e.g. 3.12 accepts f-strings that
+                         3.11 rejects)
+    shell:<digest>       `bash -n` result of one shell script
+
+The cache lives in ~/.claude/skills/.state/validation-cache.json and is
+saved atomically, merging with entries written concurrently by other
+processes. The file records a fingerprint of the validation code; a cache
+written by different code, or a corrupt file, is ignored.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from tracing import record_read
+
+CACHE_PATH = Path.home() / ".claude" / "skills" / ".state" / "validation-cache.json"
+CACHE_VERSION = "1.0"
+MAX_ENTRIES = 50000
+
+
+def source_fingerprint(paths: List[Path]) -> str:
+    """Return a digest of the given source files (the checks' code version)."""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(path.name.encode())
+        data = path.read_bytes()
+        record_read(path, len(data))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def file_sha256(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file's bytes."""
+    data = path.read_bytes()
+    record_read(path, len(data))
+    return hashlib.sha256(data).hexdigest()
+
+
+def load_cache_entries(path: Path, fingerprint: str) -> dict:
+    """Load cache entries (graceful fallback on corruption or code change)."""
+    try:
+        cache = json.loads(path.read_text())
+        record_read(path)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+    if (
+        not isinstance(cache, dict)
+        or cache.get("version") != CACHE_VERSION
+        or cache.get("fingerprint") != fingerprint
+    ):
+        return {}
+    entries = cache.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+class ValidationCache:
+    """Content-addressed store of validation check results."""
+
+    def __init__(self, path: Optional[Path] = CACHE_PATH, fingerprint: str = ""):
+        """
+        Args:
+            path: Cache file (None for an in-memory cache)
+            fingerprint: Version of the code producing the results
+        """
+        self.path = path
+        self.fingerprint = fingerprint
+        self.entries: Dict[str, dict] = (
+            load_cache_entries(path, fingerprint) if path else {}
+        )
+        self.added: Dict[str, dict] = {}
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the entry stored under key, if any."""
+        return self.entries.get(key)
+
+    def put(self, key: str, value: dict) -> None:
+        """Store an entry (persisted on save())."""
+        self.entries[key] = value
+        self.added[key] = value
+
+    def file_digest(self, path: Path, compute: Callable[[Path], str]) -> str:
+        """
+        Return the content digest of a file, recomputing it only when the
+        file's mtime or size changed.
+
+        Args:
+            path: File to fingerprint
+            compute: Returns the digest of the file's current content
+        """
+        key = "file:" + os.path.realpath(path)
+        stat = os.stat(path)
+        entry = self.get(key)
+        if (
+            entry
+            and entry.get("mtime_ns") == stat.st_mtime_ns
+            and entry.get("size") == stat.st_size
+        ):
+            return entry["digest"]
+
+        digest = compute(path)
+        self.put(
+            key,
+            {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "digest": digest},
+        )
+        return digest
+
+    def save(self) -> None:
+        """
+        Merge new entries into the cache file and write it atomically.
+
+        An unwritable state directory (read-only HOME, CI) is not an error:
+        the entries stay in memory and the file is left as it was.
+        """
+        if not self.path or not self.added:
+            return
+
+        entries = load_cache_entries(self.path, self.fingerprint)
+        for key, value in self.added.items():
+            entries.pop(key, None)  # Re-insert so recent entries are kept
+            entries[key] = value
+        # Drop the oldest entries once the cache grows past its bound
+        for key in list(entries)[: max(0, len(entries) - MAX_ENTRIES)]:
+            del entries[key]
+
+        cache = {
+            "version": CACHE_VERSION,
+            "fingerprint": self.fingerprint,
+            "updated_at": datetime.now().isoformat(),
+            "entries": entries,
+        }
+        # Write to a per-process temp file first (atomic save)
+        temp_path = self.path.with_suffix(f".json.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path.write_text(json.dumps(cache))
+            temp_path.replace(self.path)
+        except OSError:
+            try:
+                temp_path.unlink()
+            except OSError:
+                pass
+            return
+        self.added.clear()
+
+
+def directory_state(directories: Iterable[str]) -> Dict[str, Optional[int]]:
+    """Return the mtime of each directory or file (None if it does not exist)."""
+    state = {}
+    for directory in sorted(set(directories)):
+        try:
+            state[directory] = os.stat(directory).st_mtime_ns
+        except OSError:
+            state[directory] = None
+    return state
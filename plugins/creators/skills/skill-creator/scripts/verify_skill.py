@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+# Recommended: use ./run.sh to execute this script for proper dependency management
+# /// script
+# dependencies = ["pyyaml"]
+# ///
+"""
+Verify .skill archives without extracting them.
+
+Each archive is read once: every member is hashed and compared with the
+embedded manifest (see skill_archive.py) while it streams in, and kept in
+memory. validate_skill() and calculate_evolution_score() then run on the
+members through an in-memory tree, so nothing is written to disk.
+
+Check results are cached by content hash in the validation cache shared
+with quick_validate.py, so scripts and references that many archives (or
+an already validated source tree) have in common are checked once. Many
+archives are verified in a process pool, one result per archive, in
+completion order.
+
+Usage:
+    python scripts/verify_skill.py <archive.skill|directory>... [--json]
+        [--jobs N] [--strict] [--verbose] [--deep] [--shell]
+        [--max-skill-tokens N] [--max-reference-tokens N] [--max-total-tokens N]
+        [--budget-fail] [--no-cache]
+
+Directories are searched recursively for *.skill files. With --json, one
+JSON object per archive is streamed to stdout (JSON Lines).
+
+Exit codes: 0 if every archive verified, 10 if any failed, 3 if no archive
+was found, 2 on invalid arguments.
+"""
+
+import sys
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+from enum import IntEnum
+
+from context_cost import add_budget_arguments, budget_from_args
+from quick_validate import ValidationResult, open_cache, validate_skill
+from score_evolution import calculate_evolution_score
+from skill_archive import read_archive
+from validation_cache import ValidationCache
+
+# Below this many archives a worker pool costs more than it saves
+PARALLEL_MIN_ARCHIVES = 8
+
+
+class ExitCode(IntEnum):
+    SUCCESS = 0
+    GENERAL_ERROR = 1
+    INVALID_ARGUMENTS = 2
+    FILE_NOT_FOUND = 3
+    VALIDATION_FAILED = 10
+
+
+def discover_archives(paths: List[Path]) -> List[str]:
+    """Return the given archives and every *.skill file below directories."""
+    archives = []
+    for path in paths:
+        if path.is_dir():
+            archives.extend(str(p) for p in sorted(path.rglob("*.skill")))
+        else:
+            archives.append(str(path))
+    return archives
+
+
+def verify_archive(
+    path: str,
+    verbose: bool = False,
+    strict: bool = False,
+    cache: Optional[ValidationCache] = None,
+    **options,
+) -> dict:
+    """
+    Verify one archive: manifest hashes, validation and evolution score.
+
+    Args:
+        cache: Result cache (content-addressed entries only)
+        options: Passed on to validate_skill() (shell, deep, budget,
+            budget_fail)
+
+    Returns:
+        {path, skill, files, digest, errors} (manifest and archive errors),
+        `validation` (ValidationResult.to_dict()), `evolution_score`
+        (EvolutionScore.to_dict(), None without a readable SKILL.md), `ok`
+        and `elapsed_ms`
+    """
+    start = time.perf_counter()
+    contents = read_archive(Path(path))
+    report = contents.to_dict()
+
+    result = ValidationResult()
+    score = None
+    if contents.skill:
+        tree = contents.tree()
+        try:
+            result = validate_skill(
+                contents.skill, verbose=verbose, cache=cache, tree=tree, **options
+            )
+            if tree.is_file("SKILL.md"):
+                score = calculate_evolution_score(tree.document("SKILL.md").content)
+        except UnicodeDecodeError as e:
+            result.check("read", False, str(e))
+
+    ok = (
+        not contents.errors
+        and contents.skill != ""
+        and result.is_valid
+        and not (strict and result.warnings)
+    )
+    report["validation"] = result.to_dict()
+    report["evolution_score"] = score.to_dict() if score else None
+    report["ok"] = ok
+    report["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 3)
+    return report
+
+
+# Per-process cache of pool workers (opened on first use)
+_worker_cache: Optional[ValidationCache] = None
+
+
+def verify_archives(
+    paths: List[str], verbose: bool, strict: bool, use_cache: bool, options: dict
+) -> Tuple[List[dict], dict]:
+    """
+    Verify a chunk of archives (one worker task).
+
+    Returns:
+        (reports, cache entries added by this chunk) - the parent process
+        merges the entries and saves the cache once
+    """
+    global _worker_cache
+    if use_cache and _worker_cache is None:
+        _worker_cache = open_cache()
+    cache = _worker_cache if use_cache else None
+
+    reports = [
+        verify_archive(path, verbose, strict, cache, **options) for path in paths
+    ]
+    added = {}
+    if cache is not None:
+        added, cache.added = cache.added, {}
+    return reports, added
+
+
+def verify_all(
+    paths: List[str],
+    jobs: Optional[int] = 0,
+    verbose: bool = False,
+    strict: bool = False,
+    cache: Optional[ValidationCache] = None,
+    options: Optional[dict] = None,
+) -> Iterator[dict]:
+    """
+    Verify archives, in parallel when worthwhile.
+
+    Args:
+        paths: Archive paths
+        jobs: Worker processes (None or 0 for one per CPU, 1 for serial)
+        verbose: Include improvement suggestions
+        strict: Treat validation warnings as failures
+        cache: Result cache; entries computed by workers are merged into it
+        options: Passed on to validate_skill()
+
+    Yields:
+        verify_archive() results in completion order
+    """
+    options = options or {}
+    jobs = jobs or os.cpu_count() or 1
+    jobs = min(jobs, len(paths) // PARALLEL_MIN_ARCHIVES)
+    pending = set(paths)
+    if jobs > 1:
+        chunksize = max(1, min(16, len(paths) // (jobs * 4)))
+        chunks = [paths[i : i + chunksize] for i in range(0, len(paths), chunksize)]
+        use_cache = cache is not None
+        try:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                futures = [
+                    executor.submit(
+                        verify_archives, chunk, verbose, strict, use_cache, options
+                    )
+                    for chunk in chunks
+                ]
+                for future in as_completed(futures):
+                    reports, added = future.result()
+                    for key, value in added.items():
+                        cache.put(key, value)
+                    for report in reports:
+                        pending.discard(report["path"])
+                        yield report
+        except (OSError, BrokenProcessPool):
+            pass  # Finish serially (e.g. no multiprocessing support)
+
+    for path in paths:
+        if path in pending:
+            yield verify_archive(path, verbose, strict, cache, **options)
+
+
+def format_report(report: dict) -> str:
+    """Human-readable report of one archive."""
+    status = "✅" if report["ok"] else "❌"
+    lines = [f"{status} {report['path']}"]
+    if report["skill"]:
+        digest = report["digest"] or "none"
+        lines.append(
+            f"   Skill: {report['skill']} ({report['files']} files, "
+            f"digest {digest[:16]})"
+        )
+    if not report["errors"]:
+        lines.append("   Manifest: all files match")
+    for error in report["errors"]:
+        lines.append(f"   [FAIL] manifest: {error}")
+
+    validation = report["validation"]
+    if report["skill"]:
+        lines.append(f"   Validation: {validation['summary']}")
+    for message in validation["errors"] + validation["warnings"]:
+        lines.append(f"   {message}")
+    score = report["evolution_score"]
+    if score:
+        lines.append(f"   Evolution score: {score['score']}/{score['max_score']}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Verify .skill archives without extracting them"
+    )
+    parser.add_argument(
+        "paths", nargs="+", type=Path, help=".skill files or directories to search"
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Stream one JSON object per archive"
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=0,
+        help="Worker processes (default: one per CPU)",
+    )
+    parser.add_argument(
+        "--strict", action="store_true", help="Treat validation warnings as errors"
+    )
+    parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
+    parser.add_argument(
+        "--shell",
+        action="store_true",
+        help="Also check shell scripts under scripts/ with `bash -n`",
+    )
+    parser.add_argument(
+        "--deep",
+        action="store_true",
+        help="Also check every Markdown file (links, versions, size)",
+    )
+    add_budget_arguments(parser)
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-run every check instead of reusing cached results",
+    )
+
+    args = parser.parse_args()
+
+    if args.jobs < 0:
+        print("Error: --jobs must be 0 or more", file=sys.stderr)
+        sys.exit(ExitCode.INVALID_ARGUMENTS)
+
+    missing = [str(path) for path in args.paths if not path.exists()]
+    if missing:
+        print(f"Error: Path not found: {', '.join(missing)}", file=sys.stderr)
+        sys.exit(ExitCode.FILE_NOT_FOUND)
+
+    archives = discover_archives(args.paths)
+    if not archives:
+        print("Error: No .skill archives found", file=sys.stderr)
+        sys.exit(ExitCode.FILE_NOT_FOUND)
+
+    options = {
+        "shell": args.shell,
+        "deep": args.deep,
+        "budget": budget_from_args(args),
+        "budget_fail": args.budget_fail,
+    }
+    start = time.perf_counter()
+    cache = None if args.no_cache else open_cache()
+    failed = 0
+    reports = verify_all(archives, args.jobs, args.verbose, args.strict, cache, options)
+    for report in reports:
+        failed += not report["ok"]
+        if args.json:
+            print(json.dumps(report), flush=True)
+        else:
+            print(format_report(report), flush=True)
+    if cache is not None:
+        cache.save()
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"Verified {len(archives)} archives in {elapsed:.2f}s: "
+        f"{len(archives) - failed} passed, {failed} failed",
+        file=sys.stderr,
+    )
+    sys.exit(ExitCode.VALIDATION_FAILED if failed else ExitCode.SUCCESS)
+
+
+if __name__ == "__main__":
+    main()